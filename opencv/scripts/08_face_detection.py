@@ -19,6 +19,22 @@ import os
 import urllib.request
 import time
 
+# Yüz, göz ve gülümseme tespit fonksiyonları
+from face_core import detect_faces, detect_faces_sweep
+import face_cascades
+import face_features
+import face_multiview
+import face_pipeline
+import face_tracking
+
+# Gerçek zamanlı tespit modu:
+# - "pipeline": yakalama, tespit ve gösterim ayrı iş parçacıklarında (face_pipeline.py)
+# - "tracking": tam tespit her TRACKING_DETECT_EVERY karede bir, arada şablon eşleme ile takip (face_tracking.py)
+# - "serial": tüm aşamalar tek döngüde, her karede sırayla
+LIVE_MODE = "pipeline"
+PIPELINE_WORKERS = 2
+TRACKING_DETECT_EVERY = 10
+
 def display_images(images, titles, filename=None, cmap=None):
     """Birden fazla görüntüyü yan yana gösterir ve kaydeder."""
     n = len(images)
@@ -45,35 +61,6 @@ def display_images(images, titles, filename=None, cmap=None):
     
     plt.show()
 
-def download_cascade_files():
-    """Haar Cascade XML dosyalarını indirir."""
-    cascade_dir = "../cascades"
-    os.makedirs(cascade_dir, exist_ok=True)
-    
-    # İndirilecek Haar Cascade dosyaları
-    cascade_files = {
-        "haarcascade_frontalface_default.xml": "https://raw.githubusercontent.com/opencv/opencv/master/data/haarcascades/haarcascade_frontalface_default.xml",
-        "haarcascade_eye.xml": "https://raw.githubusercontent.com/opencv/opencv/master/data/haarcascades/haarcascade_eye.xml",
-        "haarcascade_smile.xml": "https://raw.githubusercontent.com/opencv/opencv/master/data/haarcascades/haarcascade_smile.xml",
-        "haarcascade_frontalface_alt.xml": "https://raw.githubusercontent.com/opencv/opencv/master/data/haarcascades/haarcascade_frontalface_alt.xml",
-        "haarcascade_profileface.xml": "https://raw.githubusercontent.com/opencv/opencv/master/data/haarcascades/haarcascade_profileface.xml"
-    }
-    
-    for filename, url in cascade_files.items():
-        file_path = os.path.join(cascade_dir, filename)
-        
-        if not os.path.exists(file_path):
-            print(f"İndiriliyor: {filename}")
-            try:
-                urllib.request.urlretrieve(url, file_path)
-                print(f"İndirildi: {file_path}")
-            except Exception as e:
-                print(f"Hata: {filename} indirilemedi - {e}")
-        else:
-            print(f"Zaten mevcut: {file_path}")
-    
-    return cascade_dir
-
 def download_test_image():
     """Test için örnek bir yüz görüntüsü indirir."""
     image_dir = "../images"
@@ -99,58 +86,24 @@ def download_test_image():
     
     return face_image_path, group_image_path
 
-def detect_faces(image, face_cascade):
-    """Görüntüdeki yüzleri tespit eder."""
-    # Gri tonlamaya dönüştür
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    
-    # Yüzleri tespit et
-    faces = face_cascade.detectMultiScale(
-        gray,
-        scaleFactor=1.1,
-        minNeighbors=5,
-        minSize=(30, 30),
-        flags=cv2.CASCADE_SCALE_IMAGE
-    )
-    
-    return faces, gray
-
-def detect_eyes(gray, face_roi, eye_cascade):
-    """Yüz bölgesindeki gözleri tespit eder."""
-    eyes = eye_cascade.detectMultiScale(
-        face_roi,
-        scaleFactor=1.1,
-        minNeighbors=5,
-        minSize=(20, 20),
-        flags=cv2.CASCADE_SCALE_IMAGE
-    )
-    
-    return eyes
-
-def detect_smile(gray, face_roi, smile_cascade):
-    """Yüz bölgesindeki gülümsemeleri tespit eder."""
-    smiles = smile_cascade.detectMultiScale(
-        face_roi,
-        scaleFactor=1.8,
-        minNeighbors=20,
-        minSize=(25, 25),
-        flags=cv2.CASCADE_SCALE_IMAGE
-    )
-    
-    return smiles
-
 def main():
     print("OpenCV Yüz Tespiti")
     print("-" * 20)
     
-    # Haar Cascade dosyalarını indir
-    cascade_dir = download_cascade_files()
+    # Cascade sınıflandırıcılarını yükle (önce ../cascades, yoksa OpenCV ile gelen dosyalar; indirme yapılmaz)
+    cascade_dir = face_cascades.CASCADE_DIR
+    
+    try:
+        face_cascade = face_cascades.get("face", cascade_dir)
+        # Göz, gülümseme ve profil cascade'leri face_features ve face_multiview tarafından
+        # kullanılır; burada önceden yüklenerek eksik dosya hemen bildirilir
+        face_cascades.get_many(("eye", "smile", "profile"), cascade_dir)
+    except RuntimeError as e:
+        print(f"Hata: {e}")
+        return
     
-    # Cascade sınıflandırıcılarını yükle
-    face_cascade = cv2.CascadeClassifier(os.path.join(cascade_dir, 'haarcascade_frontalface_default.xml'))
-    eye_cascade = cv2.CascadeClassifier(os.path.join(cascade_dir, 'haarcascade_eye.xml'))
-    smile_cascade = cv2.CascadeClassifier(os.path.join(cascade_dir, 'haarcascade_smile.xml'))
-    profile_cascade = cv2.CascadeClassifier(os.path.join(cascade_dir, 'haarcascade_profileface.xml'))
+    for name in ("face", "eye", "smile", "profile"):
+        print(f"Cascade: {face_cascades.resolve(name, cascade_dir)}")
     
     # Test görüntülerini indir
     face_image_path, group_image_path = download_test_image()
@@ -190,25 +143,12 @@ def main():
     # Yüz, göz ve gülümseme tespiti
     eye_smile_img = img.copy()
     
-    for (x, y, w, h) in faces:
-        # Yüzü işaretle
-        cv2.rectangle(eye_smile_img, (x, y), (x+w, y+h), (0, 255, 0), 2)
-        
-        # Yüz bölgesini al
-        roi_gray = gray[y:y+h, x:x+w]
-        roi_color = eye_smile_img[y:y+h, x:x+w]
-        
-        # Gözleri tespit et
-        eyes = detect_eyes(gray, roi_gray, eye_cascade)
-        
-        for (ex, ey, ew, eh) in eyes:
-            cv2.rectangle(roi_color, (ex, ey), (ex+ew, ey+eh), (255, 0, 0), 2)
-        
-        # Gülümsemeleri tespit et
-        smiles = detect_smile(gray, roi_gray, smile_cascade)
-        
-        for (sx, sy, sw, sh) in smiles:
-            cv2.rectangle(roi_color, (sx, sy), (sx+sw, sy+sh), (0, 0, 255), 2)
+    # Gözler yüzün üst kısmında, gülümsemeler alt kısmında aranır; göz bulunamayan
+    # yüzde gülümseme aranmaz ve birden fazla yüz eşzamanlı işlenir
+    features = face_features.detect_features(gray, faces, cascade_dir=cascade_dir)
+    
+    # Yüz (yeşil), göz (mavi) ve gülümsemeleri (kırmızı) işaretle
+    face_pipeline.draw_results(eye_smile_img, features)
     
     # Sonuçları göster
     display_images(
@@ -232,6 +172,13 @@ def main():
         
         print(f"Grup fotoğrafında tespit edilen yüz sayısı: {len(group_faces)}")
         
+        # Küçültülmüş kopyada tespit: büyük fotoğraflarda hız / küçük yüzleri bulma dengesi
+        for max_side, refine in ((400, False), (400, True)):
+            start_time = time.time()
+            proxy_faces, _ = detect_faces(group_img, face_cascade, max_side=max_side, refine=refine)
+            print(f"max_side={max_side}, refine={refine}: {len(proxy_faces)} yüz, "
+                  f"{(time.time() - start_time) * 1000:.1f} ms")
+        
         # Yüzleri işaretle
         group_detection_img = group_img.copy()
         
@@ -256,20 +203,18 @@ def main():
     scale_1_2_img = group_img.copy()
     scale_1_3_img = group_img.copy()
     
-    # scaleFactor = 1.1
-    faces_1_1 = face_cascade.detectMultiScale(
-        group_gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
-    )
+    # Tüm kombinasyonlar tek çağrıda: piramit her scaleFactor için bir kez taranır,
+    # minNeighbors değerleri yalnızca ham adayların gruplanmasında uygulanır
+    sweep = detect_faces_sweep(group_gray, face_cascade,
+                               scale_factors=(1.1, 1.2, 1.3), min_neighbors=(3, 5, 7))
     
-    # scaleFactor = 1.2
-    faces_1_2 = face_cascade.detectMultiScale(
-        group_gray, scaleFactor=1.2, minNeighbors=5, minSize=(30, 30)
-    )
+    for (scale_factor, neighbors), result in sweep.items():
+        print(f"scaleFactor={scale_factor}, minNeighbors={neighbors}: {len(result['faces'])} yüz "
+              f"(tarama {result['scan_ms']:.1f} ms, gruplama {result['group_ms']:.2f} ms)")
     
-    # scaleFactor = 1.3
-    faces_1_3 = face_cascade.detectMultiScale(
-        group_gray, scaleFactor=1.3, minNeighbors=5, minSize=(30, 30)
-    )
+    faces_1_1 = sweep[(1.1, 5)]["faces"]
+    faces_1_2 = sweep[(1.2, 5)]["faces"]
+    faces_1_3 = sweep[(1.3, 5)]["faces"]
     
     # Yüzleri işaretle
     for (x, y, w, h) in faces_1_1:
@@ -296,20 +241,10 @@ def main():
     neighbors_5_img = group_img.copy()
     neighbors_7_img = group_img.copy()
     
-    # minNeighbors = 3
-    faces_n3 = face_cascade.detectMultiScale(
-        group_gray, scaleFactor=1.1, minNeighbors=3, minSize=(30, 30)
-    )
-    
-    # minNeighbors = 5
-    faces_n5 = face_cascade.detectMultiScale(
-        group_gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
-    )
-    
-    # minNeighbors = 7
-    faces_n7 = face_cascade.detectMultiScale(
-        group_gray, scaleFactor=1.1, minNeighbors=7, minSize=(30, 30)
-    )
+    # minNeighbors sonuçları yukarıdaki taramadan (scaleFactor=1.1) alınır; yeniden tarama yapılmaz
+    faces_n3 = sweep[(1.1, 3)]["faces"]
+    faces_n5 = sweep[(1.1, 5)]["faces"]
+    faces_n7 = sweep[(1.1, 7)]["faces"]
     
     # Yüzleri işaretle
     for (x, y, w, h) in faces_n3:
@@ -334,33 +269,31 @@ def main():
     # 5. Profil Yüz Tespiti
     print("\n5. Profil Yüz Tespiti")
     
-    # Profil yüzleri tespit et
-    profile_faces = profile_cascade.detectMultiScale(
-        group_gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
-    )
+    # Ön yüz, profil ve çevrilmiş görüntüde profil (diğer yöne dönmüş yüzler) eşzamanlı
+    # tespit edilir ve örtüşen kutular NMS ile tek kümede birleştirilir
+    multiview = face_multiview.detect_multiview(group_gray, cascade_dir=cascade_dir)
+    profile_faces = np.concatenate([multiview["raw"]["profile"], multiview["raw"]["profile_flipped"]])
     
     print(f"Tespit edilen profil yüz sayısı: {len(profile_faces)}")
+    print(f"Birleştirilmiş yüz sayısı: {len(multiview['boxes'])}")
+    for view, elapsed in multiview["timings"].items():
+        print(f"  {view}: {elapsed:.1f} ms")
     
-    # Profil yüzleri işaretle
+    # Profil yüzleri işaretle (her iki yön)
     profile_img = group_img.copy()
     
     for (x, y, w, h) in profile_faces:
         cv2.rectangle(profile_img, (x, y), (x+w, y+h), (255, 0, 0), 2)
     
-    # Hem ön hem profil yüzleri işaretle
-    combined_img = group_img.copy()
-    
-    for (x, y, w, h) in group_faces:
-        cv2.rectangle(combined_img, (x, y), (x+w, y+h), (0, 255, 0), 2)
-    
-    for (x, y, w, h) in profile_faces:
-        cv2.rectangle(combined_img, (x, y), (x+w, y+h), (255, 0, 0), 2)
+    # Birleştirilmiş yüzleri görünüme göre renklendirerek işaretle
+    # (yeşil: ön, mavi: profil, mor: diğer yöne dönmüş profil)
+    combined_img = face_multiview.draw_multiview(group_img.copy(), multiview)
     
     # Sonuçları göster
     display_images(
         [group_img, profile_img, combined_img],
         ["Orijinal", f"Profil Yüz Tespiti ({len(profile_faces)} yüz)", 
-         "Ön ve Profil Yüz Tespiti"],
+         f"Ön ve Profil Yüz Tespiti ({len(multiview['boxes'])} yüz)"],
         "../images/profile_face_detection.png",
         cmap=None
     )
@@ -369,6 +302,28 @@ def main():
     print("\n6. Gerçek Zamanlı Yüz Tespiti")
     print("Kamera açılıyor... (Çıkmak için 'q' tuşuna basın)")
     
+    if LIVE_MODE == "pipeline":
+        # Tespit geride kalırsa kareler atılır; yakalama ve gösterim kamera hızında kalır
+        try:
+            stats = face_pipeline.run_live(0, workers=PIPELINE_WORKERS, cascade_dir=cascade_dir)
+            face_pipeline.print_stats(stats)
+        except RuntimeError as e:
+            print(f"Hata: {e}")
+        
+        print("\nYüz tespiti işlemleri tamamlandı!")
+        return
+    
+    if LIVE_MODE == "tracking":
+        # Cascade yalnızca aralıklı olarak (veya takip kaybolunca) tüm kareyi tarar
+        try:
+            stats = face_tracking.run_tracking(0, detect_every=TRACKING_DETECT_EVERY, cascade_dir=cascade_dir)
+            print(f"{stats['frames']} kare, {stats['detections']} tam tespit, {stats['lost']} takip kaybı")
+        except RuntimeError as e:
+            print(f"Hata: {e}")
+        
+        print("\nYüz tespiti işlemleri tamamlandı!")
+        return
+    
     # Kamera bağlantısını aç
     cap = cv2.VideoCapture(0)
     
@@ -400,25 +355,9 @@ def main():
             # Yüzleri tespit et
             faces, gray = detect_faces(frame, face_cascade)
             
-            # Yüzleri işaretle
-            for (x, y, w, h) in faces:
-                cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
-                
-                # Yüz bölgesini al
-                roi_gray = gray[y:y+h, x:x+w]
-                roi_color = frame[y:y+h, x:x+w]
-                
-                # Gözleri tespit et
-                eyes = detect_eyes(gray, roi_gray, eye_cascade)
-                
-                for (ex, ey, ew, eh) in eyes:
-                    cv2.rectangle(roi_color, (ex, ey), (ex+ew, ey+eh), (255, 0, 0), 2)
-                
-                # Gülümsemeleri tespit et
-                smiles = detect_smile(gray, roi_gray, smile_cascade)
-                
-                for (sx, sy, sw, sh) in smiles:
-                    cv2.rectangle(roi_color, (sx, sy), (sx+sw, sy+sh), (0, 0, 255), 2)
+            # Göz ve gülümsemeleri yüzlerin ilgili alt bölgelerinde tespit et ve işaretle
+            features = face_features.detect_features(gray, faces, cascade_dir=cascade_dir)
+            face_pipeline.draw_results(frame, features)
             
             # FPS ve tespit bilgilerini ekle
             cv2.putText(frame, f"FPS: {fps}", (10, 30), 
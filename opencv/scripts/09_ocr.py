@@ -15,19 +15,27 @@ import cv2
 import numpy as np
 import matplotlib.pyplot as plt
 import os
-import sys
+import json
 import pytesseract
-from PIL import Image, ImageTk
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinter.scrolledtext import ScrolledText
-import threading
-import time
 
-# Tesseract yolunu ayarla (Windows için)
-if sys.platform.startswith('win'):
-    # Windows'ta Tesseract'ın kurulu olduğu yolu belirtin
-    pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+# Ön işleme ve OCR fonksiyonları (Tesseract yolu da burada ayarlanır)
+import ocr_auto
+import ocr_cache
+import ocr_core
+import ocr_display
+import ocr_jobs
+import ocr_layout
+import ocr_pages
+import ocr_pipeline
+import ocr_preview
+import ocr_worker
+from ocr_result import OCRResult
+
+# Bu değerin altındaki güvenle tanınan kelimeler sonuç görüntüsünde işaretlenir
+LOW_CONFIDENCE = 60
 
 class OCRApp:
     def __init__(self, root):
@@ -69,10 +77,7 @@ class OCRApp:
         
         self.preprocess_var = tk.StringVar(value="basic")
         self.preprocess_combo = ttk.Combobox(self.control_frame, textvariable=self.preprocess_var)
-        self.preprocess_combo['values'] = (
-            "basic", "gray", "threshold", "adaptive_threshold", "otsu", 
-            "gaussian_blur", "bilateral_filter", "dilation", "erosion", "opening", "closing"
-        )
+        self.preprocess_combo['values'] = ocr_core.PREPROCESS_METHODS + (ocr_auto.AUTO_METHOD,)
         self.preprocess_combo.grid(row=0, column=2, padx=5, pady=5, sticky="w")
         self.preprocess_combo.bind("<<ComboboxSelected>>", self.update_preview)
         
@@ -82,7 +87,7 @@ class OCRApp:
         
         self.lang_var = tk.StringVar(value="eng")
         self.lang_combo = ttk.Combobox(self.control_frame, textvariable=self.lang_var, width=5)
-        self.lang_combo['values'] = ("eng", "tur", "eng+tur")
+        self.lang_combo['values'] = ocr_core.LANGUAGES
         self.lang_combo.grid(row=0, column=4, padx=5, pady=5, sticky="w")
         
         # OCR butonu
@@ -94,6 +99,16 @@ class OCRApp:
         self.progress = ttk.Progressbar(self.control_frame, orient=tk.HORIZONTAL, length=100, mode='indeterminate')
         self.progress.grid(row=0, column=6, padx=5, pady=5, sticky="w")
         
+        # Bölge tespiti (metin bölgelerini bulup ayrı ayrı ve paralel tanı)
+        self.layout_var = tk.BooleanVar(value=False)
+        self.layout_check = ttk.Checkbutton(self.control_frame, text="Bölge Tespiti", variable=self.layout_var)
+        self.layout_check.grid(row=0, column=7, padx=5, pady=5, sticky="w")
+        
+        # Bekleyen ve çalışan OCR işlerini iptal et
+        self.cancel_button = ttk.Button(self.control_frame, text="İptal", command=self.cancel_ocr)
+        self.cancel_button.grid(row=0, column=8, padx=5, pady=5, sticky="w")
+        self.cancel_button.configure(state="disabled")
+        
         # Ön işleme parametreleri çerçevesi
         self.params_frame = ttk.LabelFrame(self.left_panel, text="Ön İşleme Parametreleri")
         self.params_frame.pack(fill=tk.X)
@@ -158,9 +173,33 @@ class OCRApp:
         
         # Değişkenler
         self.original_image = None
-        self.processed_image = None
-        self.tk_image = None
-        self.tk_processed = None
+        self.preview_processed = None  # Küçültülmüş vekil görüntüde hesaplanan önizleme
+        
+        # Kalıcı Tesseract işçisi (dil verisi her OCR'da yeniden yüklenmez)
+        self.ocr_pool = None
+        if ocr_worker.HAS_PERSISTENT_ENGINE:
+            self.ocr_pool = ocr_worker.OCRWorkerPool(workers=1, preload=ocr_core.LANGUAGES)
+        
+        # Tam çözünürlüklü ön işleme aşamalarının önbelleği
+        self.stage_cache = ocr_pipeline.StageCache()
+        
+        # OCR sonuç önbelleği (aynı görüntü + ayarlar için Tesseract tekrar çalışmaz)
+        self.ocr_cache = ocr_cache.OCRCache()
+        
+        # OCR iş kuyruğu (tek işçi; sonuçlar Tk olay döngüsünde sırayla teslim edilir)
+        self.jobs = ocr_jobs.JobManager(root, workers=1, max_queued=2)
+        
+        # Gösterime hazır (küçültülmüş, RGB) görüntülerin önbelleği
+        self.display_cache = ocr_display.DisplayCache()
+        
+        # Otomatik ön işleme seçimi (görüntü başına bir kez yapılır, önizleme ve OCR paylaşır)
+        self.auto_selector = ocr_auto.AutoSelector()
+        
+        # Önizleme motoru (kaydırıcı olaylarını birleştirir, küçük görüntüde arka planda hesaplar)
+        self.preview_engine = ocr_preview.PreviewEngine(
+            root, self.get_preprocess_params, self.show_preview, stages_fn=self.preview_stages
+        )
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Örnek görüntü yükle
         self.load_sample_image()
@@ -199,7 +238,7 @@ class OCRApp:
         file_path = filedialog.askopenfilename(
             title="Görüntü Seç",
             filetypes=[
-                ("Görüntü Dosyaları", "*.png *.jpg *.jpeg *.bmp *.tif *.tiff"),
+                ("Görüntü Dosyaları", "*.png *.jpg *.jpeg *.bmp *.tif *.tiff *.pdf"),
                 ("Tüm Dosyalar", "*.*")
             ]
         )
@@ -210,17 +249,26 @@ class OCRApp:
     def load_image_from_path(self, file_path):
         """Belirtilen yoldan görüntü yükle"""
         try:
-            self.original_image = cv2.imread(file_path)
-            if self.original_image is None:
-                raise ValueError("Görüntü okunamadı")
+            # Çok sayfalı TIFF/PDF dosyalarında yalnızca ilk sayfa çözülür
+            self.original_image = ocr_pages.read_page(file_path)
             
-            self.status_var.set(f"Görüntü yüklendi: {os.path.basename(file_path)}")
+            pages = ocr_pages.page_count(file_path) if ocr_pages.is_multipage(file_path) else 1
+            if pages > 1:
+                self.status_var.set(
+                    f"Görüntü yüklendi: {os.path.basename(file_path)} (1/{pages} sayfa, "
+                    f"tüm sayfalar için ocr_batch.py kullanın)"
+                )
+            else:
+                self.status_var.set(f"Görüntü yüklendi: {os.path.basename(file_path)}")
             self.ocr_button.configure(state="normal")
             
             # Görüntüyü göster
             self.display_image(self.original_image, self.image_label)
             
             # Ön işleme uygula
+            self.stage_cache.clear()
+            self.auto_selector.reset()
+            self.preview_engine.set_image(self.original_image)
             self.update_preview()
             
         except Exception as e:
@@ -232,28 +280,8 @@ class OCRApp:
         if cv_image is None:
             return
         
-        # Görüntüyü yeniden boyutlandır
-        h, w = cv_image.shape[:2]
-        
-        # En-boy oranını koru
-        if w > max_width or h > max_height:
-            scale = min(max_width / w, max_height / h)
-            new_w, new_h = int(w * scale), int(h * scale)
-            cv_image = cv2.resize(cv_image, (new_w, new_h))
-        
-        # BGR'den RGB'ye dönüştür
-        if len(cv_image.shape) == 3:
-            cv_image = cv2.cvtColor(cv_image, cv2.COLOR_BGR2RGB)
-        
-        # PIL görüntüsüne dönüştür
-        pil_image = Image.fromarray(cv_image)
-        
-        # Tkinter görüntüsüne dönüştür
-        tk_image = ImageTk.PhotoImage(pil_image)
-        
-        # Etiketi güncelle
-        label.configure(image=tk_image)
-        label.image = tk_image  # Referansı koru
+        # Küçültme ve renk dönüşümü görüntü başına bir kez yapılır, PhotoImage yeniden kullanılır
+        self.display_cache.show(cv_image, label, max_width, max_height)
     
     def update_threshold_label(self, *args):
         """Eşik değeri etiketini güncelle"""
@@ -282,143 +310,157 @@ class OCRApp:
         if self.original_image is None:
             return
         
-        # Ön işleme uygula
-        self.processed_image = self.preprocess_image(self.original_image)
-        
-        # İşlenmiş görüntüyü göster
-        self.display_image(self.processed_image, self.result_label)
+        # Önizlemeyi iste (hesaplama arka planda, küçültülmüş görüntüde yapılır)
+        self.preview_engine.request()
     
-    def preprocess_image(self, image):
-        """Seçilen ön işleme yöntemini uygula"""
-        method = self.preprocess_var.get()
-        threshold_value = self.threshold_var.get()
-        blur_size = self.blur_var.get()
-        if blur_size % 2 == 0:
-            blur_size += 1  # Bulanıklaştırma boyutu tek sayı olmalı
-        
-        morph_size = self.morph_var.get()
-        if morph_size % 2 == 0:
-            morph_size += 1  # Morfolojik işlem boyutu tek sayı olmalı
-        
-        # Görüntünün bir kopyasını al
-        result = image.copy()
-        
-        # Gri tonlamaya dönüştür (çoğu işlem için gerekli)
-        if len(result.shape) == 3:
-            gray = cv2.cvtColor(result, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = result.copy()
-        
-        if method == "basic":
-            # Temel işleme: Gri tonlama
-            return gray
-        
-        elif method == "gray":
-            # Sadece gri tonlama
-            return gray
-        
-        elif method == "threshold":
-            # Basit eşikleme
-            _, thresh = cv2.threshold(gray, threshold_value, 255, cv2.THRESH_BINARY)
-            return thresh
-        
-        elif method == "adaptive_threshold":
-            # Adaptif eşikleme
-            return cv2.adaptiveThreshold(
-                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                cv2.THRESH_BINARY, blur_size, 11
-            )
-        
-        elif method == "otsu":
-            # Otsu eşikleme
-            _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            return thresh
-        
-        elif method == "gaussian_blur":
-            # Gaussian bulanıklaştırma
-            return cv2.GaussianBlur(gray, (blur_size, blur_size), 0)
-        
-        elif method == "bilateral_filter":
-            # İki taraflı filtreleme
-            return cv2.bilateralFilter(gray, blur_size, 75, 75)
-        
-        elif method == "dilation":
-            # Genişletme (dilation)
-            kernel = np.ones((morph_size, morph_size), np.uint8)
-            return cv2.dilate(gray, kernel, iterations=1)
-        
-        elif method == "erosion":
-            # Aşındırma (erosion)
-            kernel = np.ones((morph_size, morph_size), np.uint8)
-            return cv2.erode(gray, kernel, iterations=1)
-        
-        elif method == "opening":
-            # Açma (opening) - Aşındırma sonrası genişletme
-            kernel = np.ones((morph_size, morph_size), np.uint8)
-            return cv2.morphologyEx(gray, cv2.MORPH_OPEN, kernel)
-        
-        elif method == "closing":
-            # Kapama (closing) - Genişletme sonrası aşındırma
-            kernel = np.ones((morph_size, morph_size), np.uint8)
-            return cv2.morphologyEx(gray, cv2.MORPH_CLOSE, kernel)
-        
-        # Varsayılan olarak orijinal görüntüyü döndür
-        return result
+    def show_preview(self, preview_image):
+        """Arka planda hesaplanan önizlemeyi göster"""
+        self.preview_processed = preview_image
+        self.display_image(self.preview_processed, self.result_label)
+    
+    def get_preprocess_params(self):
+        """Arayüzdeki ön işleme parametrelerini oku"""
+        return {
+            "method": self.preprocess_var.get(),
+            "threshold_value": self.threshold_var.get(),
+            "blur_size": self.blur_var.get(),
+            "morph_size": self.morph_var.get()
+        }
+    
+    def preview_stages(self, params, proxy, scale):
+        """Önizleme aşamalarını döndür (arka plan iş parçacığında çağrılır)"""
+        if params["method"] != ocr_auto.AUTO_METHOD:
+            return ocr_pipeline.method_stages(**params)
+        
+        # Seçim vekil görüntüde yapılır; seçilen çekirdekler vekilin ölçeğine uyarlanır
+        stages = self.auto_selector.select(proxy)["stages"]
+        return ocr_auto.scale_stages(stages, scale)
     
     def perform_ocr(self):
         """OCR işlemini gerçekleştir"""
-        if self.processed_image is None:
+        if self.original_image is None:
             messagebox.showwarning("Uyarı", "İşlenecek görüntü bulunamadı!")
             return
         
-        # OCR işlemini ayrı bir thread'de çalıştır
-        threading.Thread(target=self._ocr_thread).start()
+        # Tk değişkenlerini ana thread'de oku
+        params = self.get_preprocess_params()
+        lang = self.lang_var.get()
+        layout = self.layout_var.get()
+        
+        # OCR işini kuyruğa ekle (görüntü referansı şimdi alınır; yeni görüntü yüklense de karışmaz)
+        job = self.jobs.submit(
+            self._ocr_job, self.original_image, params, lang, layout,
+            on_start=self._on_job_start, on_done=self._on_job_done
+        )
+        self.cancel_button.configure(state="normal")
+        if job.status == ocr_jobs.QUEUED:
+            self.status_var.set(f"OCR işi #{job.id} kuyruğa alındı")
     
-    def _ocr_thread(self):
-        """OCR işlemini arka planda çalıştır"""
-        try:
-            # İlerleme çubuğunu başlat
-            self.progress.start()
-            self.ocr_button.configure(state="disabled")
-            self.status_var.set("OCR işlemi çalışıyor...")
-            
-            # Dil seçeneğini al
-            lang = self.lang_var.get()
-            
-            # OCR işlemini gerçekleştir
-            start_time = time.time()
-            
-            # Görüntüyü PIL formatına dönüştür
-            if len(self.processed_image.shape) == 3:
-                pil_img = Image.fromarray(cv2.cvtColor(self.processed_image, cv2.COLOR_BGR2RGB))
-            else:
-                pil_img = Image.fromarray(self.processed_image)
-            
-            # Tesseract OCR uygula
-            text = pytesseract.image_to_string(pil_img, lang=lang)
-            
-            # Süreyi hesapla
-            elapsed_time = time.time() - start_time
-            
-            # Sonuçları göster
-            self.root.after(0, lambda: self._update_results(text, elapsed_time))
+    def cancel_ocr(self):
+        """Bekleyen ve çalışan OCR işlerini iptal et"""
+        self.jobs.cancel_all()
+        self.status_var.set("OCR işleri iptal ediliyor...")
+    
+    def _ocr_job(self, job, image, params, lang, layout=False):
+        """OCR işini arka planda çalıştır (Tk'ya dokunmaz)"""
+        # Ön işlemeyi tam çözünürlüklü görüntüye uygula (önizleme küçültülmüş görüntüde)
+        if params["method"] == ocr_auto.AUTO_METHOD:
+            # Seçim daha önce (ör. önizlemede) yapıldıysa tekrar yapılmaz
+            selection = self.auto_selector.select(image)
+            pipeline = ocr_pipeline.Pipeline(selection["stages"], cache=self.stage_cache)
+            processed = pipeline.run(image)
+            note = f"otomatik: {selection['name']}"
+        else:
+            processed = ocr_core.preprocess_image(image, cache=self.stage_cache, **params)
+            note = ""
+        
+        # Ön işleme bitti; iptal edildiyse Tesseract'ı hiç çalıştırma
+        job.check()
+        
+        # Tesseract OCR uygula (önbellekte varsa doğrudan al)
+        if layout:
+            result, cached = self._ocr_layout(processed, lang)
+        else:
+            def compute(img):
+                if self.ocr_pool is not None:
+                    result = self.ocr_pool.recognize_data(img, lang=lang)
+                else:
+                    result = ocr_worker.recognize_data(img, lang=lang)
+                return json.dumps({"result": result.to_dict()}, ensure_ascii=False)
             
-        except Exception as e:
-            self.root.after(0, lambda: self._show_error(str(e)))
-        finally:
-            # İlerleme çubuğunu durdur
-            self.root.after(0, self._reset_progress)
+            payload, cached = self.ocr_cache.get_or_compute(processed, lang, "data ", compute)
+            result = OCRResult.from_dict(json.loads(payload)["result"])
+        
+        return result, processed, cached, note
+    
+    def _on_job_start(self, job):
+        """İş başladığında (Tk iş parçacığında)"""
+        self.progress.start()
+        self.status_var.set(f"OCR işi #{job.id} çalışıyor...")
     
-    def _update_results(self, text, elapsed_time):
+    def _on_job_done(self, job):
+        """İş bittiğinde (Tk iş parçacığında)"""
+        if job.status == ocr_jobs.DONE:
+            result, processed, cached, note = job.result
+            note = ", ".join(n for n in (note, f"kuyrukta {job.wait_time:.2f} sn") if n)
+            self._update_results(result, processed, job.run_time, cached, note)
+        elif job.status == ocr_jobs.FAILED:
+            self._show_error(job.error)
+        else:
+            self.status_var.set(f"OCR işi #{job.id} iptal edildi")
+        
+        # Başka iş kalmadıysa ilerleme çubuğunu durdur
+        if not self.jobs.busy:
+            self._reset_progress()
+    
+    def _ocr_layout(self, processed, lang):
+        """Metin bölgelerini bul ve bölgeleri paralel tanı"""
+        config = ocr_layout.REGION_CONFIG
+        
+        def compute(image):
+            regions, result = ocr_layout.ocr_page_layout_data(
+                image, lambda crop: ocr_worker.recognize_data(crop, lang=lang, config=config)
+            )
+            return json.dumps({"regions": regions, "result": result.to_dict()}, ensure_ascii=False)
+        
+        payload, cached = self.ocr_cache.get_or_compute(processed, lang, "layout-data " + config, compute)
+        return OCRResult.from_dict(json.loads(payload)["result"]), cached
+    
+    def _update_results(self, result, processed, elapsed_time, cached=False, note=""):
         """OCR sonuçlarını güncelle"""
         # Metin alanını temizle
         self.ocr_text.delete(1.0, tk.END)
         
-        # Sonuçları ekle
-        self.ocr_text.insert(tk.END, text)
+        # Sonuçları ekle (metin kelime kutularından oluşturulur, OCR tekrar çalışmaz)
+        self.ocr_text.insert(tk.END, result.text)
+        
+        # Düşük güvenli kelimeleri işlenmiş görüntü üzerinde işaretle
+        low = result.low_confidence(LOW_CONFIDENCE)
+        self.display_image(self.draw_low_confidence(processed, result, low), self.result_label)
         
         # Durum çubuğunu güncelle
-        self.status_var.set(f"OCR tamamlandı ({elapsed_time:.2f} saniye)")
+        source = ", önbellekten" if cached else ""
+        if note:
+            source += f", {note}"
+        self.status_var.set(
+            f"OCR tamamlandı ({elapsed_time:.2f} saniye{source}) - "
+            f"{len(result)} kelime, ort. güven %{result.mean_confidence:.0f}, "
+            f"düşük güvenli: {len(low)}"
+        )
+    
+    def draw_low_confidence(self, image, result, indices):
+        """Düşük güvenli kelimelerin kutularını kırmızı çerçeveyle çizer"""
+        if len(image.shape) == 2:
+            overlay = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        else:
+            overlay = image.copy()
+        
+        # Ekranda küçültülse de görünür kalması için çizgi kalınlığını boyuta göre ayarla
+        thickness = max(2, max(overlay.shape[:2]) // 500)
+        for x, y, w, h in result.boxes[indices].tolist():
+            cv2.rectangle(overlay, (x, y), (x + w, y + h), (0, 0, 255), thickness)
+        
+        return overlay
     
     def _show_error(self, error_msg):
         """Hata mesajını göster"""
@@ -428,7 +470,16 @@ class OCRApp:
     def _reset_progress(self):
         """İlerleme çubuğunu sıfırla"""
         self.progress.stop()
-        self.ocr_button.configure(state="normal")
+        self.cancel_button.configure(state="disabled")
+    
+    def on_close(self):
+        """Pencere kapanırken OCR işçilerini durdur"""
+        self.preview_engine.close()
+        self.jobs.close()
+        if self.ocr_pool is not None:
+            self.ocr_pool.close()
+        self.ocr_cache.close()
+        self.root.destroy()
 
 def main():
     print("OpenCV OCR Uygulaması")
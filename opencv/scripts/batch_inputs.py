@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Toplu İşlem Girdileri
+---------------------
+ocr_batch.py ve face_batch.py'nin ortak girdi seçimi: klasör, dosya ve glob
+desenlerinden, verilen uzantılara uyan dosyaların sıralı ve tekrarsız listesi.
+"""
+
+import glob
+import os
+
+def collect_inputs(inputs, extensions):
+    """Klasör, dosya ve glob desenlerinden görüntü yollarının listesini oluşturur."""
+    extensions = tuple(extensions)
+    paths = []
+
+    for item in inputs:
+        if os.path.isdir(item):
+            # Klasördeki görüntüleri sıralı olarak ekle
+            for name in sorted(os.listdir(item)):
+                if name.lower().endswith(extensions):
+                    paths.append(os.path.join(item, name))
+        elif os.path.isfile(item):
+            paths.append(item)
+        else:
+            # Glob deseni olarak dene
+            paths.extend(p for p in sorted(glob.glob(item)) if p.lower().endswith(extensions))
+
+    # Aynı dosyanın iki kez işlenmesini engelle (sırayı koruyarak)
+    seen = set()
+    unique_paths = []
+    for path in paths:
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            unique_paths.append(path)
+
+    return unique_paths
@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Toplu (Headless) Yüz Tespiti
+----------------------------
+Bu script, pencere açmadan çok sayıda görüntüde yüz tespiti yapar:
+- Klasör, dosya veya glob deseni ile girdi seçimi
+- İsteğe bağlı göz ve gülümseme tespiti (yüzün üst / alt kısmında)
+- Büyük fotoğraflarda küçültülmüş kopyada tespit (--max-side, isteğe bağlı --refine)
+- Haar cascade yerine DNN yüz dedektörü seçimi (--detector dnn, bkz. face_detectors.py)
+- Görüntüleri süreç havuzuna (process pool) dağıtma; her işçi süreç cascade
+  sınıflandırıcılarını yalnızca bir kez yükler
+- Sınırlı kuyruk ile bellek kullanımını kontrol altında tutma
+- Sınırlayıcı kutuları görüntü görüntü JSONL veya CSV dosyasına yazma ve görüntü/saniye raporu
+
+Kullanım:
+    python face_batch.py ../images -o yuzler.jsonl --eyes --smiles --workers 4
+    python face_batch.py arsiv/*.jpg -o yuzler.csv
+    python face_batch.py buyuk_fotolar/ -o yuzler.jsonl --max-side 1600 --refine
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import cv2
+
+import batch_inputs
+import face_core
+import face_detectors
+import face_features
+
+# Girdi olarak kabul edilen görüntü uzantıları
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp")
+
+# CSV çıktısının sütunları (her satır bir kutu)
+CSV_COLUMNS = ("path", "kind", "face", "x", "y", "w", "h", "error")
+
+# İşçi süreç başına bir kez oluşturulan yüz dedektörü (face_detectors)
+_detector = None
+_cascade_dir = face_core.CASCADE_DIR
+
+def init_worker(cascade_dir, names, detector_name="haar", detector_kwargs=None):
+    """İşçi süreç başlatıcısı: yüz dedektörünü ve göz/gülümseme cascade'lerini bir kez yükler."""
+    global _cascade_dir, _detector
+    # Her süreç tek çekirdek kullansın (süreçler zaten tüm çekirdeklere dağıtılır)
+    cv2.setNumThreads(1)
+
+    _cascade_dir = cascade_dir
+    for name in names:
+        face_core.load_cascade(name, cascade_dir)
+
+    _detector = face_detectors.create_detector(detector_name, **(detector_kwargs or {}))
+
+def to_boxes(rects):
+    """detectMultiScale çıktısını sözlük listesine dönüştürür."""
+    return [
+        {"x": int(x), "y": int(y), "w": int(w), "h": int(h)}
+        for x, y, w, h in rects
+    ]
+
+def process_image(path, options):
+    """Tek bir görüntüde yüzleri (ve isteğe bağlı göz/gülümsemeleri) tespit eder (işçi süreçte çalışır)."""
+    start_time = time.perf_counter()
+    record = {"path": path}
+
+    try:
+        image = cv2.imread(path)
+        if image is None:
+            raise ValueError("Görüntü okunamadı")
+
+        faces, _ = _detector.detect(image)
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+        # Göz ve gülümsemeler yüzün ilgili alt bölgelerinde aranır. İşçi süreçler zaten tüm
+        # çekirdekleri kullandığı için yüzler burada sırayla işlenir.
+        features = face_features.detect_features(gray, faces, options.get("eyes"), options.get("smiles"),
+                                                 cascade_dir=_cascade_dir, parallel=False)
+
+        results = []
+        for (x, y, w, h), eyes, smiles in features:
+            face = {"x": x, "y": y, "w": w, "h": h}
+            if options.get("eyes"):
+                face["eyes"] = to_boxes(eyes)
+            if options.get("smiles"):
+                face["smiles"] = to_boxes(smiles)
+            results.append(face)
+
+        record["width"] = image.shape[1]
+        record["height"] = image.shape[0]
+        record["faces"] = results
+        record["error"] = None
+    except Exception as e:
+        record["faces"] = []
+        record["error"] = str(e)
+
+    record["elapsed"] = round(time.perf_counter() - start_time, 4)
+    return record
+
+def csv_rows(record):
+    """Bir görüntü kaydını CSV satırlarına dönüştürür (yüz yoksa tek boş satır)."""
+    if record["error"] or not record["faces"]:
+        return [{"path": record["path"], "kind": "", "face": "", "error": record["error"] or ""}]
+
+    rows = []
+    for i, face in enumerate(record["faces"]):
+        rows.append(dict(path=record["path"], kind="face", face=i, error="",
+                         **{k: face[k] for k in ("x", "y", "w", "h")}))
+        for kind in ("eyes", "smiles"):
+            for box in face.get(kind, []):
+                rows.append(dict(path=record["path"], kind=kind[:-1], face=i, error="", **box))
+    return rows
+
+def run_batch(paths, output_path, options, workers=None, queue_size=None, output_format="jsonl",
+              cascade_dir=face_core.CASCADE_DIR, progress_every=100, detector="haar", detector_kwargs=None):
+    """Görüntüleri süreç havuzunda işler ve kutuları JSONL veya CSV dosyasına yazar."""
+    workers = workers or os.cpu_count() or 1
+
+    # Aynı anda bekleyen iş sayısı sınırı (bellekte tutulan görev sayısını sınırlar)
+    queue_size = queue_size or workers * 4
+
+    detector_kwargs = dict(detector_kwargs or {})
+    if detector == "haar":
+        detector_kwargs.setdefault("cascade_dir", cascade_dir)
+
+    # Göz ve gülümseme cascade'leri (yüz dedektörü detector_kwargs ile oluşturulur)
+    names = []
+    if options.get("eyes"):
+        names.append("eye")
+    if options.get("smiles"):
+        names.append("smile")
+
+    stats = {"images": 0, "faces": 0, "errors": 0, "elapsed": 0.0, "images_per_sec": 0.0}
+    start_time = time.perf_counter()
+
+    with open(output_path, "w", newline="", encoding="utf-8") as out, \
+            ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                initargs=(cascade_dir, names, detector, detector_kwargs)) as executor:
+        writer = None
+        if output_format == "csv":
+            writer = csv.DictWriter(out, fieldnames=CSV_COLUMNS)
+            writer.writeheader()
+
+        path_iter = iter(paths)
+        pending = set()
+
+        def fill_queue():
+            """Kuyruk dolana kadar yeni görev gönderir."""
+            while len(pending) < queue_size:
+                path = next(path_iter, None)
+                if path is None:
+                    return
+                pending.add(executor.submit(process_image, path, options))
+
+        fill_queue()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                pending.discard(future)
+                record = future.result()
+
+                # Sonucu hemen diske yaz
+                if writer is not None:
+                    writer.writerows(csv_rows(record))
+                else:
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+
+                stats["images"] += 1
+                stats["faces"] += len(record["faces"])
+                if record["error"]:
+                    stats["errors"] += 1
+
+                if progress_every and stats["images"] % progress_every == 0:
+                    elapsed = time.perf_counter() - start_time
+                    print(f"{stats['images']}/{len(paths)} görüntü - {stats['images'] / elapsed:.2f} görüntü/sn")
+
+            fill_queue()
+
+    stats["elapsed"] = time.perf_counter() - start_time
+    if stats["elapsed"] > 0:
+        stats["images_per_sec"] = stats["images"] / stats["elapsed"]
+
+    return stats
+
+def parse_args(argv=None):
+    """Komut satırı argümanlarını ayrıştırır."""
+    parser = argparse.ArgumentParser(description="Toplu (headless) yüz tespiti")
+    parser.add_argument("inputs", nargs="+", help="Görüntü dosyaları, klasörler veya glob desenleri")
+    parser.add_argument("-o", "--output", default="faces.jsonl", help="Çıktı dosyası (.jsonl veya .csv)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default=None,
+                        help="Çıktı biçimi (varsayılan: dosya uzantısından)")
+    parser.add_argument("--eyes", action="store_true", help="Yüzlerde göz tespiti de yap")
+    parser.add_argument("--smiles", action="store_true", help="Yüzlerde gülümseme tespiti de yap")
+    parser.add_argument("--max-side", type=int, default=None,
+                        help="Tespiti uzun kenarı bu boyuta küçültülmüş kopyada yap (yalnızca haar; hızlı, küçük yüzler kaçabilir)")
+    parser.add_argument("--refine", action="store_true",
+                        help="--max-side ile bulunan kutuları tam çözünürlükte iyileştir")
+    parser.add_argument("--detector", choices=tuple(face_detectors.DETECTORS), default="haar",
+                        help="Yüz dedektörü (dnn: ../models klasöründeki ResNet SSD modeli)")
+    parser.add_argument("--model-dir", default=face_detectors.MODEL_DIR, help="DNN model klasörü")
+    parser.add_argument("--cascade-dir", default=face_core.CASCADE_DIR, help="Cascade XML klasörü")
+    parser.add_argument("--workers", type=int, default=None, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--queue-size", type=int, default=None,
+                        help="Aynı anda bekleyen en fazla görev (varsayılan: 4 x işçi)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("Toplu Yüz Tespiti")
+    print("-" * 20)
+
+    paths = batch_inputs.collect_inputs(args.inputs, IMAGE_EXTENSIONS)
+    if not paths:
+        print("Hata: İşlenecek görüntü bulunamadı!")
+        return 1
+
+    if args.detector == "haar":
+        detector_kwargs = {"cascade_dir": args.cascade_dir, "max_side": args.max_side, "refine": args.refine}
+    else:
+        # DNN girişi zaten sabit boyuta (300x300) küçültülür; küçültülmüş kopya seçenekleri yalnızca Haar içindir
+        if args.max_side or args.refine:
+            print("Hata: --max-side ve --refine yalnızca --detector haar ile kullanılabilir")
+            return 1
+        detector_kwargs = {"model_dir": args.model_dir}
+        try:
+            # Model dosyaları eksikse işçi süreçler başlamadan bildir
+            face_detectors.create_detector(args.detector, **detector_kwargs)
+        except RuntimeError as e:
+            print(f"Hata: {e}")
+            return 1
+
+    output_format = args.format or ("csv" if args.output.lower().endswith(".csv") else "jsonl")
+    options = {"eyes": args.eyes, "smiles": args.smiles}
+
+    print(f"{len(paths)} görüntü işlenecek -> {args.output}")
+    stats = run_batch(paths, args.output, options, workers=args.workers, queue_size=args.queue_size,
+                      output_format=output_format, cascade_dir=args.cascade_dir, detector=args.detector,
+                      detector_kwargs=detector_kwargs)
+
+    print(f"\nToplam: {stats['images']} görüntü, {stats['faces']} yüz, {stats['errors']} hata, "
+          f"{stats['elapsed']:.2f} saniye ({stats['images_per_sec']:.2f} görüntü/sn)")
+    return 0 if stats["errors"] == 0 else 2
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Yüz Dedektörü Karşılaştırması
+-----------------------------
+Bu script, face_detectors.py'deki dedektörleri (Haar cascade ve DNN) depodaki örnek
+görüntüler üzerinde karşılaştırır:
+- Hız: görüntü/saniye ve görüntü başına süre (DNN görüntüleri toplu blob ile işler)
+- Doğru kutular varsa: duyarlılık (recall) ve kesinlik (precision). Depodaki örnek görüntülerin
+  kutuları ../images/face_ground_truth.json dosyasındadır (varsayılan); hiçbir dedektörün
+  çıktısı kullanılmadan, görüntü üzerinde alından çeneye ve yanaktan yanağa elle çizilmiştir.
+  Yalnızca bu dosyada bulunan görüntüler değerlendirilir
+- Doğru kutular yoksa (--ground-truth ""): dedektörlerin birbiriyle uyumu (IoU eşiğiyle eşleşen kutu oranı)
+
+Doğru kutu dosyası biçimi (anahtar: dosya adı, değer: [x, y, w, h] listesi):
+    {"group_image.jpg": [[258, 34, 98, 98], ...], "fis.jpg": []}
+
+Kullanım:
+    python face_benchmark.py
+    python face_benchmark.py --detectors haar,dnn --repeat 5 --ground-truth yuzler.json
+    python face_benchmark.py --ground-truth ""
+    python face_benchmark.py ../images/*.jpg --json sonuc.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+import face_detectors
+
+# Varsayılan karşılaştırma görüntüleri
+DEFAULT_IMAGES = (
+    "../images/group_image.jpg",
+    "../images/face_sample.jpg",
+    "../images/fis.jpg",
+    "../images/fis2.jpg",
+)
+
+# Örnek görüntülerin dedektörlerden bağımsız, elle çizilmiş yüz kutuları (alından çeneye)
+DEFAULT_GROUND_TRUTH = "../images/face_ground_truth.json"
+
+def iou_matrix(a, b):
+    """İki kutu kümesi arasındaki IoU matrisini (len(a) x len(b)) hesaplar."""
+    a = np.asarray(a, dtype=np.float32).reshape(-1, 1, 4)
+    b = np.asarray(b, dtype=np.float32).reshape(1, -1, 4)
+
+    w = np.maximum(0.0, np.minimum(a[..., 0] + a[..., 2], b[..., 0] + b[..., 2]) - np.maximum(a[..., 0], b[..., 0]))
+    h = np.maximum(0.0, np.minimum(a[..., 1] + a[..., 3], b[..., 1] + b[..., 3]) - np.maximum(a[..., 1], b[..., 1]))
+    inter = w * h
+    union = a[..., 2] * a[..., 3] + b[..., 2] * b[..., 3] - inter
+    return inter / np.maximum(union, 1e-9)
+
+def count_matches(pred, truth, iou_threshold=0.5):
+    """Kutuları en yüksek IoU'dan başlayarak birebir eşler; eşleşme sayısını döndürür."""
+    if len(pred) == 0 or len(truth) == 0:
+        return 0
+
+    ious = iou_matrix(pred, truth)
+    matches = 0
+    while True:
+        i, j = np.unravel_index(np.argmax(ious), ious.shape)
+        if ious[i, j] < iou_threshold:
+            return matches
+        matches += 1
+        ious[i, :] = -1
+        ious[:, j] = -1
+
+def load_ground_truth(path):
+    """Doğru kutu dosyasını okur (dosya adı -> kutular)."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {os.path.basename(name): np.asarray(boxes, dtype=np.int32).reshape(-1, 4)
+            for name, boxes in data.items()}
+
+def run_detector(detector, images, repeat=3):
+    """Dedektörü tüm görüntülerde repeat kez çalıştırır. (sonuçlar, tur başına süreler) döndürür."""
+    # Isınma (model/cascade yükleme ve ilk çağrı maliyeti ölçüme girmesin)
+    results = detector.detect_batch(images)
+
+    elapsed = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        results = detector.detect_batch(images)
+        elapsed.append(time.perf_counter() - start_time)
+
+    return results, elapsed
+
+def run_benchmark(paths, detector_names, detector_kwargs, repeat=3, ground_truth=None, iou_threshold=0.5):
+    """Dedektörleri karşılaştırır ve sonuç sözlüğünü döndürür."""
+    images = []
+    names = []
+    for path in paths:
+        image = cv2.imread(path)
+        if image is None:
+            print(f"Uyarı: Görüntü okunamadı: {path}")
+            continue
+        images.append(image)
+        names.append(os.path.basename(path))
+
+    results = {}
+    detections = {}
+
+    for name in detector_names:
+        try:
+            detector = face_detectors.create_detector(name, **detector_kwargs.get(name, {}))
+        except (RuntimeError, ValueError) as e:
+            print(f"Uyarı: {name} atlandı - {e}")
+            continue
+
+        boxes, elapsed = run_detector(detector, images, repeat)
+        detections[name] = [b for b, _ in boxes]
+
+        best = min(elapsed)
+        r = {
+            "images_per_sec": len(images) / best if best > 0 else 0.0,
+            "ms_per_image": best / max(len(images), 1) * 1000,
+            "faces": {image_name: len(b) for image_name, b in zip(names, detections[name])},
+        }
+
+        if ground_truth is not None:
+            # Doğru kutusu olmayan görüntüler değerlendirmeye katılmaz
+            pairs = [(p, ground_truth[image_name]) for p, image_name in zip(detections[name], names)
+                     if image_name in ground_truth]
+            matched = sum(count_matches(p, t, iou_threshold) for p, t in pairs)
+            total_truth = sum(len(t) for _, t in pairs)
+            total_pred = sum(len(p) for p, _ in pairs)
+            r["recall"] = matched / total_truth if total_truth else None
+            r["precision"] = matched / total_pred if total_pred else None
+
+        results[name] = r
+
+    # Doğru kutular yoksa dedektörlerin birbiriyle uyumu: 2 x eşleşme / (A + B)
+    agreement = {}
+    if ground_truth is None:
+        for a, b in itertools.combinations(detections, 2):
+            matched = sum(count_matches(p, q, iou_threshold) for p, q in zip(detections[a], detections[b]))
+            total = sum(len(p) for p in detections[a]) + sum(len(q) for q in detections[b])
+            agreement[f"{a}/{b}"] = 2.0 * matched / total if total else 1.0
+
+    return {"images": names, "results": results, "agreement": agreement}
+
+def print_benchmark(benchmark):
+    """Karşılaştırma sonuçlarını tablo olarak yazdırır."""
+    names = benchmark["images"]
+    has_truth = any("recall" in r for r in benchmark["results"].values())
+
+    header = f"{'Dedektör':<10}{'görüntü/sn':>12}{'ms/görüntü':>12}"
+    if has_truth:
+        header += f"{'recall':>9}{'precision':>11}"
+    header += "".join(f"{name[:16]:>18}" for name in names)
+    print(header)
+    print("-" * len(header))
+
+    def fmt(value):
+        return "-" if value is None else f"{value:.3f}"
+
+    for detector, r in benchmark["results"].items():
+        row = f"{detector:<10}{r['images_per_sec']:>12.2f}{r['ms_per_image']:>12.1f}"
+        if has_truth:
+            row += f"{fmt(r.get('recall')):>9}{fmt(r.get('precision')):>11}"
+        row += "".join(f"{r['faces'][name]:>18}" for name in names)
+        print(row)
+
+    for pair, value in benchmark["agreement"].items():
+        print(f"Uyum {pair}: {value:.3f}")
+
+def split_list(value):
+    """Virgülle ayrılmış argümanı listeye çevirir."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Yüz dedektörü karşılaştırması")
+    parser.add_argument("images", nargs="*", default=list(DEFAULT_IMAGES), help="Karşılaştırma görüntüleri")
+    parser.add_argument("--detectors", default=",".join(face_detectors.DETECTORS),
+                        help="Karşılaştırılacak dedektörler (virgülle)")
+    parser.add_argument("--repeat", type=int, default=3, help="Ölçüm tekrar sayısı (en iyisi raporlanır)")
+    parser.add_argument("--ground-truth", default=DEFAULT_GROUND_TRUTH,
+                        help="Doğru kutuların JSON dosyası (boş: dedektör uyumunu raporla)")
+    parser.add_argument("--iou", type=float, default=0.5, help="Eşleşme için en düşük IoU")
+    parser.add_argument("--model-dir", default=face_detectors.MODEL_DIR, help="DNN model klasörü")
+    parser.add_argument("--confidence", type=float, default=0.5, help="DNN skor eşiği")
+    parser.add_argument("--batch-size", type=int, default=8, help="DNN blob başına görüntü sayısı")
+    parser.add_argument("--json", default=None, help="Sonuçları bu JSON dosyasına yaz")
+    args = parser.parse_args()
+
+    print("Yüz Dedektörü Karşılaştırması")
+    print("-" * 30)
+
+    ground_truth = load_ground_truth(args.ground_truth) if args.ground_truth else None
+    detector_kwargs = {
+        "dnn": {"model_dir": args.model_dir, "confidence": args.confidence, "batch_size": args.batch_size},
+    }
+
+    benchmark = run_benchmark(args.images, split_list(args.detectors), detector_kwargs, args.repeat,
+                              ground_truth, args.iou)
+    if not benchmark["results"]:
+        print("Hata: Çalıştırılabilen dedektör yok!")
+        return 1
+
+    print_benchmark(benchmark)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(benchmark, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar kaydedildi: {args.json}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
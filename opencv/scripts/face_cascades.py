@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cascade Sınıflandırıcı Kaydı
+----------------------------
+08_face_detection.py her çalıştırmada ../cascades klasörünü kontrol edip eksik XML
+dosyalarını internetten indiriyor, her script de kendi CascadeClassifier nesnelerini
+yeniden oluşturuyordu (her biri XML dosyasını baştan ayrıştırır). Bu modül:
+- Cascade dosyalarını ağa hiç erişmeden bulur: önce yerel klasör (varsayılan ../cascades),
+  sonra opencv-python paketiyle gelen kopya (cv2.data.haarcascades)
+- Her sınıflandırıcıyı süreç ve iş parçacığı başına bir kez yükler ve sonraki çağrılarda
+  aynı nesneyi döndürür. CascadeClassifier, detectMultiScale sırasında görüntü piramidi ve
+  özellik değerlendirici tamponlarını nesnenin içinde tutar; aynı nesne iki iş parçacığından
+  eşzamanlı kullanılamaz. Bu yüzden her iş parçacığı kendi kopyasını kullanır. Yüz modüllerinin
+  iş parçacığı havuzları (face_features, face_multiview, face_pipeline) uzun ömürlü olduğundan
+  kopya sayısı havuz boyutuyla sınırlı kalır ve XML her iş parçacığında yalnızca bir kez ayrıştırılır.
+"""
+
+import os
+import threading
+
+import cv2
+
+# Yerel cascade klasörü (çevrimdışı paket)
+CASCADE_DIR = "../cascades"
+
+# Cascade adları ve dosyaları
+CASCADE_FILES = {
+    "face": "haarcascade_frontalface_default.xml",
+    "face_alt": "haarcascade_frontalface_alt.xml",
+    "eye": "haarcascade_eye.xml",
+    "smile": "haarcascade_smile.xml",
+    "profile": "haarcascade_profileface.xml",
+}
+
+# İş parçacığı başına sınıflandırıcı önbelleği: (ad, klasör) -> CascadeClassifier
+_local = threading.local()
+
+# Çözümlenmiş dosya yolları (tüm iş parçacıkları için ortak): (ad, klasör) -> yol
+_paths = {}
+_paths_lock = threading.Lock()
+
+def search_dirs(cascade_dir=CASCADE_DIR):
+    """Cascade dosyalarının arandığı klasörleri öncelik sırasıyla döndürür."""
+    dirs = [cascade_dir] if cascade_dir else []
+    if hasattr(cv2, "data"):
+        dirs.append(cv2.data.haarcascades)
+    return dirs
+
+def resolve(name, cascade_dir=CASCADE_DIR):
+    """Cascade adını (veya XML dosya adını) dosya yoluna çevirir; dosya yoksa RuntimeError."""
+    key = (name, cascade_dir)
+    with _paths_lock:
+        path = _paths.get(key)
+    if path is not None:
+        return path
+
+    filename = CASCADE_FILES.get(name, name)
+    dirs = search_dirs(cascade_dir)
+    for directory in dirs:
+        candidate = os.path.join(directory, filename)
+        if os.path.exists(candidate):
+            with _paths_lock:
+                _paths[key] = candidate
+            return candidate
+
+    raise RuntimeError(f"Cascade bulunamadı: {filename} (aranan: {', '.join(dirs) or '-'})")
+
+def get(name, cascade_dir=CASCADE_DIR):
+    """Bu iş parçacığı için yüklü sınıflandırıcıyı döndürür, yoksa yükler."""
+    classifiers = getattr(_local, "classifiers", None)
+    if classifiers is None:
+        classifiers = _local.classifiers = {}
+
+    key = (name, cascade_dir)
+    cascade = classifiers.get(key)
+    if cascade is None:
+        path = resolve(name, cascade_dir)
+        cascade = cv2.CascadeClassifier(path)
+        if cascade.empty():
+            raise RuntimeError(f"Cascade yüklenemedi: {path}")
+        classifiers[key] = cascade
+    return cascade
+
+def get_many(names, cascade_dir=CASCADE_DIR):
+    """Birden fazla sınıflandırıcıyı ad -> sınıflandırıcı sözlüğü olarak döndürür."""
+    return {name: get(name, cascade_dir) for name in names}
+
+def clear():
+    """Bu iş parçacığının sınıflandırıcı önbelleğini ve çözümlenmiş yolları temizler."""
+    _local.classifiers = {}
+    with _paths_lock:
+        _paths.clear()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Yüz Tespiti Çekirdek Fonksiyonları
+----------------------------------
+Bu modül, 08_face_detection.py'den bağımsız olarak kullanılabilen yüz tespiti
+fonksiyonlarını içerir:
+- Haar Cascade sınıflandırıcılarını yükleme
+- Yüz, göz ve gülümseme tespiti
+- Büyük görüntülerde küçültülmüş kopyada hızlı yüz tespiti (isteğe bağlı tam çözünürlükte iyileştirme)
+- Tek taramada birden fazla scaleFactor / minNeighbors kombinasyonu (parametre karşılaştırması)
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+import face_cascades
+
+# Cascade klasörü ve dosya adları face_cascades modülünde tanımlıdır
+CASCADE_DIR = face_cascades.CASCADE_DIR
+CASCADE_FILES = face_cascades.CASCADE_FILES
+
+# Göz ve gülümseme cascade'lerinin en küçük pencere boyutları (genişlik, yükseklik)
+EYE_MIN_SIZE = (20, 20)
+SMILE_MIN_SIZE = (25, 25)
+
+def load_cascade(name, cascade_dir=CASCADE_DIR):
+    """Cascade sınıflandırıcısını döndürür (ağ erişimi olmadan, iş parçacığı başına bir kez yüklenir)."""
+    return face_cascades.get(name, cascade_dir)
+
+def detect_faces(image, face_cascade, max_side=None, refine=False):
+    """Görüntüdeki yüzleri tespit eder.
+
+    max_side verilirse tespit, uzun kenarı max_side piksele küçültülmüş kopyada yapılır ve
+    kutular orijinal koordinatlara ölçeklenir. Bu çok daha hızlıdır, ancak orijinalde
+    yaklaşık 30 / ölçek pikselden küçük yüzler kaçırılır. refine=True ise her kutu, tam
+    çözünürlükte yalnızca kendi çevresinde yeniden tespit edilerek konumu iyileştirilir.
+    """
+    # Gri tonlamaya dönüştür
+    if len(image.shape) == 3:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = image
+
+    scale = proxy_scale(gray.shape, max_side)
+    if scale >= 1.0:
+        # Yüzleri tespit et
+        faces = face_cascade.detectMultiScale(
+            gray,
+            scaleFactor=1.1,
+            minNeighbors=5,
+            minSize=(30, 30),
+            flags=cv2.CASCADE_SCALE_IMAGE
+        )
+        return faces, gray
+
+    # Küçültülmüş kopyada tespit et (en küçük yüz boyutu orijinal piksel cinsinden korunur)
+    small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    min_side = max(1, int(round(30 * scale)))
+    faces = face_cascade.detectMultiScale(
+        small,
+        scaleFactor=1.1,
+        minNeighbors=5,
+        minSize=(min_side, min_side),
+        flags=cv2.CASCADE_SCALE_IMAGE
+    )
+    if len(faces) == 0:
+        return faces, gray
+
+    # Kutuları orijinal koordinatlara ölçekle
+    faces = np.round(np.asarray(faces, dtype=np.float64) / scale).astype(np.int32)
+
+    if refine:
+        faces = refine_faces(gray, faces, face_cascade)
+
+    return faces, gray
+
+def proxy_scale(shape, max_side):
+    """Uzun kenarı max_side'a indiren ölçeği döndürür (küçültme gerekmiyorsa 1.0)."""
+    if not max_side:
+        return 1.0
+    return min(1.0, float(max_side) / max(shape[:2]))
+
+def refine_faces(gray, faces, face_cascade, margin=0.25):
+    """Kaba yüz kutularını tam çözünürlükte, yalnızca her kutunun çevresinde yeniden tespit eder.
+
+    Bölgede yüz bulunamazsa kaba kutu olduğu gibi bırakılır.
+    """
+    img_h, img_w = gray.shape[:2]
+    refined = []
+
+    for (x, y, w, h) in faces:
+        mx, my = int(w * margin), int(h * margin)
+        x0, y0 = max(0, x - mx), max(0, y - my)
+        x1, y1 = min(img_w, x + w + mx), min(img_h, y + h + my)
+
+        # Yalnızca kaba kutuya yakın boyutlar taranır
+        found = face_cascade.detectMultiScale(
+            gray[y0:y1, x0:x1],
+            scaleFactor=1.1,
+            minNeighbors=3,
+            minSize=(int(w * 0.7), int(h * 0.7)),
+            maxSize=(int(w * 1.4) + 1, int(h * 1.4) + 1),
+            flags=cv2.CASCADE_SCALE_IMAGE
+        )
+
+        if len(found) == 0:
+            refined.append((x, y, w, h))
+            continue
+
+        # Merkezi kaba kutunun merkezine en yakın tespiti seç
+        cx, cy = x + w / 2.0 - x0, y + h / 2.0 - y0
+        fx, fy, fw, fh = min(found, key=lambda r: (r[0] + r[2] / 2.0 - cx) ** 2 + (r[1] + r[3] / 2.0 - cy) ** 2)
+        refined.append((x0 + fx, y0 + fy, fw, fh))
+
+    return np.array(refined, dtype=np.int32).reshape(-1, 4)
+
+def detect_faces_sweep(image, face_cascade, scale_factors=(1.1,), min_neighbors=(5,), min_size=(30, 30)):
+    """Birden fazla scaleFactor / minNeighbors kombinasyonu için yüz tespiti yapar.
+
+    Görüntü piramidi her scaleFactor için yalnızca bir kez taranır (minNeighbors=0: gruplanmamış
+    ham adaylar). minNeighbors değerleri yalnızca adayların gruplanmasını değiştirdiği için her
+    değer cv2.groupRectangles ile ayrıca uygulanır; sonuç detectMultiScale ile aynıdır.
+
+    Dönüş: {(scaleFactor, minNeighbors): {"faces", "scan_ms", "group_ms"}} sözlüğü.
+    """
+    if len(image.shape) == 3:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = image
+
+    results = {}
+    for scale_factor in scale_factors:
+        # Ham tarama (detectMultiScale minNeighbors=0 iken adayları gruplamaz)
+        start_time = time.perf_counter()
+        candidates = face_cascade.detectMultiScale(
+            gray,
+            scaleFactor=scale_factor,
+            minNeighbors=0,
+            minSize=min_size,
+            flags=cv2.CASCADE_SCALE_IMAGE
+        )
+        scan_ms = (time.perf_counter() - start_time) * 1000
+        candidates = np.asarray(candidates, dtype=np.int32).reshape(-1, 4).tolist()
+
+        for neighbors in min_neighbors:
+            start_time = time.perf_counter()
+            if neighbors > 0:
+                # detectMultiScale'in kendi gruplaması: en az `neighbors` komşu, eps=0.2
+                faces, _ = cv2.groupRectangles(candidates, neighbors, 0.2)
+            else:
+                faces = candidates
+            faces = np.asarray(faces, dtype=np.int32).reshape(-1, 4)
+            group_ms = (time.perf_counter() - start_time) * 1000
+
+            results[(scale_factor, neighbors)] = {"faces": faces, "scan_ms": scan_ms, "group_ms": group_ms}
+
+    return results
+
+def detect_eyes(gray, face_roi, eye_cascade):
+    """Yüz bölgesindeki gözleri tespit eder."""
+    eyes = eye_cascade.detectMultiScale(
+        face_roi,
+        scaleFactor=1.1,
+        minNeighbors=5,
+        minSize=EYE_MIN_SIZE,
+        flags=cv2.CASCADE_SCALE_IMAGE
+    )
+
+    return eyes
+
+def detect_smile(gray, face_roi, smile_cascade):
+    """Yüz bölgesindeki gülümsemeleri tespit eder."""
+    smiles = smile_cascade.detectMultiScale(
+        face_roi,
+        scaleFactor=1.8,
+        minNeighbors=20,
+        minSize=SMILE_MIN_SIZE,
+        flags=cv2.CASCADE_SCALE_IMAGE
+    )
+
+    return smiles
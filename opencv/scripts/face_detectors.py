@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Değiştirilebilir Yüz Dedektörleri
+---------------------------------
+face_core.detect_faces doğrudan cv2.CascadeClassifier kullanır. Bu modül, aynı çıktıyı
+(görüntü koordinatlarında x, y, w, h kutuları ve skorlar) veren ortak bir dedektör arayüzü sunar:
+- "haar": mevcut davranış (face_core.detect_faces, skor olarak detectMultiScale3 seviye ağırlığı)
+- "dnn": OpenCV DNN modülüyle ResNet-10 SSD yüz dedektörü (yalnızca CPU). Model dosyaları
+  ../models klasöründen okunur, indirme yapılmaz:
+    deploy.prototxt
+    res10_300x300_ssd_iter_140000.caffemodel
+  (opencv/samples/dnn/face_detector klasöründeki dosyalar)
+  Birden fazla görüntü cv2.dnn.blobFromImages ile tek blob halinde, tek ileri geçişte işlenir.
+
+Kullanım:
+    detector = create_detector("dnn", confidence=0.5)
+    boxes, scores = detector.detect(image)
+    results = detector.detect_batch([image1, image2])
+"""
+
+import os
+
+import cv2
+import numpy as np
+
+import face_cascades
+import face_core
+
+# DNN model dosyalarının bulunduğu klasör
+MODEL_DIR = "../models"
+SSD_CONFIG = "deploy.prototxt"
+SSD_WEIGHTS = "res10_300x300_ssd_iter_140000.caffemodel"
+
+# SSD modelinin giriş boyutu ve ortalama değerleri (BGR)
+SSD_INPUT_SIZE = (300, 300)
+SSD_MEAN = (104.0, 177.0, 123.0)
+
+class FaceDetector:
+    """Yüz dedektörü arayüzü."""
+
+    name = "base"
+
+    def detect(self, image):
+        """Görüntüdeki yüzleri tespit eder. (kutular N x 4 int32, skorlar N float32) döndürür."""
+        raise NotImplementedError
+
+    def detect_batch(self, images):
+        """Birden fazla görüntüyü işler. Her görüntü için (kutular, skorlar) listesi döndürür."""
+        return [self.detect(image) for image in images]
+
+class HaarDetector(FaceDetector):
+    """Haar cascade dedektörü (face_core.detect_faces ile aynı ayarlar).
+
+    Skor olarak detectMultiScale3'ün seviye ağırlıkları (levelWeights) döndürülür; kutular
+    detectMultiScale ile aynıdır. max_side ve refine face_core.detect_faces'teki gibidir.
+    """
+
+    name = "haar"
+
+    def __init__(self, cascade="face", cascade_dir=face_cascades.CASCADE_DIR, max_side=None, refine=False):
+        self.cascade = cascade
+        self.cascade_dir = cascade_dir
+        self.max_side = max_side
+        self.refine = refine
+
+    def detect(self, image):
+        # Sınıflandırıcı iş parçacığı başına yüklenir; dedektör iş parçacıkları arasında paylaşılabilir
+        face_cascade = face_cascades.get(self.cascade, self.cascade_dir)
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+
+        scale = face_core.proxy_scale(gray.shape, self.max_side)
+        if scale < 1.0:
+            # Küçültülmüş kopyada tespit (en küçük yüz boyutu orijinal piksel cinsinden korunur)
+            small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            min_side = max(1, int(round(30 * scale)))
+        else:
+            small, min_side = gray, 30
+
+        faces, _, weights = face_cascade.detectMultiScale3(
+            small,
+            scaleFactor=1.1,
+            minNeighbors=5,
+            minSize=(min_side, min_side),
+            flags=cv2.CASCADE_SCALE_IMAGE,
+            outputRejectLevels=True
+        )
+        boxes = np.asarray(faces, dtype=np.int32).reshape(-1, 4)
+        scores = np.asarray(weights, dtype=np.float32).reshape(-1)
+
+        if scale < 1.0 and len(boxes):
+            # Kutuları orijinal koordinatlara ölçekle; iyileştirme kutu sırasını korur
+            boxes = np.round(boxes / scale).astype(np.int32)
+            if self.refine:
+                boxes = face_core.refine_faces(gray, boxes, face_cascade)
+
+        return boxes, scores
+
+def parse_ssd_output(detections, sizes, confidence=0.5):
+    """SSD çıktısını ([1, 1, N, 7]: görüntü no, sınıf, skor, x1, y1, x2, y2) görüntü başına kutulara çevirir.
+
+    sizes: her görüntünün (genişlik, yükseklik) değeri. Koordinatlar 0-1 aralığındadır.
+    """
+    detections = detections.reshape(-1, 7)
+    detections = detections[detections[:, 2] >= confidence]
+
+    results = []
+    for index, (width, height) in enumerate(sizes):
+        rows = detections[detections[:, 0] == index]
+
+        # Normalize koordinatları piksele çevir ve görüntü sınırlarına kırp
+        x1 = np.clip(rows[:, 3] * width, 0, width - 1)
+        y1 = np.clip(rows[:, 4] * height, 0, height - 1)
+        x2 = np.clip(rows[:, 5] * width, 0, width - 1)
+        y2 = np.clip(rows[:, 6] * height, 0, height - 1)
+
+        boxes = np.stack([x1, y1, x2 - x1, y2 - y1], axis=1).round().astype(np.int32).reshape(-1, 4)
+        valid = (boxes[:, 2] > 0) & (boxes[:, 3] > 0)
+        results.append((boxes[valid], rows[valid, 2].astype(np.float32)))
+
+    return results
+
+class DnnDetector(FaceDetector):
+    """OpenCV DNN ResNet-10 SSD yüz dedektörü (CPU)."""
+
+    name = "dnn"
+
+    def __init__(self, model_dir=MODEL_DIR, confidence=0.5, batch_size=8):
+        config = os.path.join(model_dir, SSD_CONFIG)
+        weights = os.path.join(model_dir, SSD_WEIGHTS)
+        missing = [path for path in (config, weights) if not os.path.exists(path)]
+        if missing:
+            raise RuntimeError(f"DNN model dosyası bulunamadı: {', '.join(missing)} "
+                               "(opencv/samples/dnn/face_detector dosyalarını bu klasöre kopyalayın)")
+
+        self.net = cv2.dnn.readNetFromCaffe(config, weights)
+        self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+        self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+        self.confidence = confidence
+        self.batch_size = batch_size
+
+    def detect(self, image):
+        return self.detect_batch([image])[0]
+
+    def detect_batch(self, images):
+        results = []
+
+        for start in range(0, len(images), self.batch_size):
+            batch = [self._to_bgr(image) for image in images[start:start + self.batch_size]]
+            sizes = [(image.shape[1], image.shape[0]) for image in batch]
+
+            # Tüm görüntüler tek blob halinde (N x 3 x 300 x 300), tek ileri geçişte işlenir
+            blob = cv2.dnn.blobFromImages(batch, 1.0, SSD_INPUT_SIZE, SSD_MEAN, swapRB=False, crop=False)
+            self.net.setInput(blob)
+            results.extend(parse_ssd_output(self.net.forward(), sizes, self.confidence))
+
+        return results
+
+    @staticmethod
+    def _to_bgr(image):
+        """Model 3 kanallı BGR giriş bekler."""
+        if len(image.shape) == 2:
+            return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        return image
+
+# Dedektör adları ve sınıfları
+DETECTORS = {
+    "haar": HaarDetector,
+    "dnn": DnnDetector,
+}
+
+def create_detector(name, **kwargs):
+    """Adı verilen dedektörü oluşturur."""
+    if name not in DETECTORS:
+        raise ValueError(f"Bilinmeyen dedektör: {name} (seçenekler: {', '.join(DETECTORS)})")
+    return DETECTORS[name](**kwargs)
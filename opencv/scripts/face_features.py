@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Yüz Özellikleri (Göz ve Gülümseme) Tespiti
+------------------------------------------
+detect_eyes ve detect_smile her yüz için tüm yüz bölgesini tarar; gülümseme cascade'i
+(scaleFactor=1.8, minNeighbors=20) da yüzün tamamında çalışır. Oysa gözler yüzün üst
+yarısında, ağız ise alt üçte birindedir. Bu modül:
+- Her cascade'i yalnızca ilgili alt bölgede çalıştırır (gözler: üst kısım, gülümseme: alt kısım)
+- Yüzde göz bulunamazsa gülümseme aramaz (büyük olasılıkla yanlış pozitif bir yüzdür)
+- Bir karedeki yüzleri iş parçacığı havuzunda eşzamanlı işler (OpenCV tespit sırasında
+  GIL'i bırakır); her iş parçacığı kendi sınıflandırıcılarını kullanır (bkz. face_cascades)
+
+Sonuç biçimi face_pipeline.detect_frame ile aynıdır: (yüz, gözler, gülümsemeler) listesi,
+tüm kutular görüntü koordinatlarında.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import face_cascades
+import face_core
+
+# Yüz kutusunun yüksekliğine göre arama bölgeleri: (başlangıç, bitiş).
+# Haar yüz kutusunda gözler yaklaşık 0.25-0.55 aralığındadır; göz cascade'inin pencereleri
+# yarının biraz altına taştığı için üst sınır 0.6 seçildi (0.5'te gözlerin çoğu kaçırılıyor).
+# Ağız alt üçte birdedir; gülümseme pencereleri için aynı pay bırakıldı.
+# Küçük yüzlerde şerit, cascade'in en küçük penceresinden (face_core.EYE_MIN_SIZE /
+# SMILE_MIN_SIZE) kısa kalırsa o yüksekliğe genişletilir (bkz. sub_roi); aksi halde ör.
+# 63 pikselden kısa yüzlerde gülümseme hiç bulunamazdı.
+EYE_REGION = (0.0, 0.6)
+SMILE_REGION = (0.6, 1.0)
+
+# Tüm çağrılar için ortak iş parçacığı havuzu
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor(workers=None):
+    """Ortak iş parçacığı havuzunu döndürür, yoksa oluşturur."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                                           thread_name_prefix="face-features")
+        return _executor
+
+def shutdown():
+    """Ortak iş parçacığı havuzunu kapatır."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+def sub_roi(gray, face, region, min_height=0):
+    """Yüz kutusunun region ile belirtilen yatay şeridini ve görüntüdeki y başlangıcını döndürür.
+
+    Şerit min_height'tan kısaysa yüz kutusu içinde kalarak (önce aşağı, sonra yukarı) genişletilir.
+    """
+    x, y, w, h = face
+    y0 = y + int(h * region[0])
+    y1 = y + int(h * region[1])
+
+    height = min(min_height, h)
+    if y1 - y0 < height:
+        y1 = min(y + h, y0 + height)
+        y0 = y1 - height
+
+    return gray[y0:y1, x:x+w], y0
+
+def detect_face_features(gray, face, eyes=True, smiles=True, smile_needs_eyes=True,
+                         cascade_dir=face_cascades.CASCADE_DIR):
+    """Tek bir yüzde göz ve gülümseme tespiti yapar (çağıran iş parçacığının cascade'leriyle)."""
+    x, y, w, h = [int(v) for v in face]
+    face_eyes = []
+    face_smiles = []
+
+    if eyes:
+        roi, y0 = sub_roi(gray, (x, y, w, h), EYE_REGION, face_core.EYE_MIN_SIZE[1])
+        found = face_core.detect_eyes(gray, roi, face_cascades.get("eye", cascade_dir))
+        face_eyes = [(x + int(ex), y0 + int(ey), int(ew), int(eh)) for (ex, ey, ew, eh) in found]
+
+    # Göz bulunamayan yüzde gülümseme aranmaz
+    if smiles and not (eyes and smile_needs_eyes and not face_eyes):
+        roi, y0 = sub_roi(gray, (x, y, w, h), SMILE_REGION, face_core.SMILE_MIN_SIZE[1])
+        found = face_core.detect_smile(gray, roi, face_cascades.get("smile", cascade_dir))
+        face_smiles = [(x + int(sx), y0 + int(sy), int(sw), int(sh)) for (sx, sy, sw, sh) in found]
+
+    return (x, y, w, h), face_eyes, face_smiles
+
+def detect_features(gray, faces, eyes=True, smiles=True, smile_needs_eyes=True,
+                    cascade_dir=face_cascades.CASCADE_DIR, parallel=True):
+    """Tüm yüzlerde göz ve gülümseme tespiti yapar; birden fazla yüz varsa eşzamanlı çalışır."""
+    faces = list(faces)
+    if not eyes and not smiles:
+        return [(tuple(int(v) for v in face), [], []) for face in faces]
+
+    args = (eyes, smiles, smile_needs_eyes, cascade_dir)
+    if not parallel or len(faces) < 2:
+        return [detect_face_features(gray, face, *args) for face in faces]
+
+    executor = get_executor()
+    futures = [executor.submit(detect_face_features, gray, face, *args) for face in faces]
+    return [future.result() for future in futures]
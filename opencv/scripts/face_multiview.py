@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Çok Açılı (Ön + Profil) Yüz Tespiti
+-----------------------------------
+08_face_detection.py bölüm 5 ön ve profil cascade'lerini ayrı ayrı çalıştırıp iki kutu
+kümesini üst üste çiziyordu: aynı yüz iki kez işaretlenir ve profil cascade'i yalnızca
+bir yöne dönmüş yüzleri bulur. Bu modül:
+- Ön yüz, profil ve yatay çevrilmiş görüntüde profil (diğer yöne dönmüş yüzler) tespitini
+  iş parçacıklarında eşzamanlı çalıştırır; toplam süre yaklaşık en yavaş tek cascade kadardır
+- Çevrilmiş görüntüdeki kutuları orijinal koordinatlara geri çevirir
+- Tüm kutuları detectMultiScale2'nin komşu sayılarını skor olarak kullanan, NumPy ile
+  vektörleştirilmiş non-maximum suppression (NMS) ile tek bir kümede birleştirir
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+import face_cascades
+
+# Görünümler: ad -> (cascade adı, görüntü yatay çevrilsin mi)
+VIEWS = {
+    "frontal": ("face", False),
+    "profile": ("profile", False),
+    "profile_flipped": ("profile", True),
+}
+
+# Görünümlerin çizim renkleri (BGR)
+VIEW_COLORS = {
+    "frontal": (0, 255, 0),
+    "profile": (255, 0, 0),
+    "profile_flipped": (255, 0, 255),
+}
+
+# Görünümleri eşzamanlı çalıştıran ortak iş parçacığı havuzu
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """Ortak iş parçacığı havuzunu döndürür, yoksa oluşturur."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=len(VIEWS), thread_name_prefix="face-multiview")
+        return _executor
+
+def detect_view(gray, view, cascade_dir=face_cascades.CASCADE_DIR, scale_factor=1.1, min_neighbors=5,
+                min_size=(30, 30)):
+    """Tek bir görünümde tespit yapar. (kutular, skorlar, süre ms) döndürür."""
+    start_time = time.perf_counter()
+    cascade_name, flipped = VIEWS[view]
+    cascade = face_cascades.get(cascade_name, cascade_dir)
+
+    image = cv2.flip(gray, 1) if flipped else gray
+    boxes, counts = cascade.detectMultiScale2(
+        image,
+        scaleFactor=scale_factor,
+        minNeighbors=min_neighbors,
+        minSize=min_size,
+        flags=cv2.CASCADE_SCALE_IMAGE
+    )
+
+    boxes = np.asarray(boxes, dtype=np.int32).reshape(-1, 4)
+    scores = np.asarray(counts, dtype=np.float32).reshape(-1)
+
+    if flipped and len(boxes):
+        # Çevrilmiş görüntüdeki x koordinatını orijinale geri çevir
+        boxes[:, 0] = gray.shape[1] - boxes[:, 0] - boxes[:, 2]
+
+    return boxes, scores, (time.perf_counter() - start_time) * 1000
+
+def non_max_suppression(boxes, scores, iou_threshold=0.3):
+    """Kutuları skora göre sıralayıp birbiriyle çok örtüşenlerden yalnızca en yüksek skorluyu tutar.
+
+    Her adımda seçilen kutunun kalan tüm kutularla örtüşmesi (IoU) tek NumPy işlemiyle hesaplanır.
+    Dönüş: tutulan kutuların indeksleri (skora göre azalan).
+    """
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    if len(boxes) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    x1, y1 = boxes[:, 0], boxes[:, 1]
+    x2, y2 = x1 + boxes[:, 2], y1 + boxes[:, 3]
+    areas = boxes[:, 2] * boxes[:, 3]
+
+    order = np.argsort(-np.asarray(scores, dtype=np.float32), kind="stable")
+    keep = []
+
+    while len(order):
+        i = order[0]
+        keep.append(i)
+        rest = order[1:]
+
+        # Seçilen kutunun kalan kutularla kesişimi
+        w = np.maximum(0.0, np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]))
+        h = np.maximum(0.0, np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]))
+        inter = w * h
+        iou = inter / (areas[i] + areas[rest] - inter)
+
+        order = rest[iou <= iou_threshold]
+
+    return np.array(keep, dtype=np.int64)
+
+def detect_multiview(image, cascade_dir=face_cascades.CASCADE_DIR, views=tuple(VIEWS), iou_threshold=0.3,
+                     scale_factor=1.1, min_neighbors=5, min_size=(30, 30), parallel=True):
+    """Ön ve profil görünümlerinde yüz tespiti yapar ve sonuçları NMS ile birleştirir.
+
+    Dönüş sözlüğü:
+    - "boxes": birleştirilmiş kutular (N x 4), "scores": komşu sayıları, "views": her kutunun görünümü
+    - "raw": görünüm -> birleştirmeden önceki kutular, "timings": görünüm -> süre (ms)
+    """
+    if len(image.shape) == 3:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = image
+
+    args = (cascade_dir, scale_factor, min_neighbors, min_size)
+    if parallel:
+        executor = get_executor()
+        futures = {view: executor.submit(detect_view, gray, view, *args) for view in views}
+        outputs = {view: future.result() for view, future in futures.items()}
+    else:
+        outputs = {view: detect_view(gray, view, *args) for view in views}
+
+    all_boxes = np.concatenate([outputs[view][0] for view in views])
+    all_scores = np.concatenate([outputs[view][1] for view in views])
+    all_views = np.array([view for view in views for _ in range(len(outputs[view][0]))], dtype=object)
+
+    keep = non_max_suppression(all_boxes, all_scores, iou_threshold)
+
+    return {
+        "boxes": all_boxes[keep],
+        "scores": all_scores[keep],
+        "views": all_views[keep].tolist(),
+        "raw": {view: outputs[view][0] for view in views},
+        "timings": {view: outputs[view][2] for view in views},
+    }
+
+def draw_multiview(image, result):
+    """Birleştirilmiş kutuları görünüm renkleriyle çizer."""
+    for (x, y, w, h), view in zip(result["boxes"], result["views"]):
+        cv2.rectangle(image, (int(x), int(y)), (int(x + w), int(y + h)), VIEW_COLORS[view], 2)
+    return image
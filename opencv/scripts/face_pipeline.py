@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+İş Hattı (Pipeline) ile Gerçek Zamanlı Yüz Tespiti
+--------------------------------------------------
+08_face_detection.py'deki kamera döngüsü kare okuma, yüz/göz/gülümseme tespiti, çizim ve
+gösterimi tek iş parçacığında sırayla yapar; FPS tüm aşamaların toplam süresiyle sınırlanır.
+Bu modülde aşamalar ayrılır:
+- Yakalama iş parçacığı kareleri kamera hızında okur
+- Tespit işçi iş parçacıkları (her biri kendi cascade sınıflandırıcılarıyla) kareleri işler;
+  OpenCV tespit sırasında GIL'i bıraktığı için işçiler gerçekten paralel çalışır
+- Gösterim ana iş parçacığında yapılır (HighGUI pencereleri ana iş parçacığında olmalıdır):
+  her yeni kare, elde edilmiş en güncel tespit sonucuyla birlikte çizilir
+- Aşamalar sınırlı kuyruklarla bağlanır; tespit geride kalırsa en eski kareler atılır,
+  böylece gecikme birikmez ve yakalama/gösterim kamera hızında kalır
+
+Kullanım:
+    python face_pipeline.py                     # Kamera 0, 2 tespit işçisi
+    python face_pipeline.py --workers 4 --no-smiles
+    python face_pipeline.py video.mp4 --no-display --max-frames 500
+"""
+
+import argparse
+import queue
+import sys
+import threading
+import time
+
+import cv2
+
+import face_cascades
+import face_core
+import face_features
+
+def put_latest(q, item):
+    """Öğeyi kuyruğa ekler; kuyruk doluysa en eski öğeleri atar. Atılan öğe sayısını döndürür."""
+    dropped = 0
+    while True:
+        try:
+            q.put_nowait(item)
+            return dropped
+        except queue.Full:
+            try:
+                q.get_nowait()
+                dropped += 1
+            except queue.Empty:
+                pass
+
+def detect_frame(frame, face_cascade, eyes=True, smiles=True, cascade_dir=face_core.CASCADE_DIR):
+    """Karedeki yüzleri ve isteğe bağlı göz/gülümsemeleri tespit eder.
+
+    Dönüş: (yüz, gözler, gülümsemeler) listesi; tüm kutular görüntü koordinatlarındadır.
+    """
+    faces, gray = face_core.detect_faces(frame, face_cascade)
+
+    # Göz ve gülümsemeler yüzlerin ilgili alt bölgelerinde, yüzler eşzamanlı işlenerek aranır
+    return face_features.detect_features(gray, faces, eyes, smiles, cascade_dir=cascade_dir)
+
+def draw_results(image, results):
+    """detect_frame sonucunu görüntünün üzerine çizer (08_face_detection.py ile aynı renkler)."""
+    for (x, y, w, h), eyes, smiles in results:
+        cv2.rectangle(image, (x, y), (x+w, y+h), (0, 255, 0), 2)
+
+        for (ex, ey, ew, eh) in eyes:
+            cv2.rectangle(image, (ex, ey), (ex+ew, ey+eh), (255, 0, 0), 2)
+
+        for (sx, sy, sw, sh) in smiles:
+            cv2.rectangle(image, (sx, sy), (sx+sw, sy+sh), (0, 0, 255), 2)
+
+    return image
+
+class FacePipeline:
+    """Yakalama, tespit ve gösterimi sınırlı kuyruklarla ayıran yüz tespiti iş hattı."""
+
+    def __init__(self, source=0, workers=2, queue_size=None, eyes=True, smiles=True,
+                 cascade_dir=face_core.CASCADE_DIR):
+        self.source = source
+        self.workers = max(1, workers)
+        self.eyes = eyes
+        self.smiles = smiles
+        self.cascade_dir = cascade_dir
+
+        # Tespit kuyruğu: işçi başına bir kare yeterli; fazlası yalnızca gecikme ekler
+        self._frames = queue.Queue(maxsize=queue_size or self.workers)
+
+        # Gösterim için en son kare ve en güncel tespit sonucu
+        self._cond = threading.Condition()
+        self._frame = None
+        self._frame_index = -1
+        self._result = {"index": -1, "faces": [], "latency": 0.0}
+
+        self._stop = threading.Event()
+        self._capture_done = threading.Event()
+        self._threads = []
+        self._cap = None
+        self.error = None
+
+        self.stats = {"captured": 0, "detected": 0, "dropped": 0, "rendered": 0, "elapsed": 0.0}
+        self._stats_lock = threading.Lock()
+        self._start_time = None
+
+    def start(self):
+        """Kaynağı açar, yakalama ve tespit iş parçacıklarını başlatır."""
+        self._cap = cv2.VideoCapture(self.source)
+        if not self._cap.isOpened():
+            raise RuntimeError(f"Video kaynağı açılamadı: {self.source}")
+
+        # Cascade dosyaları burada çözümlenir; dosya bulunamazsa hata hemen görülür.
+        # Sınıflandırıcıların kendisi her işçi iş parçacığında ayrı yüklenir (paylaşılmaz).
+        self._names = ["face"] + (["eye"] if self.eyes else []) + (["smile"] if self.smiles else [])
+        for name in self._names:
+            face_cascades.resolve(name, self.cascade_dir)
+
+        self._start_time = time.perf_counter()
+        self._threads = [threading.Thread(target=self._capture_loop, daemon=True)]
+        self._threads += [threading.Thread(target=self._detect_loop, daemon=True)
+                          for _ in range(self.workers)]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def _count(self, key, value=1):
+        with self._stats_lock:
+            self.stats[key] += value
+
+    def _capture_loop(self):
+        """Yakalama iş parçacığı: kareleri okur, gösterime ve tespit kuyruğuna verir."""
+        index = 0
+        try:
+            while not self._stop.is_set():
+                ret, frame = self._cap.read()
+                if not ret:
+                    break
+
+                with self._cond:
+                    self._frame = frame
+                    self._frame_index = index
+                    self._cond.notify_all()
+
+                # Tespit geride kaldıysa en eski kare atılır
+                dropped = put_latest(self._frames, (index, frame, time.perf_counter()))
+                self._count("captured")
+                if dropped:
+                    self._count("dropped", dropped)
+                index += 1
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self._capture_done.set()
+            with self._cond:
+                self._cond.notify_all()
+
+    def _detect_loop(self):
+        """Tespit işçisi: kuyruktan kare alır ve sonucu yayımlar."""
+        try:
+            face_cascade = face_cascades.get("face", self.cascade_dir)
+        except RuntimeError as e:
+            self.error = str(e)
+            return
+
+        while not self._stop.is_set():
+            try:
+                index, frame, captured_at = self._frames.get(timeout=0.1)
+            except queue.Empty:
+                if self._capture_done.is_set():
+                    return
+                continue
+
+            try:
+                faces = detect_frame(frame, face_cascade, self.eyes, self.smiles, self.cascade_dir)
+            except Exception as e:
+                self.error = str(e)
+                continue
+
+            self._count("detected")
+            with self._cond:
+                # İşçiler sırasız bitirebilir; yalnızca daha yeni karenin sonucu kabul edilir
+                if index > self._result["index"]:
+                    self._result = {
+                        "index": index,
+                        "faces": faces,
+                        "latency": time.perf_counter() - captured_at,
+                    }
+
+    @property
+    def finished(self):
+        """Kaynak bitti ve bekleyen kare kalmadı mı?"""
+        return self._capture_done.is_set() and self._frames.empty()
+
+    def next_frame(self, last_index, timeout=0.5):
+        """last_index'ten daha yeni bir kare gelene kadar bekler.
+
+        Dönüş: (kare numarası, kare, en güncel tespit sonucu) veya zaman aşımında None.
+        Döndürülen her kare gösterilmiş sayılır (stats["rendered"]).
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._frame_index > last_index or self._capture_done.is_set(),
+                timeout=timeout
+            )
+            if self._frame_index <= last_index:
+                return None
+            item = self._frame_index, self._frame, self._result
+
+        self._count("rendered")
+        return item
+
+    def latest_result(self):
+        """En güncel tespit sonucunu döndürür."""
+        with self._cond:
+            return self._result
+
+    def stop(self):
+        """İş parçacıklarını durdurur ve kaynağı kapatır."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=2)
+        self._threads = []
+
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+        if self._start_time is not None:
+            self.stats["elapsed"] = time.perf_counter() - self._start_time
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+def run_live(source=0, workers=2, eyes=True, smiles=True, display=True, max_frames=None,
+             cascade_dir=face_core.CASCADE_DIR, window_name="Gerçek Zamanlı Yüz Tespiti (İş Hattı)"):
+    """İş hattını çalıştırır ve kareleri ana iş parçacığında gösterir. İstatistikleri döndürür."""
+    pipeline = FacePipeline(source, workers, eyes=eyes, smiles=smiles, cascade_dir=cascade_dir)
+
+    # FPS hesaplama için değişkenler
+    fps_start_time = time.time()
+    fps_frame_count = 0
+    fps = 0
+    detect_count = 0
+    detect_fps = 0
+
+    with pipeline:
+        last_index = -1
+
+        while True:
+            item = pipeline.next_frame(last_index)
+            if item is None:
+                if pipeline.finished:
+                    break
+                continue
+
+            last_index, frame, result = item
+
+            # FPS hesapla (gösterim ve tespit hızı ayrı ayrı)
+            fps_frame_count += 1
+            if (time.time() - fps_start_time) > 1:
+                fps = fps_frame_count
+                detect_fps = pipeline.stats["detected"] - detect_count
+                detect_count = pipeline.stats["detected"]
+                fps_frame_count = 0
+                fps_start_time = time.time()
+
+            if display:
+                # Kare tespit işçisi tarafından da okunuyor olabilir; kopyası üzerine çizilir
+                canvas = draw_results(frame.copy(), result["faces"])
+
+                cv2.putText(canvas, f"FPS: {fps} (tespit: {detect_fps})", (10, 30),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+                cv2.putText(canvas, f"Yüzler: {len(result['faces'])}", (10, 60),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                cv2.putText(canvas, f"Gecikme: {result['latency'] * 1000:.0f} ms", (10, 90),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2)
+
+                cv2.imshow(window_name, canvas)
+
+                # 'q' tuşuna basılırsa çık
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+
+            if max_frames and pipeline.stats["rendered"] >= max_frames:
+                break
+
+    if display:
+        cv2.destroyAllWindows()
+
+    if pipeline.error:
+        print(f"Hata: {pipeline.error}")
+
+    return pipeline.stats
+
+def print_stats(stats):
+    """İş hattı istatistiklerini yazdırır."""
+    elapsed = stats["elapsed"] or 1e-9
+    print(f"Yakalanan: {stats['captured']} kare ({stats['captured'] / elapsed:.1f} FPS)")
+    print(f"Gösterilen: {stats['rendered']} kare ({stats['rendered'] / elapsed:.1f} FPS)")
+    print(f"Tespit edilen: {stats['detected']} kare ({stats['detected'] / elapsed:.1f} FPS)")
+    print(f"Atılan (tespit geride kaldı): {stats['dropped']} kare")
+
+def parse_args(argv=None):
+    """Komut satırı argümanlarını ayrıştırır."""
+    parser = argparse.ArgumentParser(description="İş hattı ile gerçek zamanlı yüz tespiti")
+    parser.add_argument("source", nargs="?", default="0", help="Kamera numarası veya video dosyası")
+    parser.add_argument("--workers", type=int, default=2, help="Tespit işçi iş parçacığı sayısı")
+    parser.add_argument("--no-eyes", action="store_true", help="Göz tespiti yapma")
+    parser.add_argument("--no-smiles", action="store_true", help="Gülümseme tespiti yapma")
+    parser.add_argument("--no-display", action="store_true", help="Pencere açmadan çalıştır")
+    parser.add_argument("--max-frames", type=int, default=None, help="Gösterilecek en fazla kare")
+    parser.add_argument("--cascade-dir", default=face_core.CASCADE_DIR, help="Cascade XML klasörü")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    source = int(args.source) if args.source.isdigit() else args.source
+
+    print("İş Hattı ile Yüz Tespiti")
+    print("-" * 20)
+    if not args.no_display:
+        print("Çıkmak için 'q' tuşuna basın")
+
+    try:
+        stats = run_live(source, args.workers, eyes=not args.no_eyes, smiles=not args.no_smiles,
+                         display=not args.no_display, max_frames=args.max_frames,
+                         cascade_dir=args.cascade_dir)
+    except RuntimeError as e:
+        print(f"Hata: {e}")
+        return 1
+
+    print()
+    print_stats(stats)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
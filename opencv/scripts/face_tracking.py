@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tespit + Takip ile Yüz Tespiti
+------------------------------
+Kamera döngüsünde Haar cascade her karede tüm görüntüyü tarar. Ardışık karelerde yüzler
+çok az yer değiştirdiği için bu modül tam tespiti yalnızca gerektiğinde çalıştırır:
+- Her N karede bir (veya hiç yüz takip edilmiyorsa her karede) tam tespit yapılır
+- Aradaki karelerde her yüz, son tespitteki yüz görüntüsüyle (şablon) önceki konumun
+  çevresindeki küçük bir pencerede şablon eşleme (matchTemplate) ile takip edilir
+- Eşleme skoru eşiğin altına düşerse (yüz kayboldu, döndü, örtüldü) hemen yeniden tespit yapılır
+- Göz ve gülümseme tespiti tüm kare yerine takip edilen yüz bölgelerinde çalışır
+
+Kullanım:
+    python face_tracking.py                     # Kamera 0, her 10 karede bir tespit
+    python face_tracking.py --detect-every 5 --min-score 0.7
+    python face_tracking.py video.mp4 --no-display --max-frames 500
+"""
+
+import argparse
+import sys
+import time
+
+import cv2
+
+import face_core
+import face_features
+import face_pipeline
+
+class FaceTracker:
+    """Yüzleri aralıklı tam tespit ve aradaki karelerde şablon eşleme ile izler."""
+
+    def __init__(self, face_cascade, detect_every=10, min_score=0.6, search_margin=0.5,
+                 track_size=64, eyes=True, smiles=True, cascade_dir=face_core.CASCADE_DIR):
+        self.face_cascade = face_cascade
+        self.detect_every = detect_every
+        self.min_score = min_score  # TM_CCOEFF_NORMED skor eşiği
+        self.search_margin = search_margin  # Arama penceresi: kutu + her yönde margin * boyut
+        self.track_size = track_size  # Eşleme bu genişliğe küçültülmüş şablonla yapılır
+        self.eyes = eyes
+        self.smiles = smiles
+        self.cascade_dir = cascade_dir  # Göz ve gülümseme cascade'leri için
+
+        self.stats = {"frames": 0, "detections": 0, "lost": 0}
+        self.reset()
+
+    def reset(self):
+        """Takip edilen yüzleri unutur; sonraki karede tam tespit yapılır."""
+        self.tracks = []  # Her yüz: {"box": (x, y, w, h), "template": ..., "scale": ..., "score": ...}
+        self._since_detect = 0
+
+    def _detect(self, gray):
+        """Tam tespit yapar ve şablonları yeniler."""
+        faces, _ = face_core.detect_faces(gray, self.face_cascade)
+
+        self.tracks = []
+        for (x, y, w, h) in faces:
+            scale = min(1.0, self.track_size / float(w))
+            template = gray[y:y+h, x:x+w]
+            if scale < 1.0:
+                template = cv2.resize(template, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            self.tracks.append({"box": (int(x), int(y), int(w), int(h)), "template": template,
+                                "scale": scale, "score": 1.0})
+
+        self._since_detect = 0
+        self.stats["detections"] += 1
+
+    def _track(self, gray, track):
+        """Yüzü önceki konumunun çevresinde arar. (yeni kutu, skor) döndürür."""
+        x, y, w, h = track["box"]
+        margin_x = int(w * self.search_margin)
+        margin_y = int(h * self.search_margin)
+
+        img_h, img_w = gray.shape[:2]
+        x0, y0 = max(0, x - margin_x), max(0, y - margin_y)
+        x1, y1 = min(img_w, x + w + margin_x), min(img_h, y + h + margin_y)
+
+        window = gray[y0:y1, x0:x1]
+        scale = track["scale"]
+        if scale < 1.0:
+            window = cv2.resize(window, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        template = track["template"]
+        if window.shape[0] < template.shape[0] or window.shape[1] < template.shape[1]:
+            # Yüz görüntü kenarından çıkıyor
+            return track["box"], 0.0
+
+        scores = cv2.matchTemplate(window, template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, loc = cv2.minMaxLoc(scores)
+
+        new_x = x0 + int(round(loc[0] / scale))
+        new_y = y0 + int(round(loc[1] / scale))
+        return (new_x, new_y, w, h), score
+
+    def update(self, frame):
+        """Yeni kareyi işler. face_pipeline.detect_frame ile aynı biçimde sonuç döndürür."""
+        if len(frame.shape) == 3:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = frame
+
+        self.stats["frames"] += 1
+        need_detect = not self.tracks or self._since_detect + 1 >= self.detect_every
+
+        if not need_detect:
+            for track in self.tracks:
+                box, score = self._track(gray, track)
+                if score < self.min_score:
+                    # Takip güvenilmez; tüm kare yeniden taranır
+                    self.stats["lost"] += 1
+                    need_detect = True
+                    break
+                track["box"] = box
+                track["score"] = score
+
+        if need_detect:
+            self._detect(gray)
+        else:
+            self._since_detect += 1
+
+        return self._features(gray)
+
+    def _features(self, gray):
+        """Takip edilen yüz bölgelerinde göz ve gülümseme tespiti yapar."""
+        faces = [track["box"] for track in self.tracks]
+        return face_features.detect_features(gray, faces, self.eyes, self.smiles, cascade_dir=self.cascade_dir)
+
+def run_tracking(source=0, detect_every=10, min_score=0.6, eyes=True, smiles=True, display=True,
+                 max_frames=None, cascade_dir=face_core.CASCADE_DIR):
+    """Videoyu tespit + takip moduyla işler. İstatistikleri döndürür."""
+    tracker = FaceTracker(face_core.load_cascade("face", cascade_dir), detect_every, min_score,
+                          eyes=eyes, smiles=smiles, cascade_dir=cascade_dir)
+
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise RuntimeError(f"Video kaynağı açılamadı: {source}")
+
+    # FPS hesaplama için değişkenler
+    fps_start_time = time.time()
+    fps_frame_count = 0
+    fps = 0
+
+    start_time = time.perf_counter()
+    process_time = 0.0
+
+    try:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+
+            fps_frame_count += 1
+            if (time.time() - fps_start_time) > 1:
+                fps = fps_frame_count
+                fps_frame_count = 0
+                fps_start_time = time.time()
+
+            t0 = time.perf_counter()
+            results = tracker.update(frame)
+            process_time += time.perf_counter() - t0
+
+            if display:
+                face_pipeline.draw_results(frame, results)
+                cv2.putText(frame, f"FPS: {fps}", (10, 30),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+                cv2.putText(frame, f"Yüzler: {len(results)}", (10, 60),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                cv2.imshow("Tespit + Takip", frame)
+
+                # 'q' tuşuna basılırsa çık
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+
+            if max_frames and tracker.stats["frames"] >= max_frames:
+                break
+    finally:
+        cap.release()
+        if display:
+            cv2.destroyAllWindows()
+
+    stats = dict(tracker.stats)
+    stats["elapsed"] = time.perf_counter() - start_time
+    stats["process_time"] = process_time
+    return stats
+
+def parse_args(argv=None):
+    """Komut satırı argümanlarını ayrıştırır."""
+    parser = argparse.ArgumentParser(description="Tespit + takip ile yüz tespiti")
+    parser.add_argument("source", nargs="?", default="0", help="Kamera numarası veya video dosyası")
+    parser.add_argument("--detect-every", type=int, default=10, help="Kaç karede bir tam tespit yapılacağı")
+    parser.add_argument("--min-score", type=float, default=0.6,
+                        help="Bu skorun altında takip bırakılıp yeniden tespit yapılır")
+    parser.add_argument("--no-eyes", action="store_true", help="Göz tespiti yapma")
+    parser.add_argument("--no-smiles", action="store_true", help="Gülümseme tespiti yapma")
+    parser.add_argument("--no-display", action="store_true", help="Pencere açmadan çalıştır")
+    parser.add_argument("--max-frames", type=int, default=None, help="İşlenecek en fazla kare")
+    parser.add_argument("--cascade-dir", default=face_core.CASCADE_DIR, help="Cascade XML klasörü")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    source = int(args.source) if args.source.isdigit() else args.source
+
+    print("Tespit + Takip ile Yüz Tespiti")
+    print("-" * 20)
+    if not args.no_display:
+        print("Çıkmak için 'q' tuşuna basın")
+
+    try:
+        stats = run_tracking(source, args.detect_every, args.min_score, eyes=not args.no_eyes,
+                             smiles=not args.no_smiles, display=not args.no_display,
+                             max_frames=args.max_frames, cascade_dir=args.cascade_dir)
+    except RuntimeError as e:
+        print(f"Hata: {e}")
+        return 1
+
+    frames = stats["frames"] or 1
+    print(f"\n{stats['frames']} kare, {stats['detections']} tam tespit "
+          f"(%{100.0 * stats['detections'] / frames:.0f}), {stats['lost']} takip kaybı")
+    print(f"Kare başına işlem süresi: {stats['process_time'] / frames * 1000:.1f} ms "
+          f"({frames / max(stats['process_time'], 1e-9):.1f} FPS)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
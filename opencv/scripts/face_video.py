@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Video Dosyasında Yüz Tespiti
+----------------------------
+Kayıtlı görüntüleri çevrimdışı işlemek için:
+- Kareler ayrı bir iş parçacığında çözülür (decode) ve sınırlı bir kuyrukla işlemeye verilir
+- --skip K ile yalnızca her K. kare işlenir; atlanan kareler çözülmez (cap.grab)
+- İşlenen karelerde tam tespit her --stride karede bir yapılır, aradaki karelerde yüzler
+  şablon eşleme ile takip edilir (face_tracking.FaceTracker)
+- Kare başına tespit zaman çizelgesi sıkıştırılmış NumPy (.npz) veya Parquet (.parquet,
+  pyarrow gerekir) dosyasına yazılır
+- İsteğe bağlı olarak işaretlenmiş çıktı videosu ayrı bir kodlayıcı (encoder) iş parçacığında yazılır
+- Gerçek zaman oranı raporlanır: video süresi / işlem süresi (1'den büyükse gerçek zamandan hızlı)
+
+Kullanım:
+    python face_video.py kayit.mp4 -o zaman_cizelgesi.npz
+    python face_video.py kayit.mp4 -o yuzler.parquet --stride 10 --skip 2
+    python face_video.py kayit.mp4 --video isaretli.avi --eyes --smiles
+"""
+
+import argparse
+import queue
+import sys
+import threading
+import time
+
+import cv2
+import numpy as np
+
+import face_core
+import face_pipeline
+import face_tracking
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    # Parquet çıktısı için isteğe bağlı
+    pyarrow = None
+
+# Çıktı video uzantısına göre codec
+VIDEO_CODECS = {
+    ".avi": "MJPG",
+    ".mp4": "mp4v",
+}
+
+class Timeline:
+    """İşlenen karelerin yüz kutularını sütun tabanlı olarak biriktirir."""
+
+    def __init__(self):
+        self.frames = []  # Kare numarası
+        self.times = []  # Videodaki zaman (saniye)
+        self.detected = []  # Bu karede tam tespit mi yapıldı (değilse takip)
+        self.counts = []  # Karedeki yüz sayısı
+        self.boxes = []  # Tüm kutular (x, y, w, h), kare sırasıyla
+
+    def add(self, frame_index, time_sec, detected, faces):
+        """Bir karenin sonucunu ekler."""
+        self.frames.append(frame_index)
+        self.times.append(time_sec)
+        self.detected.append(detected)
+        self.counts.append(len(faces))
+        self.boxes.extend(faces)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def to_arrays(self):
+        """Zaman çizelgesini NumPy dizilerine çevirir.
+
+        offsets[i]:offsets[i+1] aralığı, i. karenin boxes içindeki kutularıdır.
+        """
+        return {
+            "frames": np.asarray(self.frames, dtype=np.int32),
+            "times": np.asarray(self.times, dtype=np.float32),
+            "detected": np.asarray(self.detected, dtype=bool),
+            "offsets": np.concatenate([[0], np.cumsum(self.counts, dtype=np.int64)]),
+            "boxes": np.asarray(self.boxes, dtype=np.int32).reshape(-1, 4),
+        }
+
+    def save(self, path):
+        """Zaman çizelgesini .npz (varsayılan) veya .parquet dosyasına yazar."""
+        arrays = self.to_arrays()
+
+        if not path.lower().endswith(".parquet"):
+            np.savez_compressed(path, **arrays)
+            return
+
+        if pyarrow is None:
+            raise RuntimeError("Parquet çıktısı için pyarrow kurulmalıdır: pip install pyarrow")
+
+        # Parquet: her satır bir kutu (yüz bulunmayan kareler satır içermez)
+        counts = np.diff(arrays["offsets"])
+        boxes = arrays["boxes"]
+        table = pyarrow.Table.from_arrays([
+            pyarrow.array(np.repeat(arrays["frames"], counts)),
+            pyarrow.array(np.repeat(arrays["times"], counts)),
+            pyarrow.array(np.repeat(arrays["detected"], counts)),
+            pyarrow.array(boxes[:, 0]),
+            pyarrow.array(boxes[:, 1]),
+            pyarrow.array(boxes[:, 2]),
+            pyarrow.array(boxes[:, 3]),
+        ], names=["frame", "time", "detected", "x", "y", "w", "h"])
+        pyarrow.parquet.write_table(table, path)
+
+def load_timeline(path):
+    """save() ile yazılmış .npz zaman çizelgesini okur."""
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
+
+def decode_loop(cap, frames, stop, skip=1, max_frames=None):
+    """Çözme iş parçacığı: işlenecek kareleri kuyruğa verir, bitişte None gönderir."""
+    fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+    index = 0
+    sent = 0
+
+    try:
+        while not stop.is_set():
+            if index % skip:
+                # Atlanan kare çözülmeden geçilir
+                if not cap.grab():
+                    break
+                index += 1
+                continue
+
+            ret, frame = cap.read()
+            if not ret:
+                break
+
+            time_sec = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+            if time_sec <= 0 and fps > 0:
+                time_sec = index / fps
+
+            # Kuyruk doluysa bekler (çevrimdışı işlemde kare atılmaz)
+            frames.put((index, time_sec, frame))
+            index += 1
+            sent += 1
+            if max_frames and sent >= max_frames:
+                break
+    finally:
+        frames.put(None)
+
+def encode_loop(writer, items, errors):
+    """Kodlayıcı iş parçacığı: sonuçları kareye çizer ve videoya yazar.
+
+    Hata olursa istisna errors listesine eklenir ve iş parçacığı sonlanır.
+    """
+    try:
+        while True:
+            item = items.get()
+            if item is None:
+                return
+            frame, results = item
+            writer.write(face_pipeline.draw_results(frame, results))
+    except Exception as e:
+        errors.append(e)
+
+def put_alive(items, item, thread, timeout=0.1):
+    """Kuyruğa ekler; tüketen iş parçacığı sonlanmışsa beklemeden False döndürür."""
+    while thread.is_alive():
+        try:
+            items.put(item, timeout=timeout)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+def open_writer(path, fps, size):
+    """Uzantıya uygun codec ile VideoWriter açar."""
+    extension = path[path.rfind("."):].lower() if "." in path else ""
+    fourcc = cv2.VideoWriter_fourcc(*VIDEO_CODECS.get(extension, "MJPG"))
+    writer = cv2.VideoWriter(path, fourcc, fps, size)
+    if not writer.isOpened():
+        raise RuntimeError(f"Çıktı videosu açılamadı: {path}")
+    return writer
+
+def process_video(path, timeline_path=None, video_path=None, stride=5, skip=1, eyes=False, smiles=False,
+                  min_score=0.6, queue_size=8, max_frames=None, cascade_dir=face_core.CASCADE_DIR):
+    """Video dosyasında yüz tespiti yapar; zaman çizelgesini ve isteğe bağlı videoyu yazar.
+
+    İstatistik sözlüğü döndürür (gerçek zaman oranı dahil).
+    """
+    if timeline_path and timeline_path.lower().endswith(".parquet") and pyarrow is None:
+        # Tüm video işlendikten sonra değil, başta bildir
+        raise RuntimeError("Parquet çıktısı için pyarrow kurulmalıdır: pip install pyarrow")
+
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Video açılamadı: {path}")
+
+    fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+    size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+
+    tracker = face_tracking.FaceTracker(face_core.load_cascade("face", cascade_dir), detect_every=stride,
+                                        min_score=min_score, eyes=eyes, smiles=smiles, cascade_dir=cascade_dir)
+    timeline = Timeline()
+
+    writer = None
+    if video_path:
+        # Atlanan kareler yazılmadığından süre korunsun diye FPS düşürülür
+        writer = open_writer(video_path, fps / skip, size)
+
+    frames = queue.Queue(maxsize=queue_size)
+    encode_items = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    encode_errors = []
+
+    decoder = threading.Thread(target=decode_loop, args=(cap, frames, stop, skip, max_frames), daemon=True)
+    encoder = None
+    if writer:
+        encoder = threading.Thread(target=encode_loop, args=(writer, encode_items, encode_errors), daemon=True)
+
+    start_time = time.perf_counter()
+    detect_time = 0.0
+    last_time = 0.0
+    decoder.start()
+    if encoder:
+        encoder.start()
+
+    try:
+        while True:
+            item = frames.get()
+            if item is None:
+                break
+            index, time_sec, frame = item
+
+            t0 = time.perf_counter()
+            detections_before = tracker.stats["detections"]
+            results = tracker.update(frame)
+            detect_time += time.perf_counter() - t0
+
+            timeline.add(index, time_sec, tracker.stats["detections"] > detections_before,
+                         [face for face, _, _ in results])
+            last_time = time_sec
+
+            # Kodlayıcı hata ile sonlandıysa dolu kuyrukta sonsuza kadar beklenmez
+            if encoder and not put_alive(encode_items, (frame, results), encoder):
+                break
+    finally:
+        stop.set()
+        # Çözme iş parçacığı dolu kuyrukta bekliyorsa serbest kalsın
+        while decoder.is_alive():
+            try:
+                frames.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        cap.release()
+
+        if encoder:
+            put_alive(encode_items, None, encoder)
+            encoder.join()
+            writer.release()
+
+    if encode_errors:
+        raise RuntimeError(f"Çıktı videosu yazılamadı: {encode_errors[0]}")
+
+    elapsed = time.perf_counter() - start_time
+
+    if timeline_path:
+        timeline.save(timeline_path)
+
+    # Video süresi: son işlenen karenin zamanı + bir kare
+    duration = last_time + skip / fps if len(timeline) else 0.0
+
+    return {
+        "frames": len(timeline),
+        "detections": tracker.stats["detections"],
+        "lost": tracker.stats["lost"],
+        "faces": len(timeline.boxes),
+        "elapsed": elapsed,
+        "detect_time": detect_time,
+        "duration": duration,
+        "realtime_factor": duration / elapsed if elapsed > 0 else 0.0,
+    }
+
+def parse_args(argv=None):
+    """Komut satırı argümanlarını ayrıştırır."""
+    parser = argparse.ArgumentParser(description="Video dosyasında yüz tespiti")
+    parser.add_argument("input", help="Video dosyası")
+    parser.add_argument("-o", "--output", default="faces_timeline.npz",
+                        help="Zaman çizelgesi dosyası (.npz veya .parquet)")
+    parser.add_argument("--video", default=None, help="İşaretlenmiş çıktı videosu (.avi veya .mp4)")
+    parser.add_argument("--stride", type=int, default=5,
+                        help="İşlenen karelerde kaç karede bir tam tespit yapılacağı (arada takip)")
+    parser.add_argument("--skip", type=int, default=1, help="Yalnızca her K. kareyi işle")
+    parser.add_argument("--min-score", type=float, default=0.6,
+                        help="Takip skoru bunun altına düşerse hemen yeniden tespit yapılır")
+    parser.add_argument("--eyes", action="store_true", help="Göz tespiti de yap (yalnızca çıktı videosunda)")
+    parser.add_argument("--smiles", action="store_true", help="Gülümseme tespiti de yap (yalnızca çıktı videosunda)")
+    parser.add_argument("--queue-size", type=int, default=8, help="Çözme ve kodlama kuyruklarının boyutu")
+    parser.add_argument("--max-frames", type=int, default=None, help="İşlenecek en fazla kare")
+    parser.add_argument("--cascade-dir", default=face_core.CASCADE_DIR, help="Cascade XML klasörü")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("Video Dosyasında Yüz Tespiti")
+    print("-" * 20)
+
+    try:
+        stats = process_video(args.input, args.output, args.video, stride=max(1, args.stride),
+                              skip=max(1, args.skip), eyes=args.eyes, smiles=args.smiles,
+                              min_score=args.min_score, queue_size=args.queue_size,
+                              max_frames=args.max_frames, cascade_dir=args.cascade_dir)
+    except RuntimeError as e:
+        print(f"Hata: {e}")
+        return 1
+
+    frames = stats["frames"] or 1
+    print(f"{stats['frames']} kare işlendi, {stats['detections']} tam tespit, "
+          f"{stats['lost']} takip kaybı, {stats['faces']} yüz kutusu")
+    print(f"Süre: {stats['elapsed']:.2f} sn ({stats['frames'] / max(stats['elapsed'], 1e-9):.1f} kare/sn, "
+          f"tespit+takip {stats['detect_time'] / frames * 1000:.1f} ms/kare)")
+    print(f"Video süresi: {stats['duration']:.2f} sn -> gerçek zaman oranı: {stats['realtime_factor']:.2f}x")
+    print(f"Zaman çizelgesi kaydedildi: {args.output}")
+    if args.video:
+        print(f"Çıktı videosu kaydedildi: {args.video}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Otomatik Ön İşleme Seçimi
+-------------------------
+11 ön işleme yöntemi arasından deneme yanılma ile seçim yapmak yerine:
+- Aday ön işleme hatları (otsu, adaptive_threshold, bilateral + otsu, ...) sayfanın
+  küçültülmüş kopyası üzerinde aynı anda çalıştırılır
+- Her aday ucuz bir kalite puanı alır:
+  * "components": bağlantılı bileşenlerden karakter benzeri olanların oranı ve sayısı (OCR yok)
+  * "confidence": örnek metin bölgelerinde Tesseract'ın ortalama güven değeri
+- Süre sınırı (budget) aşılırsa yalnızca biten adaylar arasından seçim yapılır
+- Kazanan hat tam çözünürlüklü sayfaya uygulanır
+
+AutoSelector seçimini saklar; böylece arama maliyeti her sayfa için değil, her belge
+grubu (toplu işlem) için bir kez ödenir.
+"""
+
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import cv2
+import numpy as np
+
+import ocr_layout
+import ocr_pipeline
+import ocr_preview
+import ocr_worker
+
+# GUI ve toplu işlemde otomatik seçimi belirten yöntem adı
+AUTO_METHOD = "auto"
+
+# Aday hatlar: ad -> aşama listesi (ucuzdan pahalıya; eşit puanda öndeki seçilir)
+CANDIDATES = (
+    ("otsu", [("otsu", {})]),
+    ("gaussian_otsu", [("gaussian_blur", {"ksize": 5}), ("otsu", {})]),
+    ("adaptive_threshold", [("adaptive_threshold", {"block_size": 15, "c": 11})]),
+    ("otsu_opening", [("otsu", {}), ("opening", {"ksize": 3})]),
+    ("otsu_closing", [("otsu", {}), ("closing", {"ksize": 3})]),
+    ("bilateral_otsu", [("bilateral_filter", {"d": 9}), ("otsu", {})]),
+    ("bilateral_adaptive", [("bilateral_filter", {"d": 9}), ("adaptive_threshold", {"block_size": 15, "c": 11})]),
+)
+
+# Küçültülmüş kopyada ölçeklenecek çekirdek parametreleri
+KERNEL_PARAMS = ("ksize", "d", "block_size")
+
+# Aday değerlendirmede sayfanın küçültüleceği en uzun kenar
+SAMPLE_SIDE = 1200
+
+def scale_stages(stages, scale):
+    """Aşamaların çekirdek boyutlarını küçültülmüş kopyanın ölçeğine göre ayarlar."""
+    if scale >= 1.0:
+        return stages
+
+    scaled = []
+    for name, params in stages:
+        params = dict(params)
+        for key in KERNEL_PARAMS:
+            if key in params:
+                params[key] = max(3, ocr_pipeline.make_odd(round(params[key] * scale)))
+        scaled.append((name, params))
+    return scaled
+
+def _binarize(image):
+    """Gri görüntüyü Otsu ile ikili hale getirir (zaten ikiliyse aynen döner)."""
+    if len(image.shape) == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    if np.count_nonzero((image != 0) & (image != 255)) == 0:
+        return image
+    _, binary = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
+def component_score(image):
+    """Bağlantılı bileşenlerden metin kalitesi puanı hesaplar (yüksek daha iyi).
+
+    Karakter benzeri bileşenlerin (makul yükseklik, en-boy oranı ve doluluk) oranı,
+    sayılarının logaritmasıyla çarpılır: gürültü noktaları ve birbirine yapışmış
+    büyük lekeler puanı düşürür.
+    """
+    binary = _binarize(image)
+
+    # Mürekkep (metin) pikselleri azınlıkta olan renktir
+    ink = (binary < 128).astype(np.uint8)
+    if ink.mean() > 0.5:
+        ink = 1 - ink
+
+    _, _, stats, _ = cv2.connectedComponentsWithStats(ink, connectivity=8)
+    stats = stats[1:]  # Arka plan bileşenini at
+    if not len(stats):
+        return 0.0
+
+    w, h, area = stats[:, cv2.CC_STAT_WIDTH], stats[:, cv2.CC_STAT_HEIGHT], stats[:, cv2.CC_STAT_AREA]
+    max_height = max(8, binary.shape[0] // 10)
+
+    char_like = (
+        (h >= 5) & (h <= max_height)
+        & (w <= h * 3) & (h <= w * 8)
+        & (area >= 0.1 * w * h)
+    )
+    good = int(char_like.sum())
+    return good / len(stats) * math.log1p(good)
+
+def sample_regions(image, count=3):
+    """OCR puanlaması için sayfadaki en büyük birkaç metin bölgesini seçer."""
+    regions = ocr_layout.detect_text_regions(image)
+    regions = sorted(regions, key=lambda r: r[2] * r[3], reverse=True)[:count]
+    return regions or [(0, 0, image.shape[1], image.shape[0])]
+
+def confidence_score(image, regions, lang="eng", stop=None):
+    """Örnek bölgelerde Tesseract'ın kelime sayısıyla ağırlıklı ortalama güven değeri.
+
+    stop (threading.Event) ayarlanırsa kalan bölgeler OCR'lanmadan None döner.
+    """
+    total, words = 0.0, 0
+    for x, y, w, h in regions:
+        if stop is not None and stop.is_set():
+            return None
+        result = ocr_worker.recognize_data(image[y:y + h, x:x + w], lang=lang, config=ocr_layout.REGION_CONFIG)
+        total += result.mean_confidence * len(result)
+        words += len(result)
+    return total / words if words else 0.0
+
+def select_preprocessing(image, candidates=CANDIDATES, scoring="components", lang="eng",
+                         budget=5.0, workers=None, sample_side=SAMPLE_SIDE):
+    """Adayları küçültülmüş sayfada paralel puanlar ve en iyisini seçer.
+
+    Sözlük döndürür: name (kazanan), stages (tam çözünürlük için aşamalar),
+    scores (ad -> puan), skipped (süre sınırında bitmeyenler), elapsed (saniye).
+    """
+    start_time = time.perf_counter()
+    proxy, scale = ocr_preview.make_proxy(image, sample_side)
+
+    # Tüm adaylar gri dönüşümü paylaşsın
+    cache = ocr_pipeline.StageCache()
+    regions = sample_regions(proxy) if scoring == "confidence" else None
+
+    # Süre sınırı dolunca ayarlanır; çalışmakta olan adaylar bir sonraki adımdan önce durur
+    stop = threading.Event()
+
+    def evaluate(stages):
+        if stop.is_set():
+            return None
+        processed = ocr_pipeline.Pipeline(scale_stages(stages, scale), cache=cache).run(proxy)
+        if stop.is_set():
+            return None
+        if scoring == "confidence":
+            return confidence_score(processed, regions, lang, stop)
+        return component_score(processed)
+
+    executor = ThreadPoolExecutor(max_workers=workers or len(candidates))
+    futures = {executor.submit(evaluate, stages): name for name, stages in candidates}
+    done, not_done = wait(futures, timeout=budget)
+
+    # Süre sınırını aşan adayları bekleme: başlamamış olanlar iptal edilir, çalışanlar
+    # stop ile durdurulur (başlamış tek bir Tesseract çağrısı yine de tamamlanır)
+    stop.set()
+    for future in not_done:
+        future.cancel()
+    executor.shutdown(wait=False)
+
+    scores = {}
+    for future in done:
+        try:
+            score = future.result()
+        except Exception as e:
+            print(f"Aday değerlendirilemedi ({futures[future]}): {e}")
+            continue
+        if score is not None:
+            scores[futures[future]] = score
+
+    # Hiçbir aday bitmediyse ilk (en ucuz) aday kullanılır
+    order = [name for name, _ in candidates]
+    name = max(scores, key=lambda n: (scores[n], -order.index(n))) if scores else order[0]
+
+    return {
+        "name": name,
+        "stages": dict(candidates)[name],
+        "scores": {n: round(scores[n], 4) for n in order if n in scores},
+        "skipped": [n for n in order if n not in scores],
+        "elapsed": round(time.perf_counter() - start_time, 4),
+    }
+
+class AutoSelector:
+    """Seçimi bir kez yapıp belge grubu boyunca saklayan otomatik seçici (iş parçacığı güvenli)."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs  # select_preprocessing parametreleri
+        self.selection = None
+        self._lock = threading.Lock()
+
+    def select(self, image):
+        """İlk çağrıda seçim yapar; sonraki çağrılarda saklanan seçimi döndürür."""
+        with self._lock:
+            if self.selection is None:
+                self.selection = select_preprocessing(image, **self.kwargs)
+            return self.selection
+
+    def reset(self):
+        """Saklanan seçimi siler (yeni belge grubu)."""
+        with self._lock:
+            self.selection = None
@@ -0,0 +1,379 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Toplu (Headless) OCR
+--------------------
+Bu script, GUI açmadan çok sayıda görüntüye OCR uygular:
+- Klasör, dosya veya glob deseni ile girdi seçimi
+- Çok sayfalı TIFF/PDF belgeleri sayfa sayfa çözerek işleme (ocr_pages.py) ve
+  çökme sonrası kaldığı sayfadan devam etme (--resume, --start-page)
+- 09_ocr.py ile aynı ön işleme yöntemleri veya JSON ile tanımlanmış çok aşamalı hat
+- Otomatik ön işleme seçimi: adaylar ilk sayfada bir kez puanlanır, kazanan tüm gruba uygulanır
+- Tesseract çağrılarını süreç havuzuna (process pool) dağıtma
+- Her işçi süreçte dil verisi bir kez yüklenen kalıcı Tesseract motorları
+- Daha önce işlenmiş sayfalar için disk önbelleği (ocr_cache.py)
+- Çok büyük taramalar için şerit şerit ön işleme (ocr_tiling.py)
+- İsteğe bağlı bölge tespiti ve bölge bazlı paralel OCR (ocr_layout.py)
+- Sınırlı kuyruk ile bellek kullanımını kontrol altında tutma (kuyruk doluyken yeni sayfa çözülmez)
+- Sonuçları (metin, kelime kutuları, güven değerleri) sayfa sayfa JSONL ve
+  isteğe bağlı Parquet dosyasına yazma ve sayfa/saniye raporu
+
+Kullanım:
+    python ocr_batch.py ../images/*.png -o sonuclar.jsonl --method otsu --workers 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import cv2
+
+import batch_inputs
+import ocr_auto
+import ocr_cache
+import ocr_core
+import ocr_layout
+import ocr_pages
+import ocr_pipeline
+import ocr_tiling
+import ocr_worker
+from ocr_result import OCRResult, ParquetWordWriter
+
+# Girdi olarak kabul edilen görüntü uzantıları
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".pdf")
+
+# İşçi süreç başına açılan önbellek bağlantısı
+_cache = None
+
+def get_cache(path):
+    """Bu süreç için önbellek bağlantısını döndürür (yoksa açar)."""
+    global _cache
+    if _cache is None:
+        _cache = ocr_cache.OCRCache(path)
+    return _cache
+
+def preprocess_page(image, options):
+    """Sayfaya seçilen ön işleme yöntemini veya hattını uygular."""
+    if options.get("pipeline"):
+        # JSON dosyasından yüklenen çok aşamalı hat
+        pipeline = ocr_pipeline.Pipeline.from_list(options["pipeline"])
+    else:
+        pipeline = ocr_pipeline.Pipeline.from_method(
+            options["method"], options["threshold"], options["blur"], options["morph"]
+        )
+
+    tile_rows = options.get("tile_rows")
+    if tile_rows and image.shape[0] > tile_rows:
+        # Büyük görüntüleri şeritler halinde işle (ara kopyalar şerit boyutunda kalır)
+        return ocr_tiling.run_tiled(pipeline, image, tile_rows, workers=options.get("tile_workers", 1))
+    return pipeline.run(image)
+
+def recognize_page(processed, options):
+    """İşlenmiş sayfaya OCR uygular; (sonuç alanları sözlüğü, OCRResult) döndürür."""
+    lang = options["lang"]
+
+    if options.get("layout"):
+        # Önce metin bölgelerini bul, bölgeleri paralel tanı
+        config = options["config"] or ocr_layout.REGION_CONFIG
+        cache_config = "layout-data " + config
+
+        def compute(img):
+            regions, result = ocr_layout.ocr_page_layout_data(
+                img, lambda crop: ocr_worker.recognize_data(crop, lang=lang, config=config),
+                workers=options.get("region_workers")
+            )
+            return json.dumps({"regions": regions, "result": result.to_dict()}, ensure_ascii=False)
+    else:
+        # İşçi süreç boyunca açık tutulan Tesseract motorunu kullan
+        cache_config = "data " + options["config"]
+
+        def compute(img):
+            result = ocr_worker.recognize_data(img, lang=lang, config=options["config"])
+            return json.dumps({"result": result.to_dict()}, ensure_ascii=False)
+
+    if options.get("cache"):
+        payload, cached = get_cache(options["cache"]).get_or_compute(processed, lang, cache_config, compute)
+    else:
+        payload, cached = compute(processed), False
+
+    data = json.loads(payload)
+    result = OCRResult.from_dict(data["result"])
+    fields = {
+        "text": result.text,
+        "mean_conf": round(result.mean_confidence, 2),
+        "words": result.to_records(),
+        "cached": cached,
+    }
+    if "regions" in data:
+        fields["regions"] = data["regions"]
+    return fields, result
+
+def iter_tasks(paths, start_page=0, done=()):
+    """İşlenecek sayfaları (yol, sayfa, görüntü) olarak sırayla üretir.
+
+    Tek sayfalı görüntüler işçi süreçte okunur (görüntü None). Çok sayfalı belgelerin
+    sayfaları burada tek tek çözülür; üreteç yalnızca kuyrukta yer açıldığında ilerler.
+    done içindeki (yol, sayfa) çiftleri çözülmeden atlanır. start_page yalnızca çok sayfalı
+    belgelere uygulanır; tek sayfalı görüntüler (ve tek sayfalı TIFF'ler) her zaman işlenir.
+    Bir belge okunamazsa görüntü yerine hata nesnesi üretilir.
+    """
+    done_pages = {}
+    for path, page in done:
+        done_pages.setdefault(path, set()).add(page)
+
+    for path in paths:
+        skip = done_pages.get(path, set())
+
+        if not ocr_pages.is_multipage(path):
+            if 0 not in skip:
+                yield path, 0, None
+            continue
+
+        next_page = start_page
+        try:
+            start = start_page if start_page and ocr_pages.page_count(path) > 1 else 0
+            next_page = start
+            for page, image in ocr_pages.iter_pages(path, start=start, skip=skip):
+                yield path, page, image
+                next_page = page + 1
+        except Exception as e:
+            yield path, next_page, e
+
+def load_done_pages(output_path):
+    """Önceki çalıştırmanın JSONL çıktısından hatasız işlenmiş (yol, sayfa) çiftlerini okur."""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Çökme sırasında yarım yazılmış son satır
+            if not record.get("error"):
+                done.add((record["path"], record.get("page", 0)))
+    return done
+
+def process_page(path, options, page=0, image=None):
+    """Tek bir sayfayı ön işler ve OCR uygular (işçi süreçte çalışır).
+
+    image verilmezse görüntü path'ten okunur.
+    """
+    start_time = time.perf_counter()
+    record = {"path": path, "page": page}
+
+    try:
+        if image is None:
+            image = cv2.imread(path)
+        if image is None:
+            raise ValueError("Görüntü okunamadı")
+
+        fields, result = recognize_page(preprocess_page(image, options), options)
+        record.update(fields)
+        record["error"] = None
+
+        # Parquet yazımı için ana sürece gönderilir, JSONL'e yazılmaz
+        record["_result"] = result
+    except Exception as e:
+        record["text"] = None
+        record["cached"] = False
+        record["error"] = str(e)
+
+    record["elapsed"] = round(time.perf_counter() - start_time, 4)
+    return record
+
+def run_batch(paths, output_path, options, workers=None, queue_size=None, progress_every=25,
+              parquet_path=None, start_page=0, done=(), append=False):
+    """Görüntüleri süreç havuzunda işler ve sonuçları JSONL (isteğe bağlı Parquet) dosyasına yazar.
+
+    Çok sayfalı belgeler sayfa sayfa işlenir; done içindeki (yol, sayfa) çiftleri atlanır.
+    append False ise çıktı dosyası baştan yazılır (aynı kayıtlar iki kez eklenmez).
+    """
+    workers = workers or os.cpu_count() or 1
+
+    # Aynı anda bekleyen iş sayısı sınırı (bellekte tutulan görev sayısını sınırlar)
+    queue_size = queue_size or workers * 2
+
+    stats = {"pages": 0, "errors": 0, "cached": 0, "elapsed": 0.0, "pages_per_sec": 0.0}
+    start_time = time.perf_counter()
+
+    parquet = ParquetWordWriter(parquet_path) if parquet_path else None
+
+    with open(output_path, "a" if append else "w", encoding="utf-8") as out, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        task_iter = iter_tasks(paths, start_page, done)
+        pending = set()
+
+        def write_record(record):
+            """Sonucu hemen diske yaz (çökme durumunda önceki sayfalar kaybolmaz)."""
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+
+            stats["pages"] += 1
+            if record["error"]:
+                stats["errors"] += 1
+            if record["cached"]:
+                stats["cached"] += 1
+
+            if progress_every and stats["pages"] % progress_every == 0:
+                elapsed = time.perf_counter() - start_time
+                print(f"{stats['pages']} sayfa - {stats['pages'] / elapsed:.2f} sayfa/sn")
+
+        def fill_queue():
+            """Kuyruk dolana kadar yeni görev gönderir (sonraki sayfa ancak o zaman çözülür)."""
+            while len(pending) < queue_size:
+                task = next(task_iter, None)
+                if task is None:
+                    return
+
+                path, page, image = task
+                if isinstance(image, Exception):
+                    write_record({"path": path, "page": page, "text": None, "cached": False,
+                                  "error": str(image), "elapsed": 0.0})
+                    continue
+                pending.add(executor.submit(process_page, path, options, page, image))
+
+        fill_queue()
+
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in finished:
+                pending.discard(future)
+                record = future.result()
+                result = record.pop("_result", None)
+                if parquet is not None and result is not None:
+                    parquet.write(result, path=record["path"], page=record["page"])
+
+                write_record(record)
+
+            fill_queue()
+
+    if parquet is not None:
+        parquet.close()
+
+    stats["elapsed"] = time.perf_counter() - start_time
+    if stats["elapsed"] > 0:
+        stats["pages_per_sec"] = stats["pages"] / stats["elapsed"]
+
+    return stats
+
+def select_auto_pipeline(paths, scoring="components", lang="eng", budget=5.0):
+    """Okunabilen ilk sayfada otomatik seçim yapar; seçimi (tüm grup için) döndürür."""
+    selector = ocr_auto.AutoSelector(scoring=scoring, lang=lang, budget=budget)
+
+    for path in paths:
+        try:
+            image = ocr_pages.read_page(path)
+        except Exception:
+            continue
+        if image is not None:
+            return selector.select(image)
+
+    return None
+
+def parse_args(argv=None):
+    """Komut satırı argümanlarını ayrıştırır."""
+    parser = argparse.ArgumentParser(description="Toplu (headless) OCR")
+    parser.add_argument("inputs", nargs="+", help="Görüntü dosyaları, klasörler veya glob desenleri")
+    parser.add_argument("-o", "--output", default="ocr_results.jsonl", help="JSONL çıktı dosyası")
+    parser.add_argument("--method", default="basic",
+                        choices=ocr_core.PREPROCESS_METHODS + (ocr_auto.AUTO_METHOD,),
+                        help="Ön işleme yöntemi (auto: adaylar arasından otomatik seçim)")
+    parser.add_argument("--auto-scoring", default="components", choices=("components", "confidence"),
+                        help="Otomatik seçimde puanlama: bağlantılı bileşenler veya OCR güven değeri")
+    parser.add_argument("--auto-budget", type=float, default=5.0,
+                        help="Otomatik seçim için süre sınırı (saniye)")
+    parser.add_argument("--parquet", default=None,
+                        help="Kelime kutularını ve güven değerlerini ayrıca bu Parquet dosyasına yaz")
+    parser.add_argument("--pipeline", default=None,
+                        help="Ön işleme hattı JSON dosyası (verilirse --method yerine kullanılır)")
+    parser.add_argument("--threshold", type=int, default=127, help="Eşik değeri")
+    parser.add_argument("--blur", type=int, default=5, help="Bulanıklaştırma boyutu")
+    parser.add_argument("--morph", type=int, default=3, help="Morfolojik işlem boyutu")
+    parser.add_argument("--tile-rows", type=int, default=0,
+                        help="Bu yükseklikten büyük görüntüleri şeritler halinde işle (0: kapalı)")
+    parser.add_argument("--tile-workers", type=int, default=1, help="Süreç başına paralel şerit sayısı")
+    parser.add_argument("--layout", action="store_true",
+                        help="Önce metin bölgelerini bul, bölgeleri ayrı ayrı tanı (sonuçta koordinatlar da yer alır)")
+    parser.add_argument("--region-workers", type=int, default=1,
+                        help="Sayfa başına aynı anda tanınan bölge sayısı")
+    parser.add_argument("--lang", default="eng", help="Tesseract dili (ör. eng, tur, eng+tur)")
+    parser.add_argument("--config", default="", help="Ek Tesseract parametreleri")
+    parser.add_argument("--cache", default=ocr_cache.DEFAULT_CACHE_PATH, help="OCR önbellek dosyası")
+    parser.add_argument("--no-cache", action="store_true", help="Önbelleği kullanma")
+    parser.add_argument("--start-page", type=int, default=0,
+                        help="Çok sayfalı belgelerde bu sayfa indeksinden başla (0'dan başlar); "
+                             "tek sayfalı görüntüler her zaman işlenir")
+    parser.add_argument("--resume", action="store_true",
+                        help="Çıktı dosyasında hatasız kaydı olan sayfaları atla (çökme sonrası devam)")
+    parser.add_argument("--workers", type=int, default=None, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--queue-size", type=int, default=None,
+                        help="Aynı anda bekleyen en fazla görev (varsayılan: 2 x işçi)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("Toplu OCR")
+    print("-" * 20)
+
+    paths = batch_inputs.collect_inputs(args.inputs, IMAGE_EXTENSIONS)
+    if not paths:
+        print("Hata: İşlenecek görüntü bulunamadı!")
+        return 1
+
+    pipeline = None
+    if args.pipeline:
+        with open(args.pipeline, encoding="utf-8") as f:
+            pipeline = ocr_pipeline.Pipeline.from_json(f.read()).to_list()
+    elif args.method == ocr_auto.AUTO_METHOD:
+        # Arama maliyeti sayfa başına değil, grup başına bir kez ödenir
+        selection = select_auto_pipeline(paths, args.auto_scoring, args.lang, args.auto_budget)
+        if selection is None:
+            print("Hata: Otomatik seçim için okunabilen görüntü yok!")
+            return 1
+
+        pipeline = ocr_pipeline.Pipeline(selection["stages"]).to_list()
+        print(f"Otomatik seçim: {selection['name']} ({selection['elapsed']:.2f} saniye)")
+        for name, score in selection["scores"].items():
+            print(f"  {name}: {score}")
+        if selection["skipped"]:
+            print(f"  Süre sınırında bitmeyen: {', '.join(selection['skipped'])}")
+
+    options = {
+        "pipeline": pipeline,
+        "method": args.method,
+        "threshold": args.threshold,
+        "blur": args.blur,
+        "morph": args.morph,
+        "tile_rows": args.tile_rows,
+        "tile_workers": args.tile_workers,
+        "layout": args.layout,
+        "region_workers": args.region_workers,
+        "lang": args.lang,
+        "config": args.config,
+        "cache": None if args.no_cache else args.cache,
+    }
+
+    done = set()
+    if args.resume:
+        done = load_done_pages(args.output)
+        print(f"Devam: {len(done)} sayfa daha önce işlenmiş, atlanacak")
+
+    print(f"{len(paths)} dosya işlenecek -> {args.output}")
+    stats = run_batch(paths, args.output, options, workers=args.workers, queue_size=args.queue_size,
+                      parquet_path=args.parquet, start_page=args.start_page, done=done,
+                      append=args.resume)
+
+    print(f"\nToplam: {stats['pages']} sayfa ({stats['cached']} önbellekten), {stats['errors']} hata, "
+          f"{stats['elapsed']:.2f} saniye ({stats['pages_per_sec']:.2f} sayfa/sn)")
+    return 0 if stats["errors"] == 0 else 2
+
+if __name__ == "__main__":
+    sys.exit(main())
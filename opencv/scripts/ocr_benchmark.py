@@ -0,0 +1,432 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+OCR Performans Ölçümü
+---------------------
+Bu script, OCR performansını iki şekilde ölçer:
+
+1. Gecikme karşılaştırması: küçük metin görüntülerinde görüntü başına OCR gecikmesi
+   - Mevcut yol: her çağrıda yeni `tesseract` süreci (pytesseract.image_to_string)
+   - Kalıcı işçi: dil verisi bir kez yüklenen OCRWorkerPool
+
+2. Performans takımı (--suite): tekrarlanabilir sentetik belge derlemi üzerinde
+   - Farklı sayfa boyutları, yazı tipleri, gürültü seviyeleri (06_filtering.py) ve diller
+   - Her ön işleme yöntemi + OCR için sayfa/saniye, p50/p95 gecikme,
+     en yüksek bellek kullanımı (RSS; her yöntem ayrı süreçte ölçülür) ve karakter doğruluğu
+   - Sonuçlar JSON olarak kaydedilip önceki bir çalıştırmayla karşılaştırılabilir
+     (performans gerilemelerini yakalamak için)
+
+Kullanım:
+    python ocr_benchmark.py --count 50 --lang eng
+    python ocr_benchmark.py --suite --sizes small,medium --json sonuc.json
+    python ocr_benchmark.py --suite --compare onceki.json
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import numpy as np
+
+import ocr_auto
+import ocr_core
+import ocr_pipeline
+import ocr_worker
+
+try:
+    import resource
+except ImportError:
+    # Windows'ta resource modülü yoktur
+    resource = None
+
+# Gürültü fonksiyonları 06_filtering.py'den alınır (dosya adı rakamla başladığı için importlib)
+filtering = importlib.import_module("06_filtering")
+
+# Örnek metin satırları
+SAMPLE_LINES = (
+    "OpenCV ve Tesseract",
+    "Fatura No: 2025-0042",
+    "Toplam Tutar 1234.56",
+    "Build With AI",
+    "Rakamlar 0123456789",
+)
+
+def make_text_crop(text, font_scale=1.0, thickness=2):
+    """Tek satırlık metin içeren küçük bir görüntü oluşturur."""
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    (text_w, text_h), baseline = cv2.getTextSize(text, font, font_scale, thickness)
+
+    img = np.ones((text_h + baseline + 20, text_w + 20), dtype=np.uint8) * 255
+    cv2.putText(img, text, (10, text_h + 10), font, font_scale, 0, thickness)
+    return img
+
+def measure(fn, images):
+    """Her görüntü için fonksiyonun çalışma süresini (ms) ölçer."""
+    latencies = []
+    for image in images:
+        start_time = time.perf_counter()
+        fn(image)
+        latencies.append((time.perf_counter() - start_time) * 1000)
+    return np.array(latencies)
+
+def summarize(name, latencies):
+    """Gecikme istatistiklerini yazdırır."""
+    print(f"{name:<28} ortalama={latencies.mean():7.1f} ms  "
+          f"p50={np.percentile(latencies, 50):7.1f} ms  "
+          f"p95={np.percentile(latencies, 95):7.1f} ms")
+
+def run_latency_benchmark(count=50, lang="eng"):
+    """Mevcut yol ile kalıcı işçi havuzunun görüntü başına gecikmesini karşılaştırır."""
+    images = [make_text_crop(SAMPLE_LINES[i % len(SAMPLE_LINES)]) for i in range(count)]
+
+    # 1. Mevcut yol: her çağrıda yeni süreç
+    baseline = measure(lambda img: ocr_core.image_to_text(img, lang=lang), images)
+    summarize("pytesseract (süreç/çağrı)", baseline)
+
+    # 2. Kalıcı işçi havuzu
+    if not ocr_worker.HAS_PERSISTENT_ENGINE:
+        print("Uyarı: tesserocr kurulu değil, işçiler de pytesseract kullanacak.")
+
+    with ocr_worker.OCRWorkerPool(workers=1, preload=(lang,)) as pool:
+        # Isınma: ilk çağrı ölçüme dahil edilmez
+        pool.recognize(images[0], lang=lang)
+        persistent = measure(lambda img: pool.recognize(img, lang=lang), images)
+    summarize("OCRWorkerPool (kalıcı)", persistent)
+
+    print(f"Hızlanma (ortalama): {baseline.mean() / persistent.mean():.2f}x")
+    return baseline, persistent
+
+# Sentetik derlem ayarları
+# Sayfa boyutları: ad -> (genişlik, yükseklik, yazı ölçeği)
+PAGE_SIZES = {
+    "small": (800, 600, 0.8),
+    "medium": (1240, 1754, 1.4),
+    "large": (2480, 3508, 2.8),
+}
+
+# OpenCV'nin Hershey yazı tipleri
+FONTS = {
+    "simplex": cv2.FONT_HERSHEY_SIMPLEX,
+    "duplex": cv2.FONT_HERSHEY_DUPLEX,
+    "complex": cv2.FONT_HERSHEY_COMPLEX,
+    "triplex": cv2.FONT_HERSHEY_TRIPLEX,
+}
+
+# Gürültü seviyeleri: ad -> gürültü fonksiyonu
+NOISE_LEVELS = {
+    "clean": None,
+    "gaussian": lambda img: filtering.add_gaussian_noise(img, sigma=30),
+    "salt_pepper": lambda img: filtering.add_salt_pepper_noise(img, 0.02, 0.02),
+}
+
+# Dillere göre metin havuzu. Hershey yazı tipleri yalnızca ASCII çizebildiği için
+# Türkçe metin özel karakterler olmadan yazılır.
+CORPUS_TEXT = {
+    "eng": (
+        "The quick brown fox jumps over the lazy dog. Invoice number 2025-0042 "
+        "was paid on time. Total amount due is 1234.56 dollars. Please keep this "
+        "document for your records and contact support with any questions."
+    ),
+    "tur": (
+        "Bu belge OpenCV ve Tesseract ile olusturulmustur. Fatura numarasi 2025-0042 "
+        "olan odeme zamaninda yapildi. Toplam tutar 1234.56 liradir. Sorulariniz icin "
+        "destek ekibimizle iletisime gecebilirsiniz."
+    ),
+}
+
+def make_document(lang="eng", size="small", font="simplex", noise="clean", seed=0):
+    """Sentetik bir metin sayfası oluşturur; (gri görüntü, doğru metin) döndürür.
+
+    Aynı parametreler ve seed ile her zaman aynı sayfa üretilir.
+    """
+    width, height, font_scale = PAGE_SIZES[size]
+    font_face = FONTS[font]
+    thickness = max(1, int(round(font_scale * 1.5)))
+    margin = int(width * 0.05)
+
+    rng = np.random.default_rng(seed)
+    words = CORPUS_TEXT[lang].split()
+    # Her sayfa metin havuzunun farklı bir yerinden başlar
+    start = int(rng.integers(len(words)))
+    word_iter = itertools.cycle(words[start:] + words[:start])
+
+    (_, text_h), baseline = cv2.getTextSize("Ag", font_face, font_scale, thickness)
+    line_height = int((text_h + baseline) * 1.8)
+
+    img = np.full((height, width), 255, dtype=np.uint8)
+    lines = []
+    y = margin + text_h
+    word = next(word_iter)
+
+    while y + baseline < height - margin:
+        # Satırı genişliğe sığan kelimelerle doldur; sığmayan kelime sonraki satıra geçer
+        line = word
+        while True:
+            word = next(word_iter)
+            candidate = f"{line} {word}"
+            if cv2.getTextSize(candidate, font_face, font_scale, thickness)[0][0] > width - 2 * margin:
+                break
+            line = candidate
+
+        cv2.putText(img, line, (margin, y), font_face, font_scale, 0, thickness, cv2.LINE_AA)
+        lines.append(line)
+        y += line_height
+
+    if NOISE_LEVELS[noise] is not None:
+        # 06_filtering gürültü fonksiyonları np.random kullanır; tekrarlanabilirlik için tohumla
+        np.random.seed(seed)
+        img = NOISE_LEVELS[noise](img)
+
+    return img, "\n".join(lines)
+
+def corpus_specs(langs=("eng",), sizes=("small",), fonts=("simplex",), noises=("clean",), pages=1, seed=0):
+    """Derlemdeki sayfaların tanımlarını döndürür (make_document parametreleri)."""
+    combos = itertools.product(langs, sizes, fonts, noises, range(pages))
+    return [
+        {"id": index, "lang": lang, "size": size, "font": font, "noise": noise, "seed": seed + index}
+        for index, (lang, size, font, noise, _) in enumerate(combos)
+    ]
+
+def corpus_file_name(page):
+    """Derlem sayfasının --save-corpus dosya adı: {id}_{dil}_{boyut}_{yazı tipi}_{gürültü}.png"""
+    return f"{page['id']:04d}_{page['lang']}_{page['size']}_{page['font']}_{page['noise']}.png"
+
+def parse_corpus_file_name(name):
+    """corpus_file_name ile üretilmiş addan sayfa tanımını çıkarır; biçim uymazsa None döndürür."""
+    parts = os.path.splitext(os.path.basename(name))[0].split("_", 4)
+    if len(parts) != 5 or not parts[0].isdigit():
+        return None
+    return dict(zip(("id", "lang", "size", "font", "noise"), [int(parts[0])] + parts[1:]))
+
+def iter_corpus(**corpus_kwargs):
+    """Derlemdeki sayfaları tek tek üretir (tüm derlem bellekte tutulmaz)."""
+    for spec in corpus_specs(**corpus_kwargs):
+        image, text = make_document(spec["lang"], spec["size"], spec["font"], spec["noise"], spec["seed"])
+        yield dict(spec, image=image, text=text)
+
+def levenshtein(a, b):
+    """İki metin arasındaki düzenleme uzaklığı (satır başına vektörleştirilmiş)."""
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    b_codes = np.array([ord(c) for c in b])
+    offsets = np.arange(len(b) + 1)
+    previous = offsets.copy()
+
+    for i, char in enumerate(a, 1):
+        # Silme ve değiştirme
+        current = np.empty_like(previous)
+        current[0] = i
+        current[1:] = np.minimum(previous[1:] + 1, previous[:-1] + (b_codes != ord(char)))
+        # Ekleme: current[j] = min(current[j], current[j-1] + 1), kümülatif minimumla
+        current = np.minimum.accumulate(current - offsets) + offsets
+        previous = current
+
+    return int(previous[-1])
+
+def normalize_text(text):
+    """Karşılaştırma için boşlukları tekilleştirir."""
+    return " ".join(text.split())
+
+def char_accuracy(predicted, truth):
+    """Karakter doğruluğu: 1 - düzenleme uzaklığı / doğru metin uzunluğu (0 ile 1 arası)."""
+    predicted, truth = normalize_text(predicted), normalize_text(truth)
+    if not truth:
+        return 1.0 if not predicted else 0.0
+    return max(0.0, 1.0 - levenshtein(predicted, truth) / len(truth))
+
+def peak_rss_mb():
+    """Bu sürecin ve biten alt süreçlerin (tesseract) en yüksek bellek kullanımı (MB).
+
+    ru_maxrss süreç boyunca hiç azalmaz; yöntem başına ölçüm için her yöntem
+    ayrı bir süreçte çalıştırılır (bkz. run_suite).
+    """
+    if resource is None:
+        return None, None
+
+    # Linux'ta KB, macOS'ta bayt cinsinden döner
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / divisor
+    return round(own, 1), round(children, 1)
+
+def preprocess(image, method):
+    """Yöntemi uygular; 'auto' için seçim her sayfada yeniden yapılır."""
+    if method == ocr_auto.AUTO_METHOD:
+        stages = ocr_auto.select_preprocessing(image)["stages"]
+        return ocr_pipeline.Pipeline(stages).run(image)
+    return ocr_core.preprocess_image(image, method)
+
+def run_method(method, corpus_kwargs):
+    """Tek bir yöntem için derlemi ön işleme + OCR'dan geçirir ve ölçümleri döndürür."""
+    latencies, accuracy = [], {}
+    errors = 0
+    start_time = time.perf_counter()
+
+    for page in iter_corpus(**corpus_kwargs):
+        page_start = time.perf_counter()
+        try:
+            processed = preprocess(page["image"], method)
+            text = ocr_worker.recognize(processed, lang=page["lang"])
+        except Exception as e:
+            errors += 1
+            if errors == 1:
+                print(f"  {method}: OCR hatası: {e}")
+            text = ""
+        latencies.append((time.perf_counter() - page_start) * 1000)
+        accuracy.setdefault(page["noise"], []).append(char_accuracy(text, page["text"]))
+
+    elapsed = time.perf_counter() - start_time
+    latencies = np.array(latencies)
+    own_rss, child_rss = peak_rss_mb()
+    all_accuracy = [a for values in accuracy.values() for a in values]
+
+    return {
+        "pages": len(latencies),
+        "errors": errors,
+        "pages_per_sec": round(len(latencies) / elapsed, 3) if elapsed > 0 else 0.0,
+        "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+        "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+        "peak_rss_mb": own_rss,
+        "peak_child_rss_mb": child_rss,
+        "char_accuracy": round(float(np.mean(all_accuracy)), 4),
+        "char_accuracy_by_noise": {k: round(float(np.mean(v)), 4) for k, v in accuracy.items()},
+    }
+
+def run_suite(methods, corpus_kwargs, save_dir=None):
+    """Her yöntem için derlemi ön işleme + OCR'dan geçirir ve ölçümleri döndürür."""
+    # Derlem bellekte tutulmaz; her yöntem için aynı tohumla aynı sayfalar yeniden üretilir
+    results = {}
+
+    if save_dir:
+        os.makedirs(save_dir, exist_ok=True)
+        truth = {}
+        for page in iter_corpus(**corpus_kwargs):
+            name = corpus_file_name(page)
+            cv2.imwrite(os.path.join(save_dir, name), page["image"])
+            truth[name] = page["text"]
+        with open(os.path.join(save_dir, "ground_truth.json"), "w", encoding="utf-8") as f:
+            json.dump(truth, f, ensure_ascii=False, indent=2)
+        print(f"Derlem kaydedildi: {save_dir} ({len(truth)} sayfa)")
+
+    # Her yöntem yeni (spawn) bir süreçte çalışır: ru_maxrss süreç boyunca azalmadığından
+    # aynı süreçte ölçülseydi her yöntem, kendinden önceki en çok bellek kullananın değerini raporlardı
+    context = multiprocessing.get_context("spawn")
+    for method in methods:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[method] = executor.submit(run_method, method, corpus_kwargs).result()
+
+    return results
+
+def print_suite(results):
+    """Takım sonuçlarını tablo olarak yazdırır."""
+    noises = sorted({n for r in results.values() for n in r["char_accuracy_by_noise"]})
+    header = f"{'Yöntem':<20}{'sayfa/sn':>10}{'p50 ms':>10}{'p95 ms':>10}{'RSS MB':>9}{'doğruluk':>10}"
+    header += "".join(f"{n[:11]:>12}" for n in noises)
+    print(header)
+    print("-" * len(header))
+
+    for method, r in results.items():
+        rss = "-" if r["peak_rss_mb"] is None else f"{r['peak_rss_mb']:.0f}"
+        row = (f"{method:<20}{r['pages_per_sec']:>10.2f}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}"
+               f"{rss:>9}{r['char_accuracy']:>10.3f}")
+        row += "".join(f"{r['char_accuracy_by_noise'].get(n, 0):>12.3f}" for n in noises)
+        print(row)
+
+def compare_results(results, baseline, speed_tolerance=0.10, accuracy_tolerance=0.01):
+    """Önceki sonuçlarla karşılaştırır; gerileme mesajlarının listesini döndürür."""
+    regressions = []
+
+    for method, r in results.items():
+        old = baseline.get(method)
+        if old is None:
+            continue
+        if r["pages_per_sec"] < old["pages_per_sec"] * (1 - speed_tolerance):
+            regressions.append(f"{method}: sayfa/sn {old['pages_per_sec']:.2f} -> {r['pages_per_sec']:.2f}")
+        if r["p95_ms"] > old["p95_ms"] * (1 + speed_tolerance):
+            regressions.append(f"{method}: p95 {old['p95_ms']:.1f} ms -> {r['p95_ms']:.1f} ms")
+        if r["char_accuracy"] < old["char_accuracy"] - accuracy_tolerance:
+            regressions.append(f"{method}: doğruluk {old['char_accuracy']:.3f} -> {r['char_accuracy']:.3f}")
+
+    return regressions
+
+def split_list(value):
+    """Virgülle ayrılmış argümanı listeye çevirir."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR gecikme ve performans ölçümü")
+    parser.add_argument("--count", type=int, default=50, help="Ölçülecek görüntü sayısı")
+    parser.add_argument("--lang", default="eng", help="Tesseract dili")
+    parser.add_argument("--suite", action="store_true", help="Sentetik derlem üzerinde performans takımını çalıştır")
+    parser.add_argument("--methods", default=",".join(ocr_core.PREPROCESS_METHODS + (ocr_auto.AUTO_METHOD,)),
+                        help="Ölçülecek ön işleme yöntemleri (virgülle)")
+    parser.add_argument("--langs", default="eng,tur", help="Derlem dilleri (virgülle)")
+    parser.add_argument("--sizes", default="small,medium", help=f"Sayfa boyutları: {', '.join(PAGE_SIZES)}")
+    parser.add_argument("--fonts", default="simplex,complex", help=f"Yazı tipleri: {', '.join(FONTS)}")
+    parser.add_argument("--noises", default=",".join(NOISE_LEVELS), help=f"Gürültü: {', '.join(NOISE_LEVELS)}")
+    parser.add_argument("--pages", type=int, default=1, help="Her kombinasyon için sayfa sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="Derlem tohumu (aynı tohum aynı derlemi üretir)")
+    parser.add_argument("--save-corpus", default=None, help="Derlemi ve doğru metinleri bu klasöre kaydet")
+    parser.add_argument("--json", default=None, help="Sonuçları bu JSON dosyasına yaz")
+    parser.add_argument("--compare", default=None, help="Sonuçları önceki JSON çıktısıyla karşılaştır")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Hız gerilemesi toleransı (oran)")
+    args = parser.parse_args()
+
+    print("OCR Performans Ölçümü")
+    print("-" * 25)
+
+    if not args.suite:
+        run_latency_benchmark(args.count, args.lang)
+        return 0
+
+    corpus_kwargs = {
+        "langs": split_list(args.langs),
+        "sizes": split_list(args.sizes),
+        "fonts": split_list(args.fonts),
+        "noises": split_list(args.noises),
+        "pages": args.pages,
+        "seed": args.seed,
+    }
+    pages = args.pages
+    for key in ("langs", "sizes", "fonts", "noises"):
+        pages *= len(corpus_kwargs[key])
+    methods = split_list(args.methods)
+    print(f"Derlem: {pages} sayfa, {len(methods)} yöntem")
+
+    results = run_suite(methods, corpus_kwargs, args.save_corpus)
+    print_suite(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"corpus": corpus_kwargs, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar kaydedildi: {args.json}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("corpus") != corpus_kwargs:
+            print("Uyarı: Karşılaştırılan çalıştırmanın derlem ayarları farklı.")
+
+        regressions = compare_results(results, baseline["results"], args.tolerance)
+        if regressions:
+            print("\nPerformans gerilemesi:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print("\nGerileme yok.")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+OCR Sonuç Önbelleği
+-------------------
+Aynı görüntüye aynı ayarlarla tekrar OCR uygulandığında Tesseract'ı yeniden
+çalıştırmamak için disk üzerinde SQLite tabanlı bir önbellek:
+- Anahtar: işlenmiş görüntü baytlarının özeti (SHA-256) + dil + Tesseract ayarları
+- En uzun süre kullanılmayan kayıtlar (LRU) boyut sınırı aşıldığında silinir
+- Birden fazla iş parçacığı ve süreç aynı dosyayı güvenle kullanabilir
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+# Varsayılan önbellek dosyası (scripts klasörüne göre)
+DEFAULT_CACHE_PATH = "../cache/ocr_cache.sqlite3"
+
+# Varsayılan boyut sınırı: 256 MB
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Anahtar biçimi değişirse eski kayıtların kullanılmaması için sürüm
+KEY_VERSION = "1"
+
+def make_key(image, lang="eng", config=""):
+    """İşlenmiş görüntü, dil ve Tesseract ayarlarından önbellek anahtarı üretir."""
+    image = np.ascontiguousarray(image)
+
+    digest = hashlib.sha256()
+    digest.update(KEY_VERSION.encode())
+    digest.update(f"{image.shape}|{image.dtype.str}|{lang}|{config}".encode("utf-8"))
+    digest.update(memoryview(image).cast("B"))
+    return digest.hexdigest()
+
+class OCRCache:
+    """LRU + boyut sınırlı, SQLite tabanlı OCR sonuç önbelleği."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+
+        # WAL modu: okuyucular yazıcıları engellemez (toplu işlemede birden çok süreç)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # INSERT OR REPLACE'in sildiği eski kayıt için de silme tetikleyicisi çalışsın
+        self._conn.execute("PRAGMA recursive_triggers=ON")
+
+        # Şema aynı anda açılan süreçler arasında tek seferde oluşturulsun
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ocr_cache ("
+            " key TEXT PRIMARY KEY,"
+            " text TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ocr_cache_last_access ON ocr_cache (last_access)")
+
+        # Toplam boyut tek satırlık tabloda tutulur ve tetikleyicilerle güncellenir;
+        # böylece her yazmada tüm tablo toplanmaz (SUM yalnızca tablo ilk oluşturulurken)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ocr_cache_meta ("
+            " id INTEGER PRIMARY KEY CHECK (id = 0),"
+            " total_size INTEGER NOT NULL)"
+        )
+        if self._conn.execute("SELECT 1 FROM ocr_cache_meta").fetchone() is None:
+            self._conn.execute(
+                "INSERT INTO ocr_cache_meta (id, total_size) SELECT 0, COALESCE(SUM(size), 0) FROM ocr_cache"
+            )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS ocr_cache_size_insert AFTER INSERT ON ocr_cache BEGIN"
+            " UPDATE ocr_cache_meta SET total_size = total_size + NEW.size; END"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS ocr_cache_size_delete AFTER DELETE ON ocr_cache BEGIN"
+            " UPDATE ocr_cache_meta SET total_size = total_size - OLD.size; END"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS ocr_cache_size_update AFTER UPDATE OF size ON ocr_cache BEGIN"
+            " UPDATE ocr_cache_meta SET total_size = total_size + NEW.size - OLD.size; END"
+        )
+        self._conn.commit()
+
+    def get(self, key):
+        """Önbellekteki metni döndürür, yoksa None döndürür."""
+        with self._lock:
+            row = self._conn.execute("SELECT text FROM ocr_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            # Son erişim zamanını güncelle (LRU)
+            self._conn.execute("UPDATE ocr_cache SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, text):
+        """Metni önbelleğe yazar ve gerekirse eski kayıtları siler."""
+        size = len(key) + len(text.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ocr_cache (key, text, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, text, size, time.time())
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Toplam boyut sınırı aşıldıysa en eski kayıtları siler (kilit altında çağrılır)."""
+        total = self.total_size()
+        if total <= self.max_bytes:
+            return
+
+        # Sınırın %90'ına inene kadar en az kullanılan kayıtları sil
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT key, size FROM ocr_cache ORDER BY last_access")
+        stale = []
+        for key, size in rows:
+            if total <= target:
+                break
+            stale.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM ocr_cache WHERE key = ?", stale)
+
+    def total_size(self):
+        """Önbellekteki kayıtların toplam boyutu (bayt)."""
+        return self._conn.execute("SELECT total_size FROM ocr_cache_meta").fetchone()[0]
+
+    def get_or_compute(self, image, lang, config, compute):
+        """Önbellekte varsa metni döndürür, yoksa compute(image) ile hesaplayıp saklar.
+
+        (metin, önbellekten_mi) ikilisini döndürür.
+        """
+        key = make_key(image, lang, config)
+        text = self.get(key)
+        if text is not None:
+            return text, True
+
+        text = compute(image)
+        self.put(key, text)
+        return text, False
+
+    def clear(self):
+        """Önbelleği tamamen temizler."""
+        with self._lock:
+            self._conn.execute("DELETE FROM ocr_cache")
+            self._conn.commit()
+
+    def close(self):
+        """Veritabanı bağlantısını kapatır."""
+        with self._lock:
+            self._conn.close()
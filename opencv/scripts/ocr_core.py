@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+OCR Çekirdek Fonksiyonları
+--------------------------
+Bu modül, GUI'den (09_ocr.py) bağımsız olarak kullanılabilen OCR fonksiyonlarını içerir:
+- Görüntü ön işleme yöntemleri (ocr_pipeline.py üzerinden)
+- OpenCV görüntüsünü PIL formatına dönüştürme
+- Tesseract OCR çağrısı (düz metin veya kelime kutuları + güven değerleri)
+"""
+
+import sys
+
+import cv2
+import pytesseract
+from PIL import Image
+
+from ocr_pipeline import Pipeline
+
+# Tesseract yolunu ayarla (Windows için)
+if sys.platform.startswith('win'):
+    # Windows'ta Tesseract'ın kurulu olduğu yolu belirtin
+    pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+
+# Desteklenen ön işleme yöntemleri
+PREPROCESS_METHODS = (
+    "basic", "gray", "threshold", "adaptive_threshold", "otsu",
+    "gaussian_blur", "bilateral_filter", "dilation", "erosion", "opening", "closing"
+)
+
+# Desteklenen diller
+LANGUAGES = ("eng", "tur", "eng+tur")
+
+def preprocess_image(image, method="basic", threshold_value=127, blur_size=5, morph_size=3, cache=None):
+    """Seçilen ön işleme yöntemini uygular.
+
+    Yöntem, eşdeğer tek aşamalı bir ön işleme hattına (ocr_pipeline.Pipeline) çevrilir.
+    cache olarak bir ocr_pipeline.StageCache verilirse değişmeyen aşamalar tekrar hesaplanmaz.
+    """
+    return Pipeline.from_method(method, threshold_value, blur_size, morph_size, cache=cache).run(image)
+
+def to_pil_image(image):
+    """OpenCV görüntüsünü PIL formatına dönüştürür."""
+    if len(image.shape) == 3:
+        return Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+    return Image.fromarray(image)
+
+def image_to_text(image, lang="eng", config=""):
+    """İşlenmiş görüntüye Tesseract OCR uygular ve metni döndürür."""
+    return pytesseract.image_to_string(to_pil_image(image), lang=lang, config=config)
+
+def image_to_data(image, lang="eng", config=""):
+    """İşlenmiş görüntüye Tesseract OCR uygular ve kelime düzeyindeki TSV çıktısını döndürür."""
+    return pytesseract.image_to_data(to_pil_image(image), lang=lang, config=config)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Görüntü Gösterim Önbelleği
+--------------------------
+OCRApp.display_image her önizlemede görüntüyü yeniden boyutlandırıp BGR'den RGB'ye
+çeviriyor, önce PIL sonra yeni bir ImageTk.PhotoImage oluşturuyordu. Bu modül:
+- Küçültülmüş ve renk dönüşümü yapılmış görüntüyü kaynak görüntü ve ekran boyutu
+  başına önbellekte tutar (aynı görüntü tekrar gösterildiğinde hiçbir dönüşüm yapılmaz)
+- Küçültmede INTER_AREA kullanır (küçültmede örtüşme/kırılma olmaz)
+- Etiketteki PhotoImage aynı boyuttaysa yenisini oluşturmak yerine paste() ile günceller
+"""
+
+import weakref
+from collections import OrderedDict
+
+import cv2
+from PIL import Image, ImageTk
+
+def fit_size(width, height, max_width, max_height):
+    """En-boy oranını koruyarak sınırlara sığan boyutu döndürür (büyütme yapılmaz)."""
+    if width <= max_width and height <= max_height:
+        return width, height
+    scale = min(max_width / width, max_height / height)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+def to_display(image, size):
+    """OpenCV görüntüsünü verilen boyutta PIL görüntüsüne dönüştürür."""
+    h, w = image.shape[:2]
+    if (w, h) != size:
+        image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+    if len(image.shape) == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    return Image.fromarray(image)
+
+class DisplayCache:
+    """Kaynak görüntü ve ekran boyutu başına gösterime hazır görüntüleri saklayan LRU önbellek.
+
+    Kaynak görüntüler gösterildikten sonra yerinde değiştirilmemelidir.
+    """
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (id(görüntü), boyut) -> (zayıf referans, PIL görüntüsü)
+
+    def get(self, image, max_width, max_height):
+        """Görüntünün gösterime hazır (küçültülmüş, RGB) PIL kopyasını döndürür."""
+        h, w = image.shape[:2]
+        size = fit_size(w, h, max_width, max_height)
+        key = (id(image), size)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0]() is image:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        pil_image = to_display(image, size)
+        self._entries[key] = (weakref.ref(image), pil_image)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return pil_image
+
+    def show(self, image, label, max_width=1000, max_height=800):
+        """Görüntüyü Tkinter etiketinde gösterir; mümkünse mevcut PhotoImage'ı yeniden kullanır."""
+        pil_image = self.get(image, max_width, max_height)
+
+        photo = getattr(label, "image", None)
+        reusable = (
+            photo is not None
+            and (photo.width(), photo.height()) == pil_image.size
+            # paste() görüntüyü PhotoImage'ın kipine çevirir; gri tampona renkli görüntü yapıştırılmamalı
+            and getattr(label, "image_mode", None) == pil_image.mode
+        )
+
+        if reusable:
+            # Tk görüntüsünün tamponunu yerinde güncelle
+            photo.paste(pil_image)
+        else:
+            photo = ImageTk.PhotoImage(pil_image)
+            label.configure(image=photo)
+            label.image = photo  # Referansı koru
+            label.image_mode = pil_image.mode
+
+    def clear(self):
+        """Önbelleği boşaltır."""
+        self._entries.clear()
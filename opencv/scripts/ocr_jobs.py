@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+İptal Edilebilir OCR İş Kuyruğu
+-------------------------------
+OCRApp'te her tıklamada yeni bir iş parçacığı başlatmak yerine:
+- İşler numaralandırılır ve sınırlı bir kuyruğa alınır; sabit sayıda işçi iş parçacığı
+  işleri sırayla çalıştırır (büyük görüntülerde iş parçacıkları birikip CPU için yarışmaz)
+- Kuyruk doluyken yeni iş gelirse en eski bekleyen iş iptal edilir (yerine daha yenisi geldi)
+- İşler iptal edilebilir: bekleyen iş hiç başlamaz, çalışan iş aşamalar arasında
+  job.check() ile durur (çalışan bir Tesseract çağrısı kesilemez, sonucu atılır)
+- Her iş için kuyrukta bekleme ve çalışma süresi ölçülür
+- İşçi iş parçacıkları Tk'ya hiç dokunmaz: olaylar bir kuyruğa yazılır ve Tk olay
+  döngüsünde root.after ile okunarak geri çağırma fonksiyonlarına verilir
+"""
+
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+
+# İş durumları
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+class JobCancelled(Exception):
+    """İş iptal edildiğinde job.check() tarafından fırlatılır."""
+
+class Job:
+    """Kuyruktaki tek bir iş."""
+
+    def __init__(self, job_id, fn, args, on_start=None, on_done=None):
+        self.id = job_id
+        self.fn = fn  # fn(job, *args) -> sonuç
+        self.args = args
+        self.on_start = on_start  # Tk iş parçacığında çağrılır: on_start(job)
+        self.on_done = on_done  # Tk iş parçacığında çağrılır: on_done(job)
+
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.submitted = time.perf_counter()
+        self.started = None
+        self.finished = None
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """İptal ister."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def check(self):
+        """İptal istendiyse JobCancelled fırlatır (uzun işlerde aşamalar arasında çağrılır)."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    @property
+    def wait_time(self):
+        """Kuyrukta bekleme süresi (saniye)."""
+        end = self.started or self.finished or time.perf_counter()
+        return end - self.submitted
+
+    @property
+    def run_time(self):
+        """Çalışma süresi (saniye)."""
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+class JobManager:
+    """Sınırlı kuyruklu, iptal edilebilir iş yöneticisi."""
+
+    def __init__(self, root, workers=1, max_queued=2, poll_ms=50):
+        self.root = root
+        self.max_queued = max_queued
+        self.poll_ms = poll_ms
+
+        self._ids = itertools.count(1)
+        self._queued = deque()
+        self._active = {}  # id -> iş (bekleyen ve çalışan)
+        self._events = queue.Queue()  # İşçilerden Tk'ya: (olay, iş)
+        self._cond = threading.Condition()
+        self._closed = False
+        self._after_id = None
+
+        self._threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(max(1, workers))]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, *args, on_start=None, on_done=None):
+        """İşi kuyruğa ekler ve Job döndürür (Tk iş parçacığından çağrılmalıdır)."""
+        job = Job(next(self._ids), fn, args, on_start, on_done)
+
+        with self._cond:
+            # Kuyruk doluysa en eski bekleyen işin yerine daha yenisi geldi
+            while len(self._queued) >= self.max_queued:
+                old = self._queued.popleft()
+                old.cancel()
+                self._finish(old, CANCELLED)
+
+            self._queued.append(job)
+            self._active[job.id] = job
+            self._cond.notify()
+
+        self._schedule_poll()
+        return job
+
+    def cancel(self, job_id):
+        """Belirtilen işi iptal eder."""
+        with self._cond:
+            job = self._active.get(job_id)
+            if job is None:
+                return False
+            job.cancel()
+            if job.status == QUEUED:
+                self._queued.remove(job)
+                self._finish(job, CANCELLED)
+        return True
+
+    def cancel_all(self):
+        """Bekleyen ve çalışan tüm işleri iptal eder."""
+        with self._cond:
+            job_ids = list(self._active)
+        for job_id in job_ids:
+            self.cancel(job_id)
+
+    @property
+    def busy(self):
+        """Bekleyen veya çalışan iş var mı?"""
+        with self._cond:
+            return bool(self._active)
+
+    def _finish(self, job, status, result=None, error=None):
+        """İşi sonlandırır ve Tk iş parçacığına bildirir (kilit altında çağrılır)."""
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished = time.perf_counter()
+        self._active.pop(job.id, None)
+        self._events.put(("done", job))
+
+    def _worker(self):
+        """İşçi iş parçacığı: kuyruktaki işleri sırayla çalıştırır."""
+        while True:
+            with self._cond:
+                while not self._queued and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                job = self._queued.popleft()
+                job.status = RUNNING
+                job.started = time.perf_counter()
+            self._events.put(("start", job))
+
+            try:
+                result = job.fn(job, *job.args)
+                status, error = (CANCELLED, None) if job.cancelled else (DONE, None)
+            except JobCancelled:
+                result, status, error = None, CANCELLED, None
+            except Exception as e:
+                result, status, error = None, FAILED, str(e)
+
+            with self._cond:
+                self._finish(job, status, result if status == DONE else None, error)
+
+    def _schedule_poll(self):
+        if self._after_id is None and not self._closed:
+            self._after_id = self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        """Tk iş parçacığında: işçilerden gelen olayları geri çağırma fonksiyonlarına verir."""
+        self._after_id = None
+
+        while True:
+            try:
+                event, job = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            callback = job.on_start if event == "start" else job.on_done
+            if callback is not None:
+                callback(job)
+
+        # Bekleyen veya çalışan iş kaldıkça yoklamaya devam et
+        if self.busy or not self._events.empty():
+            self._schedule_poll()
+
+    def close(self):
+        """Tüm işleri iptal eder ve işçileri durdurur."""
+        self.cancel_all()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Sayfa Düzeni Analizi ve Bölge Bazlı OCR
+---------------------------------------
+Tesseract'a tüm sayfayı vermek yerine önce metin bölgeleri bulunur:
+- Eşikleme ile metin pikselleri ayrılır
+- Genişletme (dilation) ile karakterler kelime/satır/paragraf bloklarına birleştirilir
+- Konturların sınırlayıcı kutuları metin bölgeleri olarak alınır
+- Bölgeler okuma sırasına (yukarıdan aşağıya, soldan sağa) dizilir
+
+Boş kenar boşlukları ve şekiller OCR'a hiç gönderilmez; bölgeler ayrı iş
+parçacıklarında aynı anda tanınır ve sonuçlar koordinatlarıyla birlikte döner.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+
+from ocr_result import OCRResult
+
+# Bölge OCR'ı için varsayılan Tesseract ayarı: tek bir düzgün metin bloğu
+REGION_CONFIG = "--psm 6"
+
+def group_lines(boxes):
+    """Kutuları satırlara gruplar; her satır soldan sağa sıralı kutu listesidir."""
+    lines = []
+
+    for box in sorted(boxes, key=lambda b: (b[1], b[0])):
+        x, y, w, h = box
+        center_y = y + h / 2
+
+        # Dikey merkezi mevcut bir satırın aralığına düşen kutu o satıra aittir
+        for line in lines:
+            if line["top"] <= center_y <= line["bottom"]:
+                line["boxes"].append(box)
+                line["bottom"] = max(line["bottom"], y + h)
+                break
+        else:
+            lines.append({"top": y, "bottom": y + h, "boxes": [box]})
+
+    return [
+        sorted(line["boxes"], key=lambda b: b[0])
+        for line in sorted(lines, key=lambda line: line["top"])
+    ]
+
+def sort_reading_order(boxes):
+    """Kutuları okuma sırasına dizer: yukarıdan aşağıya satırlar, satır içinde soldan sağa."""
+    return [box for line in group_lines(boxes) for box in line]
+
+def detect_text_regions(image, kernel_size=None, min_size=8, padding=4):
+    """Görüntüdeki metin bölgelerini (x, y, w, h) listesi olarak döndürür.
+
+    kernel_size verilmezse genişletme çekirdeği sayfa boyutuna göre seçilir:
+    yatayda karakterleri ve kelimeleri, dikeyde yakın satırları birleştirir.
+    """
+    if len(image.shape) == 3:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = image
+
+    height, width = gray.shape[:2]
+
+    # Metni beyaz, arka planı siyah yap
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+
+    # Karakterleri bloklara birleştir
+    if kernel_size is None:
+        kernel_size = (max(9, width // 30), max(3, height // 100))
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, kernel_size)
+    dilated = cv2.dilate(binary, kernel, iterations=1)
+
+    contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    boxes = []
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        if w < min_size or h < min_size:
+            continue  # Gürültü
+
+        # Kenardaki karakterlerin kesilmemesi için küçük bir pay bırak
+        x0, y0 = max(0, x - padding), max(0, y - padding)
+        x1, y1 = min(width, x + w + padding), min(height, y + h + padding)
+        boxes.append((x0, y0, x1 - x0, y1 - y0))
+
+    return sort_reading_order(boxes)
+
+# Bölge OCR'ı için süreç başına tek, uzun ömürlü iş parçacığı havuzu
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor(workers=None):
+    """Ortak bölge havuzunu döndürür, yoksa oluşturur (boyut ilk çağrıda belirlenir)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                                           thread_name_prefix="ocr-regions")
+        return _executor
+
+def shutdown():
+    """Ortak bölge havuzunu kapatır."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+def _map_regions(image, regions, recognize, workers=None):
+    """recognize fonksiyonunu bölgelere paralel uygular; çıktıları bölge sırasıyla döndürür.
+
+    workers=1 ise bölgeler çağıran iş parçacığında sırayla işlenir; aksi halde ortak havuz kullanılır.
+    """
+    def run(region):
+        x, y, w, h = region
+        return recognize(image[y:y + h, x:x + w])
+
+    if workers == 1 or len(regions) < 2:
+        return [run(region) for region in regions]
+
+    return list(get_executor(workers).map(run, regions))
+
+def ocr_regions_data(image, regions, recognize_data, workers=None):
+    """Bölgeleri aynı anda tanır; bölge listesini ve sayfa koordinatlarındaki OCRResult'ı döndürür.
+
+    recognize_data(bölge_görüntüsü) -> OCRResult biçiminde bir fonksiyon olmalıdır.
+    """
+    results = _map_regions(image, regions, recognize_data, workers)
+
+    region_list = [
+        {"x": int(x), "y": int(y), "w": int(w), "h": int(h), "text": result.text.strip()}
+        for (x, y, w, h), result in zip(regions, results)
+    ]
+    page = OCRResult.concat(results, offsets=[(x, y) for x, y, _, _ in regions])
+    return region_list, page
+
+def ocr_page_layout_data(image, recognize_data, workers=None, **detect_kwargs):
+    """Bölgeleri bulur, paralel tanır; (bölge listesi, sayfa OCRResult'ı) döndürür."""
+    regions = detect_text_regions(image, **detect_kwargs)
+    if not regions:
+        return [], OCRResult()
+    return ocr_regions_data(image, regions, recognize_data, workers)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Çok Sayfalı Belge Okuma
+-----------------------
+cv2.imread çok sayfalı TIFF dosyalarının yalnızca ilk sayfasını döndürür;
+cv2.imreadmulti ise tüm sayfaları aynı anda belleğe yükler. Bu modül:
+- Çok sayfalı TIFF dosyalarını (Pillow) ve PDF dosyalarını (PyMuPDF kuruluysa)
+  sayfa sayfa, bir üreteç (generator) ile çözer; belgenin tamamı hiçbir zaman bellekte tutulmaz
+- Belirli bir sayfadan başlamayı ve daha önce işlenmiş sayfaları çözmeden atlamayı sağlar
+  (çökme sonrası kaldığı yerden devam)
+- Tek sayfalı görüntüler için cv2.imread ile aynı sonucu döndürür
+"""
+
+import os
+
+import cv2
+import numpy as np
+from PIL import Image
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    # PDF desteği için isteğe bağlı
+    fitz = None
+
+# Çok büyük taramalar (ör. 600 dpi A0) Pillow'un varsayılan piksel sınırını aşar;
+# girdiler yerel ve güvenilir taramalar olduğu için sınır kaldırılır
+Image.MAX_IMAGE_PIXELS = None
+
+# Sayfa sayfa okunan belge uzantıları
+MULTIPAGE_EXTENSIONS = (".tif", ".tiff", ".pdf")
+
+# PDF sayfalarının görüntüye dönüştürülme çözünürlüğü
+DEFAULT_PDF_DPI = 300
+
+def is_multipage(path):
+    """Dosyanın sayfa sayfa okunması gereken bir belge olup olmadığını döndürür."""
+    return path.lower().endswith(MULTIPAGE_EXTENSIONS)
+
+def _is_pdf(path):
+    return path.lower().endswith(".pdf")
+
+def _open_pdf(path):
+    if fitz is None:
+        raise RuntimeError("PDF okumak için PyMuPDF kurulmalıdır: pip install pymupdf")
+    return fitz.open(path)
+
+def _pil_to_cv(frame):
+    """Pillow sayfasını OpenCV dizisine dönüştürür (gri sayfalar tek kanallı kalır)."""
+    if frame.mode.startswith("I;16") or frame.mode in ("I", "F"):
+        # 16/32 bit tamsayı veya kayan nokta sayfa: convert("L") 255'te kırpar. Değer aralığı
+        # 0-255'e ölçeklenir (12 bit taramalar gibi tam aralığı kullanmayan sayfalar da)
+        return cv2.normalize(np.array(frame), None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
+    if frame.mode in ("1", "L"):
+        return np.array(frame.convert("L"))
+    return cv2.cvtColor(np.array(frame.convert("RGB")), cv2.COLOR_RGB2BGR)
+
+def _read_single(path):
+    """Tek sayfalı görüntüyü cv2.imread ile okur (BGR, EXIF yönü uygulanmış)."""
+    image = cv2.imread(path)
+    if image is None:
+        raise ValueError("Görüntü okunamadı")
+    return image
+
+def _pixmap_to_cv(pixmap):
+    """PyMuPDF görüntüsünü OpenCV dizisine dönüştürür."""
+    image = np.frombuffer(pixmap.samples, dtype=np.uint8).reshape(pixmap.height, pixmap.width, pixmap.n)
+    if pixmap.n == 1:
+        return image.copy()
+    return cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+
+def page_count(path):
+    """Belgedeki sayfa sayısını döndürür (sayfalar çözülmez)."""
+    if _is_pdf(path):
+        with _open_pdf(path) as document:
+            return document.page_count
+    if is_multipage(path):
+        with Image.open(path) as image:
+            return getattr(image, "n_frames", 1)
+    return 1
+
+def iter_pages(path, start=0, skip=(), dpi=DEFAULT_PDF_DPI):
+    """Belgenin sayfalarını sırayla (sayfa indeksi, görüntü) olarak üretir.
+
+    Her seferinde yalnızca bir sayfa çözülür. start'tan önceki ve skip içindeki
+    sayfalar çözülmeden atlanır.
+    """
+    skip = set(skip)
+
+    if _is_pdf(path):
+        with _open_pdf(path) as document:
+            for index in range(start, document.page_count):
+                if index in skip:
+                    continue
+                pixmap = document.load_page(index).get_pixmap(dpi=dpi, alpha=False)
+                yield index, _pixmap_to_cv(pixmap)
+        return
+
+    if not is_multipage(path):
+        if start == 0 and 0 not in skip:
+            yield 0, _read_single(path)
+        return
+
+    with Image.open(path) as image:
+        frames = getattr(image, "n_frames", 1)
+        if frames == 1:
+            # Tek sayfalı TIFF: önceki davranışla aynı sonuç için cv2.imread kullanılır
+            if start == 0 and 0 not in skip:
+                yield 0, _read_single(path)
+            return
+
+        for index in range(start, frames):
+            if index in skip:
+                continue
+            # seek yalnızca sayfa başlığına gider; piksel verisi burada çözülür
+            image.seek(index)
+            yield index, _pil_to_cv(image)
+
+def read_page(path, index=0, dpi=DEFAULT_PDF_DPI):
+    """Belgeden tek bir sayfayı okur."""
+    for _, image in iter_pages(path, start=index, dpi=dpi):
+        return image
+    raise IndexError(f"{os.path.basename(path)} dosyasında {index + 1}. sayfa yok")
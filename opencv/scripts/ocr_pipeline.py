@@ -0,0 +1,375 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Ön İşleme Hattı (Pipeline)
+--------------------------
+Ön işleme adımlarını tek bir yöntem yerine sıralı aşamalar olarak tanımlar:
+- Her aşama bir ada ve parametrelere sahiptir (ör. bilateral_filter -> adaptive_threshold -> opening)
+- Hat JSON olarak kaydedilip yüklenebilir
+- Gri tonlama dönüşümü yalnızca gerektiğinde ve bir kez yapılır, gereksiz kopya alınmaz
+- Ara sonuçlar için ayrılan bellek sonraki çalıştırmalarda yeniden kullanılır
+- Aynı görüntüde yalnızca sondaki aşamaların parametresi değiştiyse baştaki aşamalar tekrar çalışmaz
+- İsteğe bağlı StageCache ile aşama çıktıları, bellek sınırı içinde birden çok çalıştırma
+  ve hat arasında paylaşılır (önizleme, parametre taramaları)
+
+Örnek:
+    pipeline = Pipeline().add("bilateral_filter", d=9).add("adaptive_threshold", block_size=15).add("opening")
+    result = pipeline.run(image)
+    print(pipeline.to_json())
+"""
+
+import hashlib
+import json
+import threading
+import weakref
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+def make_odd(value):
+    """Çekirdek boyutunun tek sayı olmasını sağlar."""
+    value = int(value)
+    if value % 2 == 0:
+        value += 1
+    return value
+
+class Stage:
+    """Hat içinde kullanılabilen tek bir ön işleme aşaması."""
+
+    def __init__(self, name, fn, defaults, needs_gray=True, halo=None, global_stats=False):
+        self.name = name
+        self.fn = fn  # fn(image, dst, **params) -> çıktı
+        self.defaults = defaults
+        self.needs_gray = needs_gray
+        # Bir çıktı pikselinin bağlı olduğu komşuluk yarıçapı (parçalı işlemede kenar payı)
+        self.halo = halo or (lambda params: 0)
+        # Tüm görüntünün istatistiğine ihtiyaç duyan aşamalar (ör. Otsu) parçalara bölünemez
+        self.global_stats = global_stats
+
+# Aşama kaydı: ad -> Stage
+STAGES = {}
+
+def register_stage(name, needs_gray=True, halo=None, global_stats=False, **defaults):
+    """Bir fonksiyonu ön işleme aşaması olarak kaydeder (dekoratör)."""
+    def decorator(fn):
+        STAGES[name] = Stage(name, fn, defaults, needs_gray, halo, global_stats)
+        return fn
+    return decorator
+
+def _morph_kernel(ksize):
+    """Kare morfolojik çekirdek oluşturur."""
+    ksize = make_odd(ksize)
+    return np.ones((ksize, ksize), np.uint8)
+
+@register_stage("gray", needs_gray=False)
+def _gray(image, dst):
+    # Görüntü zaten gri ise kopyalamadan aynen geçir
+    if len(image.shape) == 2:
+        return image
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=dst)
+
+@register_stage("threshold", thresh=127)
+def _threshold(image, dst, thresh):
+    # Basit eşikleme
+    _, result = cv2.threshold(image, thresh, 255, cv2.THRESH_BINARY, dst=dst)
+    return result
+
+@register_stage("otsu", global_stats=True)
+def _otsu(image, dst):
+    # Otsu eşikleme
+    _, result = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=dst)
+    return result
+
+@register_stage("adaptive_threshold", halo=lambda p: max(3, make_odd(p["block_size"])) // 2,
+                block_size=5, c=11)
+def _adaptive_threshold(image, dst, block_size, c):
+    # Adaptif eşikleme (blok boyutu en az 3 olmalı)
+    block_size = max(3, make_odd(block_size))
+    return cv2.adaptiveThreshold(
+        image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, block_size, c, dst=dst
+    )
+
+@register_stage("gaussian_blur", halo=lambda p: make_odd(p["ksize"]) // 2, ksize=5)
+def _gaussian_blur(image, dst, ksize):
+    # Gaussian bulanıklaştırma
+    ksize = make_odd(ksize)
+    return cv2.GaussianBlur(image, (ksize, ksize), 0, dst=dst)
+
+@register_stage("bilateral_filter", halo=lambda p: make_odd(p["d"]) // 2,
+                d=5, sigma_color=75, sigma_space=75)
+def _bilateral_filter(image, dst, d, sigma_color, sigma_space):
+    # İki taraflı filtreleme
+    return cv2.bilateralFilter(image, make_odd(d), sigma_color, sigma_space, dst=dst)
+
+@register_stage("dilation", halo=lambda p: make_odd(p["ksize"]) // 2 * p["iterations"],
+                ksize=3, iterations=1)
+def _dilation(image, dst, ksize, iterations):
+    # Genişletme (dilation)
+    return cv2.dilate(image, _morph_kernel(ksize), dst=dst, iterations=iterations)
+
+@register_stage("erosion", halo=lambda p: make_odd(p["ksize"]) // 2 * p["iterations"],
+                ksize=3, iterations=1)
+def _erosion(image, dst, ksize, iterations):
+    # Aşındırma (erosion)
+    return cv2.erode(image, _morph_kernel(ksize), dst=dst, iterations=iterations)
+
+@register_stage("opening", halo=lambda p: make_odd(p["ksize"]) // 2 * 2, ksize=3)
+def _opening(image, dst, ksize):
+    # Açma (opening) - Aşındırma sonrası genişletme
+    return cv2.morphologyEx(image, cv2.MORPH_OPEN, _morph_kernel(ksize), dst=dst)
+
+@register_stage("closing", halo=lambda p: make_odd(p["ksize"]) // 2 * 2, ksize=3)
+def _closing(image, dst, ksize):
+    # Kapama (closing) - Genişletme sonrası aşındırma
+    return cv2.morphologyEx(image, cv2.MORPH_CLOSE, _morph_kernel(ksize), dst=dst)
+
+def method_stages(method, threshold_value=127, blur_size=5, morph_size=3):
+    """09_ocr.py'deki tek yöntem seçimini eşdeğer aşama listesine çevirir."""
+    stages = {
+        "basic": [("gray", {})],
+        "gray": [("gray", {})],
+        "threshold": [("threshold", {"thresh": threshold_value})],
+        "adaptive_threshold": [("adaptive_threshold", {"block_size": blur_size, "c": 11})],
+        "otsu": [("otsu", {})],
+        "gaussian_blur": [("gaussian_blur", {"ksize": blur_size})],
+        "bilateral_filter": [("bilateral_filter", {"d": blur_size})],
+        "dilation": [("dilation", {"ksize": morph_size})],
+        "erosion": [("erosion", {"ksize": morph_size})],
+        "opening": [("opening", {"ksize": morph_size})],
+        "closing": [("closing", {"ksize": morph_size})],
+    }
+    # Bilinmeyen yöntemde görüntü olduğu gibi döner
+    return stages.get(method, [])
+
+class StageCache:
+    """Aşama çıktılarını bellek sınırı içinde saklayan, iş parçacığı güvenli LRU önbellek.
+
+    Anahtar: (kaynak görüntü özeti, aşamanın ve önceki tüm aşamaların ad + parametreleri).
+    Önbelleğe alınan diziler salt okunur yapılır; kaynak görüntüler yerinde değiştirilmemelidir.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._tokens = {}  # id(görüntü) -> (zayıf referans, özet)
+        self._lock = threading.Lock()
+
+    def token(self, image):
+        """Kaynak görüntünün içerik özetini döndürür (aynı nesne için bir kez hesaplanır)."""
+        key = id(image)
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is not None and entry[0]() is image:
+                return entry[1]
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{image.shape}|{image.dtype.str}".encode())
+        digest.update(memoryview(np.ascontiguousarray(image)).cast("B"))
+        token = digest.hexdigest()
+
+        # Görüntü silindiğinde özet kaydı da silinir
+        ref = weakref.ref(image, lambda _, key=key: self._tokens.pop(key, None))
+        with self._lock:
+            self._tokens[key] = (ref, token)
+        return token
+
+    def get(self, key):
+        """Önbellekteki çıktıyı döndürür, yoksa None döndürür."""
+        with self._lock:
+            array = self._entries.get(key)
+            if array is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return array
+
+    def put(self, key, array):
+        """Çıktıyı önbelleğe ekler; sınır aşılırsa en az kullanılanları çıkarır."""
+        if array.nbytes > self.max_bytes:
+            return
+
+        # Paylaşılan çıktının yanlışlıkla değiştirilmesini engelle
+        array.flags.writeable = False
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old.nbytes
+            self._entries[key] = array
+            self._size += array.nbytes
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.nbytes
+
+    def clear(self):
+        """Önbelleği boşaltır."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+class Pipeline:
+    """Sıralı ön işleme aşamalarından oluşan hat.
+
+    Bir örnek aynı anda tek bir iş parçacığından kullanılmalıdır; birden çok hat
+    aynı StageCache'i paylaşabilir. Önbellek verilirse çıktılar önbelleğe ait ve
+    salt okunurdur, bu durumda ara tamponlar yeniden kullanılmaz.
+    """
+
+    def __init__(self, stages=None, cache=None):
+        self.cache = cache
+        self._stages = []
+        self._source = None
+        self._outputs = []  # Son çalıştırmadaki aşama çıktıları: (imza, çıktı)
+        if stages:
+            self.stages = stages
+
+    @classmethod
+    def from_method(cls, method, threshold_value=127, blur_size=5, morph_size=3, cache=None):
+        """09_ocr.py'deki yöntem adından hat oluşturur."""
+        return cls(method_stages(method, threshold_value, blur_size, morph_size), cache=cache)
+
+    @property
+    def stages(self):
+        """(ad, parametreler) listesini döndürür."""
+        return [(name, dict(params)) for name, params in self._stages]
+
+    @stages.setter
+    def stages(self, stages):
+        """Aşamaları değiştirir; önceki ara sonuçlar uygun olduğu ölçüde korunur."""
+        self._stages = [self._normalize(name, params) for name, params in stages]
+
+    def add(self, name, **params):
+        """Hattın sonuna bir aşama ekler."""
+        self._stages.append(self._normalize(name, params))
+        return self
+
+    @staticmethod
+    def _normalize(name, params):
+        """Aşama adını doğrular ve eksik parametreleri varsayılanlarla doldurur."""
+        if name not in STAGES:
+            raise ValueError(f"Bilinmeyen aşama: {name}")
+
+        stage = STAGES[name]
+        unknown = set(params or {}) - set(stage.defaults)
+        if unknown:
+            raise ValueError(f"{name} aşaması için bilinmeyen parametre: {', '.join(sorted(unknown))}")
+
+        merged = dict(stage.defaults)
+        merged.update(params or {})
+        return name, merged
+
+    def to_list(self):
+        """Hattı JSON'a yazılabilir listeye dönüştürür."""
+        return [{"stage": name, "params": params} for name, params in self.stages]
+
+    def to_json(self, **kwargs):
+        """Hattı JSON metnine dönüştürür."""
+        return json.dumps(self.to_list(), **kwargs)
+
+    @classmethod
+    def from_list(cls, items):
+        """to_list() çıktısından hat oluşturur."""
+        return cls([(item["stage"], item.get("params", {})) for item in items])
+
+    @classmethod
+    def from_json(cls, text):
+        """JSON metninden hat oluşturur."""
+        return cls.from_list(json.loads(text))
+
+    def expanded(self, image):
+        """Gerekli yerlere tek seferlik gri dönüşümü ekleyerek çalışacak aşamaları döndürür."""
+        expanded = []
+        is_gray = len(image.shape) == 2
+
+        for name, params in self._stages:
+            stage = STAGES[name]
+            if stage.needs_gray and not is_gray:
+                expanded.append(("gray", {}))
+                is_gray = True
+            elif name == "gray":
+                if is_gray:
+                    continue  # Gereksiz dönüşümü atla
+                is_gray = True
+            expanded.append((name, params))
+
+        return expanded
+
+    def run(self, image):
+        """Hattı görüntüye uygular ve son aşamanın çıktısını döndürür."""
+        stages = self.expanded(image)
+
+        # Her aşamanın imzası: kendisi ve önceki tüm aşamaların ad + parametreleri
+        signatures = []
+        signature = ()
+        for name, params in stages:
+            signature = signature + ((name, tuple(sorted(params.items()))),)
+            signatures.append(signature)
+
+        if self.cache is not None:
+            return self._run_cached(image, stages, signatures)
+
+        # Aynı görüntüde, imzası değişmemiş baştaki aşamaları yeniden çalıştırma
+        previous = self._outputs if image is self._source else []
+        outputs = []
+        for i, signature in enumerate(signatures):
+            if i < len(previous) and previous[i][0] == signature:
+                outputs.append(previous[i])
+            else:
+                break
+
+        # Korunan dizilerin üzerine yazılmaması için kimliklerini topla
+        kept = {id(image)} | {id(out) for _, out in outputs}
+        current = outputs[-1][1] if outputs else image
+
+        for i in range(len(outputs), len(stages)):
+            name, params = stages[i]
+
+            # Önceki çalıştırmanın bu aşamaya ait tamponunu yeniden kullan.
+            # Son aşamanın çıktısı çağırana verildiği için her zaman yeni ayrılır.
+            dst = None
+            if i < len(previous) and i < len(stages) - 1:
+                candidate = previous[i][1]
+                if id(candidate) not in kept and candidate is not current:
+                    dst = candidate
+
+            current = STAGES[name].fn(current, dst, **params)
+            kept.add(id(current))
+            outputs.append((signatures[i], current))
+
+        self._source = image
+        self._outputs = outputs
+        return current
+
+    def _run_cached(self, image, stages, signatures):
+        """Hattı, önbellekte bulunan en uzun önekten devam ederek çalıştırır."""
+        token = self.cache.token(image)
+
+        # Sondan başa doğru önbellekte bulunan ilk aşamayı ara
+        start, current = 0, image
+        for i in range(len(stages) - 1, -1, -1):
+            cached = self.cache.get((token, signatures[i]))
+            if cached is not None:
+                start, current = i + 1, cached
+                break
+
+        # Yalnızca değişen aşamadan sonrasını çalıştır
+        for i in range(start, len(stages)):
+            name, params = stages[i]
+            current = STAGES[name].fn(current, None, **params)
+            if current is not image:
+                self.cache.put((token, signatures[i]), current)
+
+        return current
+
+    def reset(self):
+        """Saklanan ara sonuçları bırakır."""
+        self._source = None
+        self._outputs = []
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Canlı Önizleme Motoru
+---------------------
+OCRApp'teki kaydırıcılar sürüklenirken arayüzün donmaması için:
+- Kısa süre içinde gelen kaydırıcı olaylarını tek bir isteğe birleştirir
+- Ön işlemeyi küçültülmüş bir vekil (proxy) görüntü üzerinde hesaplar
+- Hesaplamayı Tk olay döngüsü yerine arka plan iş parçacığında yapar
+- Yerine daha yenisi gelmiş (eski) istekleri ve sonuçları atar
+- Aşama çıktılarını önbellekte (ocr_pipeline.StageCache) tutarak yalnızca değişen
+  parametreden sonraki aşamaları yeniden hesaplar
+
+Tam çözünürlüklü işlem yalnızca OCR istendiğinde yapılır.
+"""
+
+import threading
+
+import cv2
+
+import ocr_pipeline
+
+def make_proxy(image, max_side=1000):
+    """Görüntüyü en uzun kenarı max_side olacak şekilde küçültür.
+
+    (vekil görüntü, ölçek) ikilisini döndürür. Görüntü zaten küçükse kopyalanmaz.
+    """
+    h, w = image.shape[:2]
+    scale = min(1.0, max_side / max(h, w))
+    if scale >= 1.0:
+        return image, 1.0
+
+    new_w, new_h = max(1, int(w * scale)), max(1, int(h * scale))
+    return cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_AREA), scale
+
+def scale_params(params, scale):
+    """Çekirdek boyutlarını vekil görüntünün ölçeğine göre küçültür."""
+    if scale >= 1.0:
+        return params
+
+    scaled = dict(params)
+    for name in ("blur_size", "morph_size"):
+        value = ocr_pipeline.make_odd(params[name])
+        # Küçültülmüş çekirdek tek sayı kalmalı ve 3'ün altına inmemeli
+        scaled[name] = max(min(value, 3), ocr_pipeline.make_odd(round(value * scale)))
+    return scaled
+
+class PreviewEngine:
+    """Kaydırıcı olaylarını birleştirip önizlemeyi arka planda hesaplayan motor."""
+
+    def __init__(self, root, params_fn, on_result, delay_ms=50, max_side=1000,
+                 cache_bytes=128 * 1024 * 1024, stages_fn=None):
+        self.root = root
+        self.params_fn = params_fn  # Ana iş parçacığında parametreleri okur
+        self.on_result = on_result  # Sonuç ana iş parçacığında bu fonksiyona verilir
+        # stages_fn(parametreler, vekil, ölçek) -> aşamalar; arka plan iş parçacığında çağrılır
+        self.stages_fn = stages_fn or (lambda params, proxy, scale: ocr_pipeline.method_stages(**params))
+        self.delay_ms = delay_ms
+        self.max_side = max_side
+
+        self._proxy = None
+        self._scale = 1.0
+        self._generation = 0
+        self._pending = None
+        self._after_id = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._pipeline = ocr_pipeline.Pipeline(cache=ocr_pipeline.StageCache(cache_bytes))
+
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def set_image(self, image):
+        """Yeni kaynak görüntüyü ayarlar ve vekil görüntüyü bir kez hesaplar."""
+        proxy, scale = make_proxy(image, self.max_side)
+        with self._cond:
+            # Eski vekil görüntünün aşama çıktılarına artık gerek yok
+            self._pipeline.cache.clear()
+            self._proxy = proxy
+            self._scale = scale
+            # Eski görüntüye ait bekleyen istek ve sonuçlar geçersiz
+            self._generation += 1
+            self._pending = None
+
+    def request(self, *args):
+        """Önizleme ister; delay_ms içinde gelen istekler tek bir hesaplamaya birleştirilir."""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.delay_ms, self._dispatch)
+
+    def _dispatch(self):
+        """Birleştirilen isteği en güncel parametrelerle işçiye gönderir (ana iş parçacığı)."""
+        self._after_id = None
+        params = self.params_fn()
+
+        with self._cond:
+            if self._proxy is None:
+                return
+            self._generation += 1
+            # Henüz başlamamış eski istek varsa üzerine yazılır
+            self._pending = (self._generation, self._proxy, self._scale, scale_params(params, self._scale))
+            self._cond.notify()
+
+    def _worker(self):
+        """Arka plan iş parçacığı: en son isteği hesaplar."""
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                generation, proxy, scale, params = self._pending
+                self._pending = None
+
+            try:
+                self._pipeline.stages = self.stages_fn(params, proxy, scale)
+                result = self._pipeline.run(proxy)
+            except Exception as e:
+                print(f"Önizleme hatası: {e}")
+                continue
+
+            if not self._closed:
+                self.root.after(0, self._deliver, generation, result)
+
+    def _deliver(self, generation, result):
+        """Sonucu, daha yeni bir istek yoksa gösterir (ana iş parçacığı)."""
+        if generation == self._generation:
+            self.on_result(result)
+
+    def close(self):
+        """Arka plan iş parçacığını durdurur."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
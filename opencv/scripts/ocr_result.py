@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Yapılandırılmış OCR Sonucu
+--------------------------
+Tesseract'ın TSV (image_to_data) çıktısından kelime düzeyinde sonuç modeli:
+- Her kelimenin sınırlayıcı kutusu ve güven değeri (confidence)
+- Büyük sayfalar için sütun tabanlı, NumPy dizileriyle saklama
+- Aynı sonuçtan düz metnin yeniden oluşturulması (OCR tekrar çalışmaz)
+- Sayfa/bölge bazında JSONL kayıtlarına veya Parquet'e (pyarrow kuruluysa) akış halinde yazma
+"""
+
+import json
+
+import numpy as np
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    # Parquet çıktısı için isteğe bağlı
+    pyarrow = None
+
+# Tesseract TSV çıktısında kelime satırlarının seviyesi
+WORD_LEVEL = 5
+
+class OCRResult:
+    """Kelime düzeyinde OCR sonucu (sütun tabanlı)."""
+
+    def __init__(self, words=None, boxes=None, conf=None, lines=None):
+        self.words = list(words or [])
+        n = len(self.words)
+        # (x, y, w, h)
+        self.boxes = np.asarray(boxes if boxes is not None else np.empty((n, 4)), dtype=np.int32).reshape(n, 4)
+        self.conf = np.asarray(conf if conf is not None else np.empty(n), dtype=np.float32).reshape(n)
+        # (blok, paragraf, satır) numaraları
+        self.lines = np.asarray(lines if lines is not None else np.empty((n, 3)), dtype=np.int32).reshape(n, 3)
+
+    def __len__(self):
+        return len(self.words)
+
+    @classmethod
+    def from_tsv(cls, tsv):
+        """Tesseract TSV metninden sonuç oluşturur (başlık satırı olsa da olmasa da)."""
+        words, boxes, conf, lines = [], [], [], []
+
+        for row in tsv.splitlines():
+            cols = row.split("\t")
+            if len(cols) < 12 or cols[0] == "level":
+                continue
+            if int(cols[0]) != WORD_LEVEL or not cols[11].strip():
+                continue
+
+            words.append(cols[11])
+            lines.append((int(cols[2]), int(cols[3]), int(cols[4])))
+            boxes.append((int(cols[6]), int(cols[7]), int(cols[8]), int(cols[9])))
+            conf.append(float(cols[10]))
+
+        return cls(words, boxes, conf, lines)
+
+    @classmethod
+    def concat(cls, results, offsets=None):
+        """Birden çok sonucu (ör. bölgeler) tek sonuçta birleştirir.
+
+        offsets verilirse her sonucun kutuları (dx, dy) kadar kaydırılır; blok numaraları
+        sonuçlar arasında çakışmayacak şekilde yeniden numaralandırılır.
+        """
+        offsets = offsets or [(0, 0)] * len(results)
+        words, boxes, conf, lines = [], [], [], []
+        block_base = 0
+
+        for result, (dx, dy) in zip(results, offsets):
+            if not len(result):
+                continue
+            words.extend(result.words)
+            boxes.append(result.boxes + np.array([dx, dy, 0, 0], dtype=np.int32))
+            conf.append(result.conf)
+
+            result_lines = result.lines.copy()
+            result_lines[:, 0] += block_base
+            block_base = int(result_lines[:, 0].max()) + 1
+            lines.append(result_lines)
+
+        if not words:
+            return cls()
+        return cls(words, np.concatenate(boxes), np.concatenate(conf), np.concatenate(lines))
+
+    @property
+    def text(self):
+        """Kelimeleri satır, paragraf ve bloklara göre düz metne dönüştürür."""
+        out = []
+        previous = None
+
+        for word, (block, par, line) in zip(self.words, self.lines.tolist()):
+            if previous is None:
+                pass
+            elif block != previous[0]:
+                out.append("\n\n")
+            elif par != previous[1] or line != previous[2]:
+                out.append("\n")
+            else:
+                out.append(" ")
+            out.append(word)
+            previous = (block, par, line)
+
+        return "".join(out)
+
+    @property
+    def mean_confidence(self):
+        """Kelimelerin ortalama güven değeri (kelime yoksa 0)."""
+        valid = self.conf[self.conf >= 0]
+        return float(valid.mean()) if len(valid) else 0.0
+
+    def low_confidence(self, threshold=60):
+        """Güven değeri eşiğin altındaki kelimelerin indekslerini döndürür."""
+        return np.flatnonzero((self.conf >= 0) & (self.conf < threshold))
+
+    def to_dict(self):
+        """Sütun tabanlı, JSON'a yazılabilir sözlük döndürür (önbellek için)."""
+        return {
+            "words": self.words,
+            "boxes": self.boxes.tolist(),
+            "conf": [round(c, 2) for c in self.conf.tolist()],
+            "lines": self.lines.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict() çıktısından sonuç oluşturur."""
+        return cls(data["words"], data["boxes"], data["conf"], data["lines"])
+
+    def to_json(self):
+        """Sonucu JSON metnine dönüştürür."""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text):
+        """JSON metninden sonuç oluşturur."""
+        return cls.from_dict(json.loads(text))
+
+    def to_records(self):
+        """Kelime başına bir sözlük içeren liste döndürür."""
+        return [
+            {"text": word, "x": x, "y": y, "w": w, "h": h, "conf": round(c, 2)}
+            for word, (x, y, w, h), c in zip(self.words, self.boxes.tolist(), self.conf.tolist())
+        ]
+
+class ParquetWordWriter:
+    """Kelimeleri sayfa sayfa Parquet dosyasına yazar (her sayfa ayrı satır grubu)."""
+
+    def __init__(self, path):
+        if pyarrow is None:
+            raise RuntimeError("Parquet çıktısı için pyarrow kurulmalıdır: pip install pyarrow")
+
+        self.schema = pyarrow.schema([
+            ("path", pyarrow.string()),
+            ("page", pyarrow.int32()),
+            ("word", pyarrow.string()),
+            ("x", pyarrow.int32()),
+            ("y", pyarrow.int32()),
+            ("w", pyarrow.int32()),
+            ("h", pyarrow.int32()),
+            ("conf", pyarrow.float32()),
+            ("block", pyarrow.int32()),
+            ("par", pyarrow.int32()),
+            ("line", pyarrow.int32()),
+        ])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def write(self, result, path="", page=0):
+        """Bir sayfanın kelimelerini yazar."""
+        n = len(result)
+        table = pyarrow.Table.from_arrays([
+            pyarrow.array([path] * n, pyarrow.string()),
+            pyarrow.array(np.full(n, page, dtype=np.int32)),
+            pyarrow.array(result.words, pyarrow.string()),
+            pyarrow.array(result.boxes[:, 0]),
+            pyarrow.array(result.boxes[:, 1]),
+            pyarrow.array(result.boxes[:, 2]),
+            pyarrow.array(result.boxes[:, 3]),
+            pyarrow.array(result.conf),
+            pyarrow.array(result.lines[:, 0]),
+            pyarrow.array(result.lines[:, 1]),
+            pyarrow.array(result.lines[:, 2]),
+        ], schema=self.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        """Dosyayı kapatır."""
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
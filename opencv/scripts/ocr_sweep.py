@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Ön İşleme Parametre Taraması
+----------------------------
+Hangi preprocess_image ayarının belge türlerimizde milisaniye başına en iyi doğruluğu
+verdiğini ölçer:
+- Yöntem, eşik değeri, bulanıklaştırma ve morfolojik işlem boyutu üzerinde ızgara taraması
+  (aynı aşamalara karşılık gelen kombinasyonlar bir kez çalıştırılır)
+- Belgeler ve kombinasyonlar işlemci çekirdeklerine dağıtılır
+- Her belgede ortak ara aşamalar (ör. gri dönüşüm) önbellekten (ocr_pipeline.StageCache)
+  yeniden kullanılır; aynı çıktıyı veren kombinasyonlar için OCR tekrar çalışmaz.
+  Süreler yine de her kombinasyonun tek başına çalışsaydı harcayacağı süre olarak raporlanır.
+- Doğru metne göre karakter hata oranı (CER) ve sayfa başına süre; Pareto tablosu ve CSV
+
+Belgeler ocr_benchmark.py'nin sentetik derleminden üretilir veya --corpus ile
+ocr_benchmark.py --save-corpus çıktısı (görüntüler + ground_truth.json) kullanılır.
+
+Kullanım:
+    python ocr_sweep.py --thresholds 100,127,150 --blurs 3,5,7 --morphs 3,5 -o tarama.csv
+    python ocr_sweep.py --corpus ../derlem --methods otsu,adaptive_threshold,bilateral_filter
+"""
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cv2
+import numpy as np
+
+import ocr_benchmark
+import ocr_core
+import ocr_pipeline
+import ocr_worker
+
+# Izgara parametreleri: yöntem_aşamaları parametre adı -> CLI/CSV sütun adı
+GRID_PARAMS = (("threshold_value", "threshold"), ("blur_size", "blur"), ("morph_size", "morph"))
+
+def relevant_params(method):
+    """Yöntemin aşamalarını gerçekten değiştiren parametre adlarını döndürür."""
+    base = {"threshold_value": 127, "blur_size": 5, "morph_size": 3}
+    stages = ocr_pipeline.method_stages(method, **base)
+
+    relevant = []
+    for name, _ in GRID_PARAMS:
+        changed = dict(base, **{name: base[name] + 2})
+        if ocr_pipeline.method_stages(method, **changed) != stages:
+            relevant.append(name)
+    return relevant
+
+def build_grid(methods, thresholds, blurs, morphs):
+    """Izgarayı oluşturur; aynı aşama listesine karşılık gelen kombinasyonları tekilleştirir."""
+    combos = OrderedDict()
+
+    # Çekirdek boyutları aşamalarda tek sayıya yuvarlanır; ızgarada da aynı değerler kullanılsın
+    blurs = list(OrderedDict.fromkeys(ocr_pipeline.make_odd(b) for b in blurs))
+    morphs = list(OrderedDict.fromkeys(ocr_pipeline.make_odd(m) for m in morphs))
+
+    for method in methods:
+        relevant = relevant_params(method)
+        values = {
+            "threshold_value": thresholds if "threshold_value" in relevant else [127],
+            "blur_size": blurs if "blur_size" in relevant else [5],
+            "morph_size": morphs if "morph_size" in relevant else [3],
+        }
+
+        for threshold, blur, morph in itertools.product(*values.values()):
+            params = {"threshold_value": threshold, "blur_size": blur, "morph_size": morph}
+            stages = ocr_pipeline.method_stages(method, **params)
+            key = json.dumps(stages, sort_keys=True)
+            if key in combos:
+                continue  # Aynı aşamalar zaten ızgarada
+
+            combo = {"method": method}
+            for name, column in GRID_PARAMS:
+                combo[column] = params[name] if name in relevant else None
+            combo["stages"] = stages
+            combos[key] = combo
+
+    return list(combos.values())
+
+def combo_label(combo):
+    """Kombinasyonu okunabilir bir etikete dönüştürür."""
+    parts = [combo["method"]]
+    for _, column in GRID_PARAMS:
+        if combo[column] is not None:
+            parts.append(f"{column}={combo[column]}")
+    return " ".join(parts)
+
+# İşçi süreç başına saklanan en fazla aşama süresi kaydı
+MAX_STAGE_TIMES = 4096
+
+# İşçi süreç başına durum: belge önbelleği ve aşama önbelleği
+_documents = OrderedDict()
+_stage_cache = None
+_stage_ms = OrderedDict()  # Aşama anahtarı -> ilk hesaplamada ölçülen süre (ms)
+_error_shown = False
+
+def load_document(doc):
+    """Belgeyi (görüntü, doğru metin, dil) olarak yükler; son belgeler süreçte saklanır."""
+    key = doc["id"]
+    if key in _documents:
+        _documents.move_to_end(key)
+        return _documents[key]
+
+    if "path" in doc:
+        image = cv2.imread(doc["path"])
+        if image is None:
+            raise ValueError(f"Görüntü okunamadı: {doc['path']}")
+        loaded = (image, doc["text"], doc["lang"])
+    else:
+        image, text = ocr_benchmark.make_document(doc["lang"], doc["size"], doc["font"], doc["noise"], doc["seed"])
+        loaded = (image, text, doc["lang"])
+
+    _documents[key] = loaded
+    while len(_documents) > 4:
+        _documents.popitem(last=False)
+    return loaded
+
+def run_stages(image, stages, cache):
+    """Aşamaları önbellekten yararlanarak çalıştırır.
+
+    (çıktı, ms) döndürür; ms, önbellek olmasaydı harcanacak süredir (her aşamanın
+    ilk hesaplandığında ölçülen süresinin toplamı).
+    """
+    token = cache.token(image)
+    current = image
+    total_ms = 0.0
+    signature = ()
+
+    for name, params in ocr_pipeline.Pipeline(stages).expanded(image):
+        signature = signature + ((name, tuple(sorted(params.items()))),)
+        key = (token, signature)
+
+        cached = cache.get(key)
+        if cached is not None and key in _stage_ms:
+            current = cached
+            _stage_ms.move_to_end(key)
+        else:
+            start_time = time.perf_counter()
+            output = ocr_pipeline.STAGES[name].fn(current, None, **params)
+            _stage_ms[key] = (time.perf_counter() - start_time) * 1000
+            # Süre kaydı sınırlı tutulur; silinen aşama gerekirse yeniden hesaplanıp ölçülür
+            while len(_stage_ms) > MAX_STAGE_TIMES:
+                _stage_ms.popitem(last=False)
+            if output is not current:
+                cache.put(key, output)
+            current = output
+
+        total_ms += _stage_ms[key]
+
+    return current, total_ms
+
+def evaluate(doc, combos):
+    """Bir belgede kombinasyonları çalıştırır (işçi süreçte).
+
+    Her kombinasyon için (sıra, cer, ön işleme ms, ocr ms) listesi döndürür.
+    """
+    global _stage_cache, _error_shown
+    if _stage_cache is None:
+        _stage_cache = ocr_pipeline.StageCache()
+
+    image, truth, lang = load_document(doc)
+    truth = ocr_benchmark.normalize_text(truth)
+    ocr_memo = {}  # Çıktı özeti -> (metin, ms): aynı çıktı için OCR tekrar çalışmaz
+
+    rows = []
+    for index, combo in combos:
+        processed, pre_ms = run_stages(image, combo["stages"], _stage_cache)
+
+        digest = hashlib.blake2b(np.ascontiguousarray(processed).tobytes(), digest_size=16).hexdigest()
+        if digest not in ocr_memo:
+            start_time = time.perf_counter()
+            try:
+                text = ocr_worker.recognize(processed, lang=lang)
+            except Exception as e:
+                text = ""
+                if not _error_shown:
+                    print(f"OCR hatası ({combo_label(combo)}): {e}")
+                    _error_shown = True
+            ocr_memo[digest] = (text, (time.perf_counter() - start_time) * 1000)
+
+        text, ocr_ms = ocr_memo[digest]
+        text = ocr_benchmark.normalize_text(text)
+        cer = ocr_benchmark.levenshtein(text, truth) / max(1, len(truth))
+        rows.append((index, cer, pre_ms, ocr_ms))
+
+    return rows
+
+def load_corpus_dir(path, lang="eng"):
+    """ocr_benchmark.py --save-corpus klasöründen belge listesi oluşturur.
+
+    Derlem birden fazla dil içerebilir; her sayfanın dili dosya adından okunur.
+    Adı bu biçime uymayan görüntüler için lang kullanılır.
+    """
+    with open(os.path.join(path, "ground_truth.json"), encoding="utf-8") as f:
+        truth = json.load(f)
+
+    docs = []
+    for i, (name, text) in enumerate(sorted(truth.items())):
+        spec = ocr_benchmark.parse_corpus_file_name(name)
+        docs.append({"id": i, "path": os.path.join(path, name), "text": text,
+                     "lang": spec["lang"] if spec else lang})
+    return docs
+
+def pareto_front(results):
+    """CER ve süre açısından başka bir kombinasyon tarafından geçilmeyen sonuçları işaretler."""
+    ordered = sorted(results, key=lambda r: (r["ms_per_page"], r["cer"]))
+    best_cer = float("inf")
+    for result in ordered:
+        # Daha hızlı olanların hepsinden daha düşük hata oranı varsa Pareto cephesindedir
+        result["pareto"] = result["cer"] < best_cer
+        best_cer = min(best_cer, result["cer"])
+    return [r for r in ordered if r["pareto"]]
+
+def run_sweep(docs, combos, workers=None):
+    """Belge x kombinasyon ızgarasını süreç havuzunda çalıştırır ve kombinasyon başına ortalar."""
+    workers = workers or os.cpu_count() or 1
+
+    # Görevler belge bazında gruplanır (ara aşamalar aynı süreçte paylaşılır);
+    # belge sayısı azsa kombinasyonlar çekirdekleri dolduracak şekilde bölünür
+    chunks = max(1, -(-workers * 2 // len(docs)))
+    indexed = list(enumerate(combos))
+    size = -(-len(indexed) // chunks)
+
+    totals = [{"cer": [], "pre_ms": [], "ocr_ms": []} for _ in combos]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(evaluate, doc, indexed[i:i + size])
+            for doc in docs for i in range(0, len(indexed), size)
+        ]
+        for done, future in enumerate(as_completed(futures), 1):
+            for index, cer, pre_ms, ocr_ms in future.result():
+                totals[index]["cer"].append(cer)
+                totals[index]["pre_ms"].append(pre_ms)
+                totals[index]["ocr_ms"].append(ocr_ms)
+            print(f"\r{done}/{len(futures)} görev", end="", flush=True)
+    print()
+
+    results = []
+    for combo, total in zip(combos, totals):
+        pre_ms, ocr_ms = float(np.mean(total["pre_ms"])), float(np.mean(total["ocr_ms"]))
+        result = {key: combo[key] for key in ("method",) + tuple(c for _, c in GRID_PARAMS)}
+        result.update({
+            "label": combo_label(combo),
+            "cer": round(float(np.mean(total["cer"])), 4),
+            "pre_ms": round(pre_ms, 2),
+            "ocr_ms": round(ocr_ms, 2),
+            "ms_per_page": round(pre_ms + ocr_ms, 2),
+        })
+        results.append(result)
+
+    pareto_front(results)
+    return results
+
+def write_csv(results, path):
+    """Tüm sonuçları CSV dosyasına yazar."""
+    columns = ["method", "threshold", "blur", "morph", "cer", "pre_ms", "ocr_ms", "ms_per_page", "pareto"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for result in sorted(results, key=lambda r: (r["cer"], r["ms_per_page"])):
+            writer.writerow(result)
+
+def print_pareto(results):
+    """Pareto cephesini hızlıdan yavaşa tablo olarak yazdırır."""
+    front = [r for r in results if r["pareto"]]
+    front.sort(key=lambda r: r["ms_per_page"])
+
+    print(f"\nPareto cephesi ({len(front)}/{len(results)} kombinasyon): CER - süre")
+    print(f"{'Kombinasyon':<36}{'CER':>8}{'ms/sayfa':>11}{'ön işleme':>11}{'OCR':>10}")
+    print("-" * 76)
+    for r in front:
+        print(f"{r['label']:<36}{r['cer']:>8.4f}{r['ms_per_page']:>11.1f}{r['pre_ms']:>11.2f}{r['ocr_ms']:>10.1f}")
+
+def split_list(value, cast=str):
+    """Virgülle ayrılmış argümanı listeye çevirir."""
+    return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Ön işleme parametre taraması (doğruluk - süre)")
+    parser.add_argument("--methods", default=",".join(ocr_core.PREPROCESS_METHODS), help="Yöntemler (virgülle)")
+    parser.add_argument("--thresholds", default="100,127,150", help="Eşik değerleri (virgülle)")
+    parser.add_argument("--blurs", default="3,5,7", help="Bulanıklaştırma boyutları (virgülle)")
+    parser.add_argument("--morphs", default="3,5", help="Morfolojik işlem boyutları (virgülle)")
+    parser.add_argument("--corpus", default=None,
+                        help="ocr_benchmark.py --save-corpus klasörü (verilmezse sentetik derlem üretilir)")
+    parser.add_argument("--lang", default="eng", help="--corpus için dili dosya adından okunamayan görüntülerin Tesseract dili")
+    parser.add_argument("--langs", default="eng", help="Sentetik derlem dilleri (virgülle)")
+    parser.add_argument("--sizes", default="small", help="Sentetik derlem sayfa boyutları (virgülle)")
+    parser.add_argument("--fonts", default="simplex,complex", help="Sentetik derlem yazı tipleri (virgülle)")
+    parser.add_argument("--noises", default="clean,gaussian,salt_pepper", help="Sentetik derlem gürültüleri (virgülle)")
+    parser.add_argument("--seed", type=int, default=0, help="Sentetik derlem tohumu")
+    parser.add_argument("--workers", type=int, default=None, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("-o", "--output", default="ocr_sweep.csv", help="CSV çıktı dosyası")
+    args = parser.parse_args()
+
+    print("Ön İşleme Parametre Taraması")
+    print("-" * 30)
+
+    if args.corpus:
+        docs = load_corpus_dir(args.corpus, args.lang)
+    else:
+        docs = ocr_benchmark.corpus_specs(
+            langs=split_list(args.langs), sizes=split_list(args.sizes), fonts=split_list(args.fonts),
+            noises=split_list(args.noises), seed=args.seed
+        )
+    if not docs:
+        print("Hata: Belge bulunamadı!")
+        return 1
+
+    combos = build_grid(split_list(args.methods), split_list(args.thresholds, int),
+                        split_list(args.blurs, int), split_list(args.morphs, int))
+    print(f"{len(docs)} belge x {len(combos)} kombinasyon")
+
+    results = run_sweep(docs, combos, args.workers)
+    write_csv(results, args.output)
+    print_pareto(results)
+    print(f"\nTüm sonuçlar: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Parçalı (Şerit) Ön İşleme
+-------------------------
+Çok büyük taramalarda (ör. 600 dpi A0 çizimler) tüm görüntü üzerinde çalışan filtreler
+her aşamada görüntü boyutunda yeni bir kopya oluşturur. Bu modül ön işleme hattını
+(ocr_pipeline.Pipeline) yatay şeritler halinde çalıştırır:
+- Her şerit, hattaki çekirdek boyutlarının toplamı kadar kenar payı (halo) ile okunur,
+  böylece birleştirilen sonuç tüm görüntüde çalışmakla aynıdır
+- Otsu gibi tüm görüntünün istatistiğine ihtiyaç duyan aşamalar için eşik değeri
+  önce şerit şerit toplanan histogramdan hesaplanır
+- Aynı anda bellekte tutulan şerit sayısı sınırlıdır; şeritler paralel işlenebilir
+  (OpenCV fonksiyonları çalışırken GIL'i bırakır)
+
+Girdi olarak np.memmap verilirse yalnızca işlenen şeritler belleğe okunur.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ocr_pipeline import STAGES
+
+# Varsayılan şerit yüksekliği (satır)
+DEFAULT_TILE_ROWS = 512
+
+def otsu_threshold(hist):
+    """256 kutulu histogramdan Otsu eşik değerini hesaplar (OpenCV ile aynı yöntem)."""
+    hist = np.asarray(hist, dtype=np.float64)
+    total = hist.sum()
+    if total == 0:
+        return 0
+
+    eps = np.finfo(np.float32).eps
+    mu = float((np.arange(256) * hist).sum() / total)
+    q1, mu1 = 0.0, 0.0
+    max_sigma, max_val = 0.0, 0
+
+    for i in range(256):
+        p_i = hist[i] / total
+        mu1 *= q1
+        q1 += p_i
+        q2 = 1.0 - q1
+
+        if min(q1, q2) < eps or max(q1, q2) > 1.0 - eps:
+            continue
+
+        mu1 = (mu1 + i * p_i) / q1
+        mu2 = (mu - q1 * mu1) / q2
+        sigma = q1 * q2 * (mu1 - mu2) ** 2
+        if sigma > max_sigma:
+            max_sigma = sigma
+            max_val = i
+
+    return max_val
+
+def stages_halo(stages):
+    """Aşama listesinin toplam kenar payını (satır) döndürür."""
+    return sum(STAGES[name].halo(params) for name, params in stages)
+
+def _run_stages(image, stages):
+    """Aşamaları sırayla uygular."""
+    current = image
+    for name, params in stages:
+        current = STAGES[name].fn(current, None, **params)
+    return current
+
+def _process_strip(image, stages, y0, y1, halo):
+    """[y0, y1) satırlarını kenar payıyla okuyup işler ve payı kırpar."""
+    height = image.shape[0]
+    a0, a1 = max(0, y0 - halo), min(height, y1 + halo)
+
+    # memmap'ten yalnızca bu şerit okunur
+    strip = np.ascontiguousarray(image[a0:a1])
+    result = _run_stages(strip, stages)
+    return result[y0 - a0:y1 - a0]
+
+def _map_strips(image, stages, tile_rows, workers, max_pending):
+    """Şeritleri paralel işler ve (y0, sonuç) çiftlerini sırayla döndürür."""
+    height = image.shape[0]
+    halo = stages_halo(stages)
+    bounds = [(y0, min(height, y0 + tile_rows)) for y0 in range(0, height, tile_rows)]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        next_index = 0
+
+        while next_index < len(bounds) or pending:
+            # Bellekte tutulan şerit sayısını sınırla
+            while next_index < len(bounds) and len(pending) < max_pending:
+                y0, y1 = bounds[next_index]
+                pending.append((y0, executor.submit(_process_strip, image, stages, y0, y1, halo)))
+                next_index += 1
+
+            y0, future = pending.pop(0)
+            yield y0, future.result()
+
+def resolve_stages(pipeline, image, tile_rows=DEFAULT_TILE_ROWS, workers=None, max_pending=None):
+    """Hattı parçalı çalışmaya uygun yerel aşamalara çevirir.
+
+    Otsu gibi global aşamalar, önceki aşamaların çıktısından şerit şerit toplanan
+    histogramla hesaplanan sabit eşikli 'threshold' aşamasıyla değiştirilir.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+
+    resolved = []
+    for name, params in pipeline.expanded(image):
+        if not STAGES[name].global_stats:
+            resolved.append((name, params))
+            continue
+
+        hist = np.zeros(256, dtype=np.int64)
+        for _, tile in _map_strips(image, list(resolved), tile_rows, workers, max_pending):
+            hist += np.bincount(tile.ravel(), minlength=256)[:256]
+
+        resolved.append(("threshold", {"thresh": otsu_threshold(hist)}))
+
+    return resolved
+
+def iter_tiled(pipeline, image, tile_rows=DEFAULT_TILE_ROWS, workers=None, max_pending=None):
+    """Hattı şeritler halinde çalıştırır ve (y0, şerit sonucu) çiftlerini sırayla üretir."""
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+
+    stages = resolve_stages(pipeline, image, tile_rows, workers, max_pending)
+    yield from _map_strips(image, stages, tile_rows, workers, max_pending)
+
+def run_tiled(pipeline, image, tile_rows=DEFAULT_TILE_ROWS, workers=None, max_pending=None, out=None):
+    """Hattı şeritler halinde çalıştırıp sonucu tek görüntüde birleştirir.
+
+    out olarak np.memmap verilirse sonuç da diske yazılır.
+    """
+    for y0, tile in iter_tiled(pipeline, image, tile_rows, workers, max_pending):
+        if out is None:
+            out = np.empty((image.shape[0],) + tile.shape[1:], dtype=tile.dtype)
+        out[y0:y0 + tile.shape[0]] = tile
+
+    return out
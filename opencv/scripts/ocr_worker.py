@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Kalıcı Tesseract İşçileri
+-------------------------
+pytesseract her çağrıda yeni bir `tesseract` süreci başlatır ve dil verisini
+(traineddata) yeniden yükler. Küçük görüntülerde gecikmenin büyük kısmı budur.
+Bu modül şunları sağlar:
+- Dil başına yüklenip süreç boyunca açık tutulan, iş parçacıklarının ödünç alıp geri verdiği
+  Tesseract motorları (tesserocr kuruluysa Tesseract C API'si, değilse pytesseract)
+- Görüntüleri pipe üzerinden alan uzun ömürlü işçi süreç havuzu (OCRWorkerPool)
+"""
+
+import contextlib
+import multiprocessing
+import os
+import queue
+import shlex
+import threading
+
+import cv2
+import numpy as np
+
+import ocr_core
+from ocr_result import OCRResult
+
+try:
+    import tesserocr
+except ImportError:
+    # tesserocr kurulu değilse pytesseract (süreç başına çağrı) kullanılır
+    tesserocr = None
+
+# Tesseract motorunun süreç boyunca açık tutulup tutulamayacağı
+HAS_PERSISTENT_ENGINE = tesserocr is not None
+
+def parse_config(config):
+    """Tesseract komut satırı parametrelerini (--psm, --oem, -c) ayrıştırır."""
+    psm, oem, variables = None, None, {}
+    tokens = shlex.split(config or "")
+    i = 0
+
+    while i < len(tokens):
+        token = tokens[i]
+        if token == "--psm" and i + 1 < len(tokens):
+            psm = int(tokens[i + 1])
+            i += 1
+        elif token == "--oem" and i + 1 < len(tokens):
+            oem = int(tokens[i + 1])
+            i += 1
+        elif token == "-c" and i + 1 < len(tokens):
+            name, _, value = tokens[i + 1].partition("=")
+            variables[name] = value
+            i += 1
+        i += 1
+
+    return psm, oem, variables
+
+class TesseractEngine:
+    """Tek bir dil ve yapılandırma için yüklü tutulan Tesseract motoru."""
+
+    def __init__(self, lang="eng", config=""):
+        self.lang = lang
+        self.config = config
+        self.api = None
+
+        if tesserocr is not None:
+            psm, oem, variables = parse_config(config)
+            kwargs = {"lang": lang}
+            if psm is not None:
+                kwargs["psm"] = psm
+            if oem is not None:
+                kwargs["oem"] = oem
+
+            # Dil verisi burada bir kez yüklenir
+            self.api = tesserocr.PyTessBaseAPI(**kwargs)
+            for name, value in variables.items():
+                self.api.SetVariable(name, value)
+
+    def _set_image(self, image):
+        """Görüntüyü PIL'e dönüştürmeden doğrudan bellekten Tesseract'a verir."""
+        if len(image.shape) == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        image = np.ascontiguousarray(image)
+
+        height, width = image.shape[:2]
+        channels = 1 if len(image.shape) == 2 else image.shape[2]
+        self.api.SetImageBytes(image.tobytes(), width, height, channels, width * channels)
+
+    def recognize(self, image):
+        """Görüntüdeki metni döndürür."""
+        if self.api is None:
+            return ocr_core.image_to_text(image, lang=self.lang, config=self.config)
+
+        self._set_image(image)
+        return self.api.GetUTF8Text()
+
+    def recognize_data(self, image):
+        """Kelime kutuları ve güven değerleriyle birlikte sonucu (OCRResult) döndürür."""
+        if self.api is None:
+            tsv = ocr_core.image_to_data(image, lang=self.lang, config=self.config)
+        else:
+            self._set_image(image)
+            tsv = self.api.GetTSVText(0)
+        return OCRResult.from_tsv(tsv)
+
+    def close(self):
+        """Motorun kaynaklarını serbest bırakır."""
+        if self.api is not None:
+            self.api.End()
+            self.api = None
+
+# Süreç başına motor havuzu: (dil, yapılandırma) -> boştaki TesseractEngine listesi.
+# Bir Tesseract motoru aynı anda tek görüntü işleyebildiği için her çağrı havuzdan bir motor
+# alır ve işi bitince geri verir. Motorlar iş parçacıklarına bağlı değildir: her sayfada yeni
+# iş parçacıkları açılsa da dil verisi yeniden yüklenmez. Havuzda en fazla MAX_IDLE_ENGINES
+# boş motor tutulur; fazlası geri verilirken kapatılır.
+MAX_IDLE_ENGINES = os.cpu_count() or 1
+
+_idle_engines = {}
+_engines_lock = threading.Lock()
+
+def acquire_engine(lang="eng", config=""):
+    """Havuzdan boştaki motoru alır, yoksa yenisini oluşturur."""
+    with _engines_lock:
+        idle = _idle_engines.get((lang, config))
+        if idle:
+            return idle.pop()
+    # Dil verisinin yüklenmesi kilit dışında yapılır
+    return TesseractEngine(lang, config)
+
+def release_engine(engine):
+    """Motoru havuza geri verir (havuz doluysa kapatır)."""
+    with _engines_lock:
+        idle = _idle_engines.setdefault((engine.lang, engine.config), [])
+        if len(idle) < MAX_IDLE_ENGINES:
+            idle.append(engine)
+            return
+    engine.close()
+
+@contextlib.contextmanager
+def checkout_engine(lang="eng", config=""):
+    """with bloğu boyunca havuzdan bir motor kullanır."""
+    engine = acquire_engine(lang, config)
+    try:
+        yield engine
+    finally:
+        release_engine(engine)
+
+def recognize(image, lang="eng", config=""):
+    """Kalıcı motorla OCR uygular."""
+    with checkout_engine(lang, config) as engine:
+        return engine.recognize(image)
+
+def recognize_data(image, lang="eng", config=""):
+    """Kalıcı motorla OCR uygular ve kelime düzeyinde sonucu (OCRResult) döndürür."""
+    with checkout_engine(lang, config) as engine:
+        return engine.recognize_data(image)
+
+def close_engines():
+    """Havuzdaki boş motorları kapatır (kullanımdaki motorlar geri verilince havuza döner)."""
+    with _engines_lock:
+        engines = [engine for idle in _idle_engines.values() for engine in idle]
+        _idle_engines.clear()
+    for engine in engines:
+        engine.close()
+
+def _worker_loop(conn, preload):
+    """İşçi sürecin ana döngüsü: pipe'tan görüntü alır, metni geri gönderir."""
+    # Sık kullanılan dilleri ilk istekten önce yükle
+    for lang in preload:
+        release_engine(acquire_engine(lang))
+
+    try:
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+
+            mode, image, lang, config = message
+            fn = recognize_data if mode == "data" else recognize
+            try:
+                conn.send((True, fn(image, lang, config)))
+            except Exception as e:
+                conn.send((False, str(e)))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        close_engines()
+        conn.close()
+
+class OCRWorkerPool:
+    """Tesseract motorlarını açık tutan uzun ömürlü işçi süreç havuzu."""
+
+    def __init__(self, workers=1, preload=("eng",)):
+        # Tkinter gibi iş parçacıklı süreçlerden güvenli başlatmak için 'spawn' kullan
+        context = multiprocessing.get_context("spawn")
+
+        self._processes = []
+        self._idle = queue.Queue()
+
+        for _ in range(max(1, workers)):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_worker_loop, args=(child_conn, tuple(preload)), daemon=True)
+            process.start()
+            child_conn.close()
+
+            self._processes.append((process, parent_conn))
+            self._idle.put(parent_conn)
+
+    def recognize(self, image, lang="eng", config=""):
+        """Boştaki bir işçiye görüntüyü gönderir ve metni döndürür (iş parçacığı güvenli)."""
+        return self._request("text", image, lang, config)
+
+    def recognize_data(self, image, lang="eng", config=""):
+        """Boştaki bir işçiye görüntüyü gönderir ve OCRResult döndürür (iş parçacığı güvenli)."""
+        return self._request("data", image, lang, config)
+
+    def _request(self, mode, image, lang, config):
+        """İsteği boştaki işçiye gönderir ve cevabı bekler."""
+        conn = self._idle.get()
+        try:
+            conn.send((mode, np.ascontiguousarray(image), lang, config))
+            ok, result = conn.recv()
+        finally:
+            self._idle.put(conn)
+
+        if not ok:
+            raise RuntimeError(result)
+        return result
+
+    def close(self):
+        """İşçi süreçleri kapatır."""
+        for process, conn in self._processes:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+
+        for process, conn in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+            conn.close()
+
+        self._processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()